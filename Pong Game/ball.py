@@ -7,7 +7,8 @@ The `Ball` class manages the behavior of the ball in the game, including movemen
 Key Features:
 -------------
 1. **Ball Movement**:
-   - The ball moves across the screen, updating its position based on its current speed and direction.
+   - The ball moves across the screen, updating its position based on its velocity and the time that passed.
+   - The velocity is in pixels per second, so the ball moves at the same speed on every machine.
 
 2. **Bouncing**:
    - The ball bounces off the top and bottom walls by reversing its y-direction.
@@ -23,9 +24,11 @@ Key Features:
 Constants:
 ----------
 - **CENTER**: The ball's respawn location, defined as the center of the screen (0, 0).
+- **RADIUS**: The radius of the ball's circle shape, in pixels.
+- **BALL_VELOCITY**: The ball's horizontal and vertical velocity at the starting speed, in pixels per second.
 - **SPEED_FACTOR**: The factor by which the ball's speed increases after a paddle bounce.
-- **SPEED_LIMIT**: The maximum speed the ball can reach.
-- **DEFAULT_SPEED**: The starting speed of the ball.
+- **SPEED_LIMIT**: The maximum speed the ball can reach, as a multiple of the starting speed.
+- **DEFAULT_SPEED**: The starting speed of the ball, as a multiple of `BALL_VELOCITY`.
 
 Classes:
 --------
@@ -34,7 +37,7 @@ Classes:
 
 Usage:
 ------
-- The `move()` method updates the ball's position on the screen.
+- The `move(dt)` method moves the ball by its velocity times the time step.
 - The `wall_bounce()` method reverses the ball's y-direction when it hits the top or bottom walls.
 - The `paddle_bounce()` method reverses the x-direction and increases the ball's speed when it hits a paddle.
 - The `respawn_ball()` method resets the ball to the center and resets its speed.
@@ -43,9 +46,11 @@ Usage:
 from turtle import Turtle
 
 CENTER = (0, 0)
+RADIUS = 10
+BALL_VELOCITY = 300 # px/s, the old loop moved the ball 1 px per frame at a few hundred frames per second
 SPEED_FACTOR = 1.1
-SPEED_LIMIT = 0.035
-DEFAULT_SPEED = 0.01
+SPEED_LIMIT = 3.5
+DEFAULT_SPEED = 1.0
 
 class Ball(Turtle):
     """
@@ -54,11 +59,11 @@ class Ball(Turtle):
     Attributes:
     -----------
     x_move : int
-        The ball's horizontal movement speed and direction (positive for right, negative for left).
+        The ball's horizontal velocity in pixels per second at the starting speed (positive for right, negative for left).
     y_move : int
-        The ball's vertical movement speed and direction (positive for up, negative for down).
+        The ball's vertical velocity in pixels per second at the starting speed (positive for up, negative for down).
     ball_speed : float
-        The current speed of the ball, starting at a default value and increasing after paddle bounces.
+        The current speed multiplier of the ball, starting at 1 and increasing after paddle bounces.
     """
 
     def __init__(self):
@@ -67,15 +72,22 @@ class Ball(Turtle):
         self.shape("circle")
         self.penup()
         self.speed("fastest")
-        self.x_move = 100
-        self.y_move = 100
-        self.ball_speed = 0.01
+        self.x_move = BALL_VELOCITY
+        self.y_move = BALL_VELOCITY
+        self.ball_speed = DEFAULT_SPEED
+
 
+    def move(self, dt):
+        """
+        Moves the ball by its velocity over a time step.
 
-    def move(self):
-        """Moves the ball by updating its position based on the current speed and direction."""
-        new_x = self.xcor() + self.x_move * self.ball_speed
-        new_y = self.ycor() + self.y_move * self.ball_speed
+        Parameters:
+        -----------
+        dt : float
+            The time step, in seconds.
+        """
+        new_x = self.xcor() + self.x_move * self.ball_speed * dt
+        new_y = self.ycor() + self.y_move * self.ball_speed * dt
         self.goto(x=new_x, y=new_y)
 
     def wall_bounce(self):
@@ -106,4 +118,4 @@ class Ball(Turtle):
         """
         self.goto(CENTER)
         self.reset_speed()
-        self.reverse_x()
\ No newline at end of file
+        self.reverse_x()
@@ -0,0 +1,401 @@
+"""
+Pong Game Batch Simulator
+
+This script defines a `BatchPong` class that plays N Pong matches at once with NumPy arrays, and a `BatchComputer` class
+that moves one side's paddles of all the matches like the `Computer` player.
+The Turtle objects of the game hold one ball and one paddle each and move one at a time, which is far too slow to play
+the thousands of matches it takes to tune the computer. `BatchPong` keeps the positions, the velocities, the speed multipliers,
+the paddles and the scores of all the matches in arrays, and a single `step()` moves every match by one physics step.
+The rules are the same as `Match.step()`, with the same floating-point operations in the same order, so a match of the batch
+ends with the same score after the same number of steps as the same match played with the Turtle objects.
+
+Key Features:
+-------------
+1. **Vectorized Step**:
+   - The swept collisions with the walls and the paddles, the bounces, the points, the respawns and the end of the matches
+     are applied to all the matches with array operations, without a Python loop over the matches.
+   - A bounce of any match within a step is resolved in the same pass as the others, up to `MAX_BOUNCES` passes.
+
+2. **Computer Players**:
+   - `BatchComputer` predicts the ball of every match with the folded-walls intercept of `Computer`, and its reaction delay,
+     prediction noise and maximum speed can be different for every match, so many settings are tried in one batch.
+   - The prediction errors of every match are drawn from its own `random.Random`, with the same calls as `Computer`,
+     so a noisy match of the batch plays like a `Computer` given the same seed.
+
+3. **Finished Matches**:
+   - A match stops moving once a player has won, and `over` tells which matches are finished.
+
+Constants:
+----------
+- **LEFT** and **RIGHT**: The indexes of the left and right paddles in `paddle_y`.
+- **PADDLE_X**: The x-coordinates of the left and right paddles.
+
+Classes:
+--------
+1. **BatchPong**:
+   - Holds N matches as arrays and moves all of them by one physics step at a time.
+2. **BatchComputer**:
+   - Moves the left or right paddles of a `BatchPong` toward the predicted height of the ball.
+
+Usage:
+------
+- `BatchPong(n)` creates N matches, `move_paddle(side, target, max_speed)` moves the paddles of one side
+  and `step()` moves the balls and returns the points scored.
+- `BatchComputer(batch, side, difficulty)` is updated with `update()` before every step.
+- NumPy is required.
+"""
+
+import random
+
+import numpy as np
+
+from ball import RADIUS, BALL_VELOCITY, SPEED_FACTOR, SPEED_LIMIT, DEFAULT_SPEED
+from paddle import HALF_WIDTH, HALF_HEIGHT, LIMIT
+from scoreboard import MAX_SCORE
+from match import PHYSICS_STEP, WALL_TOP, WALL_BOTTOM, OUT_X, MAX_BOUNCES
+from computer import DIFFICULTIES
+
+# Constants
+LEFT = 0
+RIGHT = 1
+PADDLE_X = (-350, 350)
+
+
+def sweep_boxes(x, y, vx, vy, box, limit):
+    """
+    Finds when moving points enter boxes, with the slab test of `match.sweep_box` applied to arrays.
+
+    Parameters:
+    -----------
+    x, y : np.ndarray
+        The positions of the points.
+    vx, vy : np.ndarray
+        The velocities of the points.
+    box : tuple
+        The left, right, bottom and top of the boxes, numbers or arrays.
+    limit : np.ndarray
+        The end of the time range to search for every point.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The time every point enters its box (infinity if it does not enter it within its time range)
+        and whether it enters through the top or bottom of the box.
+    """
+    left, right, bottom, top = box
+    enter = np.full(x.shape, -np.inf)
+    leave = np.full(x.shape, np.inf)
+    edge = np.zeros(x.shape, dtype=bool)
+    hit = np.ones(x.shape, dtype=bool)
+    for position, velocity, low, high, is_edge in ((x, vx, left, right, False), (y, vy, bottom, top, True)):
+        still = velocity == 0
+        # a point that does not move along an axis only enters the box if it is already between the box's sides on that axis
+        hit &= ~still | ((low < position) & (position < high))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            near = (low - position) / velocity
+            far = (high - position) / velocity
+        near, far = np.minimum(near, far), np.maximum(near, far)
+        later = ~still & (near > enter)
+        enter = np.where(later, near, enter)
+        edge = np.where(later, is_edge, edge)
+        leave = np.where(still, leave, np.minimum(leave, far))
+    hit &= (enter <= leave) & (enter >= 0) & (enter <= limit)
+    return np.where(hit, enter, np.inf), edge
+
+
+def intercepts(x, y, vx, vy, target_x):
+    """
+    Finds the heights at which the balls reach an x-coordinate, like `computer.intercept` for arrays.
+
+    Parameters:
+    -----------
+    x, y : np.ndarray
+        The positions of the balls.
+    vx, vy : np.ndarray
+        The velocities of the balls, none of them zero along x.
+    target_x : float
+        The x-coordinate the balls are moving toward.
+
+    Returns:
+    --------
+    np.ndarray
+        The y-coordinate of every ball's center when it reaches target_x.
+    """
+    flight = np.maximum(0.0, (target_x - x) / vx)
+    height = WALL_TOP - WALL_BOTTOM
+    offset = np.mod(y + vy * flight - WALL_BOTTOM, 2 * height)
+    offset = np.where(offset > height, 2 * height - offset, offset)
+    return WALL_BOTTOM + offset
+
+
+class BatchPong:
+    """
+    A class to play N Pong matches at once.
+
+    Attributes:
+    -----------
+    ball_x, ball_y : np.ndarray
+        The position of the ball of every match.
+    x_move, y_move : np.ndarray
+        The velocity of the ball of every match at the starting speed, in pixels per second, like `Ball.x_move` and `Ball.y_move`.
+    ball_speed : np.ndarray
+        The speed multiplier of the ball of every match.
+    paddle_y : np.ndarray
+        The height of the left and right paddles of every match, with a row per side.
+    l_score, r_score : np.ndarray
+        The scores of the left and right players of every match.
+    steps : np.ndarray
+        The number of steps every match has run.
+    over : np.ndarray
+        True for the matches a player has won.
+    """
+
+    def __init__(self, n, physics_step=PHYSICS_STEP):
+        """
+        Initializes the BatchPong object with N new matches.
+
+        Parameters:
+        -----------
+        n : int
+            The number of matches.
+        physics_step : float, optional
+            The time of one step, in seconds.
+        """
+        self.n = n
+        self.physics_step = physics_step
+        self.ball_x = np.zeros(n)
+        self.ball_y = np.zeros(n)
+        self.x_move = np.full(n, float(BALL_VELOCITY))
+        self.y_move = np.full(n, float(BALL_VELOCITY))
+        self.ball_speed = np.full(n, DEFAULT_SPEED)
+        self.paddle_y = np.zeros((2, n))
+        self.l_score = np.zeros(n, dtype=np.int32)
+        self.r_score = np.zeros(n, dtype=np.int32)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.over = np.zeros(n, dtype=bool)
+
+
+    def move_paddle(self, side, target, max_speed):
+        """
+        Moves the paddles of one side toward a height over one step, like `Paddle.move_to`. The finished matches do not move.
+
+        Parameters:
+        -----------
+        side : int
+            LEFT or RIGHT.
+        target : np.ndarray or float
+            The height every paddle moves toward.
+        max_speed : np.ndarray or float
+            The highest speed of every paddle, in pixels per second.
+        """
+        paddle_y = self.paddle_y[side]
+        target = np.clip(target, -LIMIT, LIMIT)
+        reach = max_speed * self.physics_step
+        moved = paddle_y + np.clip(target - paddle_y, -reach, reach)
+        self.paddle_y[side] = np.where(self.over, paddle_y, moved)
+
+
+    def first_hits(self, moving, remaining):
+        """
+        Finds the first wall or paddle the ball of every moving match hits within the time left of the step.
+
+        Parameters:
+        -----------
+        moving : np.ndarray
+            True for the matches whose ball is still looked at.
+        remaining : np.ndarray
+            The time left of the step of every match, in seconds.
+
+        Returns:
+        --------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Which balls hit something, the time of every impact, and which hits were on the front of a paddle.
+        """
+        x, y = self.ball_x, self.ball_y
+        vx = self.x_move * self.ball_speed
+        vy = self.y_move * self.ball_speed
+
+        # Collision with wall, a ball that is already past a wall bounces right away
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wall = np.where(vy > 0, np.maximum(0.0, (WALL_TOP - y) / vy),
+                            np.where(vy < 0, np.maximum(0.0, (WALL_BOTTOM - y) / vy), np.inf))
+        wall = np.where(wall <= remaining, wall, np.inf)
+
+        # Collision with paddle, the ball's center against the paddle's box grown by the ball's radius
+        paddles = []
+        for side in (LEFT, RIGHT):
+            paddle_x, paddle_y = PADDLE_X[side], self.paddle_y[side]
+            box = (paddle_x - HALF_WIDTH - RADIUS, paddle_x + HALF_WIDTH + RADIUS,
+                   paddle_y - HALF_HEIGHT - RADIUS, paddle_y + HALF_HEIGHT + RADIUS)
+            paddles.append(sweep_boxes(x, y, vx, vy, box, remaining))
+        (left, left_edge), (right, right_edge) = paddles
+
+        impact = np.minimum(wall, np.minimum(left, right))
+        hit = moving & np.isfinite(impact)
+        # on a tie the scalar game takes the smallest of (time, surface), and "edge" < "face" < "wall"
+        edge = ((left == impact) & left_edge) | ((right == impact) & right_edge)
+        face = ~edge & (((left == impact) & ~left_edge) | ((right == impact) & ~right_edge))
+        return hit, impact, face
+
+
+    def step(self):
+        """
+        Runs one step of every match that is not over: moves the ball through its bounces, then handles the points and the end of the match.
+
+        Returns:
+        --------
+        tuple[np.ndarray, np.ndarray]
+            (left_points, right_points), True for the matches in which the left or the right player scored on this step.
+        """
+        active = ~self.over
+        self.steps += active
+
+        # A paddle that moved onto the ball hits it before the ball moves
+        self.push_out(active)
+
+        # Collisions with the walls and the paddles, resolved in the order they happen within the step
+        remaining = np.where(active, self.physics_step, 0.0)
+        moving = active.copy()
+        for _ in range(MAX_BOUNCES):
+            hit, impact, face = self.first_hits(moving, remaining)
+            if not hit.any():
+                break
+            impact = np.where(hit, impact, 0.0)
+            self.ball_x = np.where(hit, self.ball_x + self.x_move * self.ball_speed * impact, self.ball_x)
+            self.ball_y = np.where(hit, self.ball_y + self.y_move * self.ball_speed * impact, self.ball_y)
+            remaining = remaining - impact
+            paddle_bounce = hit & face
+            self.x_move = np.where(paddle_bounce, -self.x_move, self.x_move)
+            faster = paddle_bounce & (self.ball_speed < SPEED_LIMIT)
+            self.ball_speed = np.where(faster, self.ball_speed * SPEED_FACTOR, self.ball_speed)
+            self.y_move = np.where(hit & ~face, -self.y_move, self.y_move)
+            moving = hit
+        self.ball_x = np.where(active, self.ball_x + self.x_move * self.ball_speed * remaining, self.ball_x)
+        self.ball_y = np.where(active, self.ball_y + self.y_move * self.ball_speed * remaining, self.ball_y)
+
+        # The ball was missed by one of the paddles
+        # Left player point
+        left_points = active & (self.ball_x > OUT_X)
+        self.l_score += left_points
+        self.respawn(left_points)
+
+        # Right player point
+        right_points = active & (self.ball_x < -OUT_X)
+        self.r_score += right_points
+        self.respawn(right_points)
+
+        self.over |= (self.l_score == MAX_SCORE) | (self.r_score == MAX_SCORE)
+        return left_points, right_points
+
+
+    def push_out(self, active):
+        """
+        Bounces the balls off the paddles they are inside of and puts them back in front of the paddles, like `Match.push_out`.
+
+        Parameters:
+        -----------
+        active : np.ndarray
+            True for the matches that are not over.
+        """
+        for side in (LEFT, RIGHT):
+            paddle_x, paddle_y = PADDLE_X[side], self.paddle_y[side]
+            box = (paddle_x - HALF_WIDTH - RADIUS, paddle_x + HALF_WIDTH + RADIUS,
+                   paddle_y - HALF_HEIGHT - RADIUS, paddle_y + HALF_HEIGHT + RADIUS)
+            direction = 1 if paddle_x > 0 else -1 # the direction from the front of the paddles to their back
+            inside = (active & (box[0] < self.ball_x) & (self.ball_x < box[1]) & (box[2] < self.ball_y) & (self.ball_y < box[3])
+                      & (self.x_move * direction > 0))
+            if inside.any():
+                self.ball_x = np.where(inside, box[0] if direction > 0 else box[1], self.ball_x)
+                self.x_move = np.where(inside, -self.x_move, self.x_move)
+                faster = inside & (self.ball_speed < SPEED_LIMIT)
+                self.ball_speed = np.where(faster, self.ball_speed * SPEED_FACTOR, self.ball_speed)
+
+
+    def respawn(self, matches):
+        """
+        Respawns the balls of some matches at the center, like `Ball.respawn_ball`.
+
+        Parameters:
+        -----------
+        matches : np.ndarray
+            True for the matches whose ball respawns.
+        """
+        self.ball_x[matches] = 0.0
+        self.ball_y[matches] = 0.0
+        self.ball_speed[matches] = DEFAULT_SPEED
+        self.x_move[matches] = -self.x_move[matches]
+
+
+class BatchComputer:
+    """
+    A class to move one side's paddles of a `BatchPong` like the `Computer` player.
+
+    Attributes:
+    -----------
+    reaction, noise, max_speed : np.ndarray
+        The reaction delay in seconds, the prediction noise in pixels and the highest paddle speed in pixels per second of every match.
+    rngs : list[random.Random]
+        The random generator of the prediction errors of every match.
+    target : np.ndarray
+        The height every paddle is moving toward.
+    """
+
+    def __init__(self, batch, side, difficulty=2, seed=0, **settings):
+        """
+        Initializes the BatchComputer object.
+
+        Parameters:
+        -----------
+        batch : BatchPong
+            The matches to play.
+        side : int
+            LEFT or RIGHT, the paddles the computer moves.
+        difficulty : int, optional
+            The difficulty of the menu whose settings are used, a key of DIFFICULTIES.
+        seed : int or sequence of int, optional
+            The seed of the prediction errors of every match, or of the first match, the next matches taking the next seeds.
+            The match with a seed draws the same errors as a `Computer` with that seed.
+        settings : np.ndarray or float, optional
+            A reaction, noise or max_speed that replaces the one of the difficulty, for every match or one per match.
+        """
+        settings = {**DIFFICULTIES[difficulty], **settings}
+        self.batch = batch
+        self.side = side
+        self.reaction = np.broadcast_to(np.asarray(settings["reaction"], dtype=float), (batch.n,))
+        self.noise = np.broadcast_to(np.asarray(settings["noise"], dtype=float), (batch.n,))
+        self.max_speed = np.broadcast_to(np.asarray(settings["max_speed"], dtype=float), (batch.n,))
+        seeds = range(seed, seed + batch.n) if np.ndim(seed) == 0 else seed
+        self.rngs = [random.Random(match_seed) for match_seed in seeds]
+        self.direction = 1 if PADDLE_X[side] > 0 else -1 # the direction the ball moves in when it comes toward the paddles
+        self.face_x = PADDLE_X[side] - self.direction * (HALF_WIDTH + RADIUS)
+        self.target = np.zeros(batch.n)
+        self.approaching = np.zeros(batch.n, dtype=bool)
+        self.delay = np.zeros(batch.n)
+        self.error = np.zeros(batch.n)
+
+
+    def update(self):
+        """Predicts where the ball of every match will reach the paddle and moves the paddles toward it, like `Computer.update`."""
+        batch = self.batch
+        dt = batch.physics_step
+        vx = batch.x_move * batch.ball_speed
+        coming = vx * self.direction > 0
+
+        # a new shot: it is noticed after the reaction delay, and misjudged by an error that stays until the next one
+        new = coming & ~self.approaching
+        self.delay = np.where(new, self.reaction, self.delay)
+        # a few matches start a shot on a step, so their errors are drawn one by one, like `Computer.update` does
+        for match in np.flatnonzero(new):
+            self.error[match] = self.rngs[match].gauss(0, self.noise[match])
+        self.approaching = coming
+
+        waiting = coming & (self.delay > 0)
+        self.delay = np.where(waiting, self.delay - dt, self.delay)
+        aiming = coming & ~waiting
+        if aiming.any():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                predicted = intercepts(batch.ball_x, batch.ball_y, vx, batch.y_move * batch.ball_speed, self.face_x)
+            self.target = np.where(aiming, predicted + self.error, self.target)
+        # the ball is moving away, the paddle goes back to the middle to wait for the next shot
+        self.target = np.where(coming, self.target, 0.0)
+        batch.move_paddle(self.side, self.target, self.max_speed)
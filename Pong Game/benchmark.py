@@ -0,0 +1,379 @@
+"""
+Pong Game Benchmarks
+
+This script measures the speed of the Pong game's building blocks, so changes to them can be compared before and after.
+Each benchmark is a function that prints its results, and the benchmarks to run are chosen by name on the command line.
+The benchmarks open a Turtle screen, like the game.
+
+Key Features:
+-------------
+1. **pacing**:
+   - Runs the match in a busy `while` loop (the old game loop) and then with a `FramePacer`, for a few seconds each,
+     and prints the frame rate, the CPU time used per second of play and the physics steps per second of both.
+
+2. **stress**:
+   - Fires balls from the middle of the court at the right paddle at speeds up to `STRESS_MAX_SPEED`, and counts how many
+     the old collision test (a distance check against the paddle's center after every step) and the swept collisions return,
+     at the default physics step and at a long one.
+
+3. **computer**:
+   - Plays headless matches of every difficulty of the computer against a Medium computer on the right paddle,
+     and prints the points won, the time of a prediction and the physics steps per second.
+
+4. **batch**:
+   - Plays the same noise-free matches, with a different reaction delay and speed of the left computer in every one,
+     with the Turtle objects and with a `BatchPong`, and checks that they end the same way.
+   - Prints the match steps per second of the Turtle objects and of a `BatchPong` of `BATCH_MATCHES` matches (requires NumPy).
+
+5. **court**:
+   - Plays the same frames with the center line drawn as 20 turtles (the old court) and as the stamps of a `Court`,
+     and prints the frame time, the turtles every `screen.update()` redraws and the items on the canvas of both.
+   - Under `headless.py` nothing is drawn, so only the counts of turtles and items are meaningful there; the frame times need a display.
+
+Constants:
+----------
+- **PACING_SECONDS**: How long each loop of the pacing benchmark runs, in seconds.
+- **STRESS_SHOTS**, **STRESS_SPEEDS** and **STRESS_STEPS**: The shots fired at every speed, the speeds in pixels per second
+  and the physics steps of the stress benchmark.
+- **COMPUTER_MATCHES** and **COMPUTER_MAX_STEPS**: The matches played for every difficulty and the most steps a match may last.
+- **BATCH_REACTIONS** and **BATCH_SPEEDS**: The settings of the left computer in the matches compared by the batch benchmark.
+- **BATCH_MATCHES** and **BATCH_STEPS**: The size of the batch whose speed is measured and the steps it runs.
+- **COURT_FRAMES**: The frames played with every court.
+
+Usage:
+------
+    python benchmark.py pacing stress computer batch court
+"""
+
+import random
+import sys
+import time
+from turtle import Screen, Turtle
+
+from ball import Ball, BALL_VELOCITY
+from paddle import Paddle, HALF_HEIGHT
+from scoreboard import Scoreboard
+from match import Match, PHYSICS_STEP, WALL_TOP, WALL_BOTTOM, OUT_X
+from computer import Computer, DIFFICULTIES
+from court import Court, DASHES, DASH_X, FIRST_DASH_Y, DASH_GAP
+from pacer import FramePacer, TARGET_FPS
+
+# Constants
+PACING_SECONDS = 5
+RIGHT_PAD_LOC = (350, 0)
+LEFT_PAD_LOC = (-350, 0)
+STRESS_SHOTS = 200
+STRESS_SPEEDS = (300, 1_000, 3_000, 10_000, 30_000)
+STRESS_STEPS = (PHYSICS_STEP, 1 / 30)
+OLD_PADDLE_REACH = 50 # the distance from a paddle's center and the x-coordinate of the old collision test
+OLD_PADDLE_X = 330
+COMPUTER_MATCHES = 10
+COMPUTER_MAX_STEPS = 240 * 600 # ten minutes of play
+BATCH_REACTIONS = (0.0, 0.05, 0.1, 0.2, 0.3)
+BATCH_SPEEDS = (300, 450, 600, 900)
+BATCH_MATCHES = 1000
+BATCH_STEPS = 240 * 60 # a minute of play
+COURT_FRAMES = 600
+
+
+def new_match(screen, court=None):
+    """
+    Clears the screen and creates a match against the computer on it.
+
+    Parameters:
+    -----------
+    screen : Screen
+        The screen to draw the match on.
+    court : Callable[[], None], optional
+        A function that draws the court before the match's turtles are created.
+
+    Returns:
+    --------
+    Match
+        The new match, with the computer on the left paddle.
+    """
+    screen.clearscreen()
+    screen.tracer(0)
+    if court is not None:
+        court()
+    ball, left_paddle = Ball(), Paddle(LEFT_PAD_LOC)
+    return Match(ball, left_paddle, Paddle(RIGHT_PAD_LOC), Scoreboard(), Computer(left_paddle, ball, 2))
+
+
+def report(name, frames, steps, wall, cpu):
+    """
+    Prints the measurements of a loop.
+
+    Parameters:
+    -----------
+    name : str
+        The name of the loop.
+    frames : int
+        The number of frames drawn.
+    steps : int
+        The number of physics steps run.
+    wall : float
+        The time the loop ran, in seconds.
+    cpu : float
+        The CPU time the process used while the loop ran, in seconds.
+    """
+    print(f"pacing: {name}: {frames / wall:,.0f} frames/s, {cpu / wall:.0%} of a core, {steps / wall:.0f} physics steps/s")
+
+
+def bench_pacing():
+    """Runs the match in the old busy loop and with a frame pacer, and compares the CPU they use for the same game speed."""
+    screen = Screen()
+
+    match = new_match(screen)
+    frames = 0
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    last_frame = wall_start
+    while time.perf_counter() - wall_start < PACING_SECONDS:
+        screen.update()
+        now = time.perf_counter()
+        match.advance(now - last_frame)
+        last_frame = now
+        frames += 1
+    report("busy loop", frames, match.steps, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    match = new_match(screen)
+    pacer = FramePacer(screen, match.advance, TARGET_FPS)
+    canvas = screen.getcanvas()
+
+    def finish():
+        """Stops the pacer and leaves the main loop."""
+        pacer.stop()
+        canvas.quit()
+
+    wall_start, cpu_start = pacer.clock(), time.process_time()
+    pacer.start()
+    screen.ontimer(finish, PACING_SECONDS * 1000)
+    canvas.mainloop()
+    report(f"pacer at {TARGET_FPS} FPS", pacer.frames, match.steps, pacer.clock() - wall_start, time.process_time() - cpu_start)
+    stats = pacer.stats()
+    print(f"pacing: pacer frame time {stats['frame_ms']:.2f} ms mean, {stats['max_frame_ms']:.2f} ms max, {stats['skipped']} frames skipped")
+
+
+def aim(ball, paddle, speed, rng):
+    """
+    Puts the ball in the middle of the court and aims it at a random point of a paddle's front.
+
+    Parameters:
+    -----------
+    ball : Ball
+        The ball to fire.
+    paddle : Paddle
+        The paddle to aim at, on the right.
+    speed : float
+        The speed of the ball, in pixels per second.
+    rng : random.Random
+        The random generator of the shot.
+    """
+    paddle.goto(paddle.xcor(), rng.uniform(WALL_BOTTOM + HALF_HEIGHT, WALL_TOP - HALF_HEIGHT))
+    ball.goto(0, rng.uniform(WALL_BOTTOM, WALL_TOP))
+    target = paddle.ycor() + rng.uniform(-HALF_HEIGHT, HALF_HEIGHT)
+    dx, dy = OLD_PADDLE_X - ball.xcor(), target - ball.ycor()
+    length = (dx * dx + dy * dy) ** 0.5
+    ball.x_move = BALL_VELOCITY * dx / length
+    ball.y_move = BALL_VELOCITY * dy / length
+    ball.ball_speed = speed / BALL_VELOCITY
+
+
+def old_returns(ball, paddle, physics_step):
+    """
+    Plays a shot with the old collision test, which checked the ball's distance from the paddle's center after every step.
+
+    Parameters:
+    -----------
+    ball : Ball
+        The ball, aimed at the paddle.
+    paddle : Paddle
+        The right paddle.
+    physics_step : float
+        The time of one step, in seconds.
+
+    Returns:
+    --------
+    bool
+        True if the paddle sent the ball back, False if the ball went out.
+    """
+    while -OUT_X <= ball.xcor() <= OUT_X:
+        ball.move(physics_step)
+        if ball.ycor() >= WALL_TOP or ball.ycor() <= WALL_BOTTOM:
+            ball.wall_bounce()
+        if ball.distance(paddle) < OLD_PADDLE_REACH and ball.xcor() >= OLD_PADDLE_X:
+            return True
+    return False
+
+
+def swept_returns(match):
+    """
+    Plays a shot with the swept collisions of a match.
+
+    Parameters:
+    -----------
+    match : Match
+        The match, with its ball aimed at the right paddle.
+
+    Returns:
+    --------
+    bool
+        True if the paddle sent the ball back, False if the ball went out.
+    """
+    scoreboard = match.scoreboard
+    left_points, right_points = scoreboard.l_score, scoreboard.r_score
+    while match.ball.x_move > 0:
+        match.step()
+        if scoreboard.l_score != left_points:
+            return False
+        # a fast ball can be returned and go out on the left within a single step
+        if scoreboard.r_score != right_points:
+            return True
+    return True
+
+
+def bench_stress():
+    """Fires balls at the right paddle at rising speeds and compares the shots the old and the swept collisions return."""
+    screen = Screen()
+    screen.tracer(0)
+    for physics_step in STRESS_STEPS:
+        match = new_match(screen)
+        match.physics_step = physics_step
+        match.computer = None
+        # the left paddle is moved out of the court, so a returned ball is not sent back again within the same step
+        match.left_paddle.goto(-2 * OUT_X, 0)
+        ball, paddle = match.ball, match.right_paddle
+        for speed in STRESS_SPEEDS:
+            rng = random.Random(speed)
+            old = swept = 0
+            start = time.perf_counter()
+            for _ in range(STRESS_SHOTS):
+                state = rng.getstate()
+                aim(ball, paddle, speed, rng)
+                old += old_returns(ball, paddle, physics_step)
+                # the same shot again, for the swept collisions
+                rng.setstate(state)
+                aim(ball, paddle, speed, rng)
+                swept += swept_returns(match)
+            match.scoreboard.r_score = match.scoreboard.l_score = 0 # keeps the match from being won between the speeds
+            elapsed = time.perf_counter() - start
+            print(f"stress: step 1/{1 / physics_step:.0f} s, {speed:>6,} px/s: old test returned {old}/{STRESS_SHOTS}, "
+                  f"swept returned {swept}/{STRESS_SHOTS} ({elapsed / STRESS_SHOTS * 1000:.2f} ms/shot for both)")
+
+
+def bench_computer():
+    """Plays matches of every difficulty of the computer against a Medium computer, and measures the cost of its predictions."""
+    screen = Screen()
+    for difficulty in DIFFICULTIES:
+        won = lost = steps = 0
+        thinking = 0.0
+        start = time.perf_counter()
+        for seed in range(COMPUTER_MATCHES):
+            match = new_match(screen)
+            match.computer = Computer(match.left_paddle, match.ball, difficulty, seed)
+            opponent = Computer(match.right_paddle, match.ball, 2, seed + COMPUTER_MATCHES)
+            while not match.over and match.steps < COMPUTER_MAX_STEPS:
+                opponent.update(match.physics_step)
+                match.step()
+            won += match.scoreboard.l_score
+            lost += match.scoreboard.r_score
+            steps += match.steps
+
+            # the prediction alone, on the last position of the ball
+            computer = match.computer
+            think_start = time.perf_counter()
+            for _ in range(1000):
+                computer.update(0.0)
+            thinking += time.perf_counter() - think_start
+        elapsed = time.perf_counter() - start
+        print(f"computer: difficulty {difficulty}: won {won} points to {lost} against Medium in {COMPUTER_MATCHES} matches, "
+              f"{thinking / COMPUTER_MATCHES * 1000:.2f} us per update, {steps / elapsed:,.0f} physics steps/s")
+
+
+def bench_batch():
+    """Checks that a `BatchPong` plays matches like the Turtle objects, and compares the speed of both."""
+    import numpy as np
+    from batch import BatchPong, BatchComputer, LEFT, RIGHT
+
+    # the computers aim with the noise of their difficulty, match i of the batch draws its errors with the seeds of scalar match i
+    settings = [(reaction, speed) for reaction in BATCH_REACTIONS for speed in BATCH_SPEEDS]
+    screen = Screen()
+    scalar = []
+    start = time.perf_counter()
+    for i, (reaction, speed) in enumerate(settings):
+        match = new_match(screen)
+        match.computer = Computer(match.left_paddle, match.ball, seed=i, reaction=reaction, max_speed=speed)
+        opponent = Computer(match.right_paddle, match.ball, seed=len(settings) + i)
+        while not match.over and match.steps < COMPUTER_MAX_STEPS:
+            opponent.update(match.physics_step)
+            match.step()
+        scalar.append((match.scoreboard.l_score, match.scoreboard.r_score, match.steps, match.ball.xcor(), match.ball.ycor()))
+    scalar_rate = sum(result[2] for result in scalar) / (time.perf_counter() - start)
+
+    batch = BatchPong(len(settings))
+    left = BatchComputer(batch, LEFT, seed=0, reaction=[reaction for reaction, _ in settings], max_speed=[speed for _, speed in settings])
+    right = BatchComputer(batch, RIGHT, seed=len(settings))
+    while not batch.over.all() and batch.steps.max() < COMPUTER_MAX_STEPS:
+        right.update()
+        left.update()
+        batch.step()
+    same = sum(scores[:3] == (batch.l_score[i], batch.r_score[i], batch.steps[i]) for i, scores in enumerate(scalar))
+    drift = max(max(abs(scores[3] - batch.ball_x[i]), abs(scores[4] - batch.ball_y[i])) for i, scores in enumerate(scalar))
+    print(f"batch: {same} of {len(settings)} noisy matches end with the same score after the same steps, "
+          f"ball positions differ by at most {drift:.3g} px")
+
+    batch = BatchPong(BATCH_MATCHES)
+    rng = np.random.default_rng(0)
+    left = BatchComputer(batch, LEFT, 1, seed=0, reaction=rng.uniform(0, 0.3, BATCH_MATCHES), max_speed=rng.uniform(300, 900, BATCH_MATCHES))
+    right = BatchComputer(batch, RIGHT, 2, seed=BATCH_MATCHES)
+    start = time.perf_counter()
+    for _ in range(BATCH_STEPS):
+        right.update()
+        left.update()
+        batch.step()
+    batch_rate = batch.steps.sum() / (time.perf_counter() - start)
+    print(f"batch: {scalar_rate:,.0f} match steps/s with the Turtle objects, {batch_rate:,.0f} match steps/s "
+          f"with a batch of {BATCH_MATCHES} ({batch_rate / scalar_rate:.0f}x), {batch.over.sum()} of them finished")
+
+
+def old_center_line():
+    """Draws the center line as 20 turtles, like the game did before the `Court`."""
+    for i in range(DASHES):
+        dash = Turtle()
+        dash.shape("square")
+        dash.penup()
+        dash.speed("fastest")
+        dash.shapesize(stretch_wid=1, stretch_len=0.5)
+        dash.setx(DASH_X)
+        dash.sety(FIRST_DASH_Y + i * DASH_GAP)
+
+
+def bench_court():
+    """Plays the same frames on the old court of 20 turtles and on the stamped `Court`, and compares their frame times."""
+    screen = Screen()
+    for name, court in (("20 dash turtles", old_center_line), ("stamped court", Court)):
+        match = new_match(screen, court)
+        screen.update()
+        frame_times = []
+        for _ in range(COURT_FRAMES):
+            start = time.perf_counter()
+            match.advance(1 / TARGET_FPS)
+            screen.update()
+            frame_times.append(time.perf_counter() - start)
+        redrawn = sum(turtle.isvisible() for turtle in screen.turtles())
+        items = len(screen.getcanvas().find_all())
+        print(f"court: {name}: {sum(frame_times) / COURT_FRAMES * 1000:.3f} ms/frame mean, {max(frame_times) * 1000:.3f} ms max, "
+              f"{redrawn} turtles redrawn per frame, {items} canvas items")
+
+
+BENCHMARKS = {
+    "pacing": bench_pacing,
+    "stress": bench_stress,
+    "computer": bench_computer,
+    "batch": bench_batch,
+    "court": bench_court,
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
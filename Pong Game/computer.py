@@ -0,0 +1,154 @@
+"""
+Pong Game Computer Player
+
+This script defines a `Computer` class that moves a paddle for the computer in the single-player mode.
+Instead of moving up and down whatever the ball does, the computer works out where the ball will cross its paddle
+and moves there. The ball flies in straight lines between the walls, so the crossing point is found in one calculation:
+the ball's path is followed to the paddle as if there were no walls, and the height it reaches is folded back
+between the walls, once for every bounce it would make on the way (like unfolding the court in a mirror).
+There is no simulation of the ball's flight, so the cost of a prediction does not grow with the ball's speed or distance.
+
+Key Features:
+-------------
+1. **Analytic Prediction**:
+   - The crossing height is computed from the ball's position and velocity with a modulo over twice the court's height.
+
+2. **Difficulty**:
+   - The reaction delay is how long the computer takes to notice a shot coming toward it before it starts moving.
+   - The prediction noise is a random error, drawn once per shot, added to the predicted height.
+   - The maximum speed caps how fast the paddle moves toward the predicted height.
+
+3. **Deterministic**:
+   - The errors are drawn from a seeded random generator, so a match with the same key presses plays the same way.
+
+Constants:
+----------
+- **DIFFICULTIES**: The reaction delay in seconds, the prediction noise in pixels (the standard deviation of the error)
+  and the maximum speed in pixels per second of every difficulty of the menu.
+
+Classes:
+--------
+1. **Computer**:
+   - Moves a paddle toward the predicted crossing height of the ball on every physics step.
+
+Usage:
+------
+- `Computer(paddle, ball, difficulty)` is passed to a `Match`, which calls `update(dt)` on every step.
+- `intercept(x, y, vx, vy, target_x)` returns the height at which a ball reaches an x-coordinate.
+"""
+
+import random
+
+from ball import CENTER, RADIUS
+from paddle import HALF_WIDTH
+from match import WALL_TOP, WALL_BOTTOM
+
+# Constants
+DIFFICULTIES = {
+    1: {"reaction": 0.30, "noise": 60, "max_speed": 350}, # Easy
+    2: {"reaction": 0.15, "noise": 30, "max_speed": 550}, # Medium
+    3: {"reaction": 0.05, "noise": 10, "max_speed": 900}, # Hard
+}
+
+
+def intercept(x, y, vx, vy, target_x):
+    """
+    Finds the height at which the ball reaches an x-coordinate, bouncing off the walls on the way.
+
+    Parameters:
+    -----------
+    x, y : float
+        The position of the ball.
+    vx, vy : float
+        The velocity of the ball, in pixels per second.
+    target_x : float
+        The x-coordinate the ball is moving toward.
+
+    Returns:
+    --------
+    float
+        The y-coordinate of the ball's center when it reaches target_x.
+    """
+    flight = max(0.0, (target_x - x) / vx) if vx else 0.0
+    height = WALL_TOP - WALL_BOTTOM
+    # the height on a court unfolded at every wall, folded back into the real one
+    offset = (y + vy * flight - WALL_BOTTOM) % (2 * height)
+    if offset > height:
+        offset = 2 * height - offset
+    return WALL_BOTTOM + offset
+
+
+class Computer:
+    """
+    A class to move a paddle for the computer.
+
+    Attributes:
+    -----------
+    reaction : float
+        The time the computer takes to react to a shot coming toward it, in seconds.
+    noise : float
+        The standard deviation of the error of the prediction, in pixels.
+    max_speed : float
+        The highest speed of the paddle, in pixels per second.
+    target : float
+        The height the paddle is moving toward.
+    """
+
+    def __init__(self, paddle, ball, difficulty=2, seed=0, **settings):
+        """
+        Initializes the Computer object.
+
+        Parameters:
+        -----------
+        paddle : Paddle
+            The paddle the computer moves.
+        ball : Ball
+            The ball of the match.
+        difficulty : int, optional
+            The difficulty chosen in the menu, a key of DIFFICULTIES.
+        seed : int, optional
+            The seed of the prediction errors.
+        settings : float, optional
+            A reaction, noise or max_speed that replaces the one of the difficulty.
+        """
+        settings = {**DIFFICULTIES[difficulty], **settings}
+        self.paddle = paddle
+        self.ball = ball
+        self.reaction = settings["reaction"]
+        self.noise = settings["noise"]
+        self.max_speed = settings["max_speed"]
+        self.rng = random.Random(seed)
+        self.side = 1 if paddle.xcor() > 0 else -1 # the direction the ball moves in when it comes toward the paddle
+        self.face_x = paddle.xcor() - self.side * (HALF_WIDTH + RADIUS) # where the ball's center touches the paddle
+        self.target = CENTER[1]
+        self.approaching = False
+        self.delay = 0.0
+        self.error = 0.0
+
+
+    def update(self, dt):
+        """
+        Predicts where the ball will reach the paddle and moves the paddle toward it.
+
+        Parameters:
+        -----------
+        dt : float
+            The time step, in seconds.
+        """
+        ball = self.ball
+        vx = ball.x_move * ball.ball_speed
+        if vx * self.side > 0:
+            if not self.approaching:
+                # a new shot: it is noticed after the reaction delay, and misjudged by an error that stays until the next one
+                self.approaching = True
+                self.delay = self.reaction
+                self.error = self.rng.gauss(0, self.noise)
+            if self.delay > 0:
+                self.delay -= dt
+            else:
+                self.target = intercept(ball.xcor(), ball.ycor(), vx, ball.y_move * ball.ball_speed, self.face_x) + self.error
+        else:
+            # the ball is moving away, the paddle goes back to the middle to wait for the next shot
+            self.approaching = False
+            self.target = CENTER[1]
+        self.paddle.move_to(self.target, self.max_speed, dt)
@@ -0,0 +1,69 @@
+"""
+Pong Game Court
+
+This script defines a `Court` class that draws the static parts of the Pong court, the dashed line in the middle.
+The line used to be 20 separate turtles, and `screen.update()` redraws every visible turtle on every frame:
+it moves, recolors and raises the canvas item of each of them even though they never move.
+The court is now drawn once, as stamps of a single turtle that is then hidden. A stamp is a plain canvas item that the
+turtle module leaves alone after it is drawn, so the frames only redraw the ball and the paddles, and the texts
+of the scoreboard when a score changes.
+
+Key Features:
+-------------
+1. **Background Layer**:
+   - The dashes are stamped once when the court is created and are never touched by the frames again.
+   - The stamps are drawn before the ball and the paddles are created, so they stay behind them.
+
+Constants:
+----------
+- **DASHES**: The number of dashes of the center line.
+- **DASH_X**, **FIRST_DASH_Y** and **DASH_GAP**: The x-coordinate of the line, the y-coordinate of its lowest dash and the distance between two dashes.
+- **DASH_STRETCH**: The stretch of the square shape of a dash, as (width, length).
+
+Classes:
+--------
+1. **Court**:
+   - Inherits from the `Turtle` class and stamps the center line, then hides.
+
+Usage:
+------
+- `Court()` is created once, after the menu and before the paddles and the ball.
+"""
+
+from turtle import Turtle
+
+# Constants
+DASHES = 20
+DASH_X = 10
+FIRST_DASH_Y = -280
+DASH_GAP = 30
+DASH_STRETCH = (1, 0.5)
+
+
+class Court(Turtle):
+    """
+    A class to draw the static parts of the Pong court once.
+
+    Attributes:
+    -----------
+    stamps : list[int]
+        The ids of the stamps of the center line.
+    """
+
+    def __init__(self):
+        """Initializes the Court object and stamps the center line."""
+        super().__init__()
+        self.hideturtle()
+        self.penup()
+        self.speed("fastest")
+        self.shape("square")
+        self.shapesize(stretch_wid=DASH_STRETCH[0], stretch_len=DASH_STRETCH[1])
+        self.stamps = []
+        self.draw_center_line()
+
+
+    def draw_center_line(self):
+        """Stamps the dashes of the center line, from the bottom of the court to the top."""
+        for i in range(DASHES):
+            self.goto(DASH_X, FIRST_DASH_Y + i * DASH_GAP)
+            self.stamps.append(self.stamp())
@@ -18,6 +18,8 @@ Key Features:
 -------------
 1. **Game Modes**:
    - Single-player: The player competes against the computer with adjustable difficulty.
+     The computer predicts where the ball will reach its paddle, and the difficulty sets its reaction time,
+     the error of its predictions and the speed of its paddle.
    - Two-player: Two players control separate paddles and compete against each other.
 
 2. **Game Components**:
@@ -27,6 +29,10 @@ Key Features:
 
 3. **Game Loop**:
    - The game loop continues until one player reaches the maximum score, which ends the game.
+   - Every frame passes the time since the last frame to a `Match`, which moves the game in fixed steps,
+     so the ball and the computer's paddle move at the same speed on every machine.
+   - The frames are drawn by a `FramePacer` on the screen's timer at a target frame rate (60 by default, `--fps N` to change it),
+     so the game sleeps between the frames instead of keeping a core busy. The frame rate and frame time are shown in the corner.
 
 4. **Collision Detection**:
    - The ball bounces off the walls and paddles, and if a paddle misses the ball, the opposing player earns a point.
@@ -37,6 +43,10 @@ Classes Used:
 - `Ball`: Manages the ball's movement, speed, and bouncing behavior.
 - `Scoreboard`: Displays and updates the players' scores.
 - `Menu`: Displays the game menu and handles user input for game mode and difficulty selection.
+- `Court`: Draws the dashed line in the middle once, as stamps that the frames do not redraw.
+- `Match`: Runs the rules of the match in fixed time steps.
+- `Computer`: Moves the computer's paddle to where it predicts the ball will arrive.
+- `FramePacer` and `FpsReadout`: Draw the frames at the target frame rate and show how long they take.
 
 How to Play:
 ------------
@@ -50,17 +60,55 @@ How to Play:
 """
 
 
-from turtle import Screen, Turtle
+from turtle import Screen
 from paddle import Paddle
 from ball import Ball
 from scoreboard import Scoreboard
 from menu import Menu
+from court import Court
+from match import Match
+from computer import Computer
+from pacer import FramePacer, FpsReadout, TARGET_FPS
+import math
+import sys
 import time
 
 # Constants
 RIGHT_PAD_LOC = (350, 0)
 LEFT_PAF_LOC = (-350, 0)
-CENTER_BOTTOM_Y = -280
+USAGE = "usage: python main.py [--fps N]"
+
+
+def frame_rate(arguments):
+    """
+    Reads the target frame rate from the command line, given as `--fps N`.
+    Exits with a usage message if the rate is missing, is not a number or is not a finite number above 0.
+
+    Parameters:
+    -----------
+    arguments : list[str]
+        The command line arguments.
+
+    Returns:
+    --------
+    float
+        The target frame rate, TARGET_FPS if no rate is given.
+    """
+    if "--fps" not in arguments:
+        return TARGET_FPS
+    if "--fps" not in arguments[:-1]:
+        sys.exit(f"{USAGE}\n--fps needs a frame rate, such as 60")
+    value = arguments[arguments.index("--fps") + 1]
+    try:
+        fps = float(value)
+    except ValueError:
+        sys.exit(f"{USAGE}\n--fps must be a number, such as 60, not {value!r}")
+    if not (fps > 0 and math.isfinite(fps)):
+        sys.exit(f"{USAGE}\n--fps must be a finite number above 0, not {value}")
+    return fps
+
+
+FPS = frame_rate(sys.argv[1:])
 
 screen = Screen()
 
@@ -88,17 +136,8 @@ if menu.mode == 0: # if the user chose to play with the computer
         time.sleep(0.1)
 
 
-# Creating the broken line in the middle
-curr_line_y = CENTER_BOTTOM_Y
-for i in range(20):
-    new_line = Turtle()
-    new_line.shape("square")
-    new_line.penup()
-    new_line.speed("fastest")
-    new_line.shapesize(stretch_wid=1, stretch_len=0.5)
-    new_line.setx(10)
-    new_line.sety(curr_line_y)
-    curr_line_y += 30
+# Drawing the broken line in the middle once, as a background the frames do not redraw
+court = Court()
 
 
 
@@ -118,39 +157,26 @@ screen.onkeypress(key="Up", fun=right_paddle.up)
 screen.onkeypress(key="Down", fun=right_paddle.down)
 
 
-game_is_on = True
-while game_is_on:
-    screen.update()
-    ball.move()
-
-    # The player chose to play against the computer
-    if menu.mode == 0:
-        left_paddle.move(menu.difficulty)
-
-    # Collision with wall
-    if ball.ycor() >= 290 or ball.ycor() <= -285:
-        ball.wall_bounce()
-
-    # Collision with paddle
-    if (ball.distance(right_paddle) < 50 and ball.xcor() >= 330 or
-        ball.distance(left_paddle) < 50 and ball.xcor() <= -330):
-        ball.paddle_bounce()
-
-    # The ball was missed by one of the paddles
-    # Left player point
-    if ball.xcor() > 390:
-        scoreboard.l_increase()
-        ball.respawn_ball()
-
-    # Right player point
-    if ball.xcor() < -390:
-        scoreboard.r_increase()
-        ball.respawn_ball()
+# The computer moves the left paddle when the player chose to play against it
+computer = Computer(left_paddle, ball, menu.difficulty) if menu.mode == 0 else None
+match = Match(ball, left_paddle, right_paddle, scoreboard, computer)
 
-    if scoreboard.win():
-        game_is_on = False
 
+def play_frame(elapsed):
+    """
+    Moves the match by the time since the last frame, and stops the frames when a player has won.
 
+    Parameters:
+    -----------
+    elapsed : float
+        The time since the last frame, in seconds.
+    """
+    match.advance(elapsed)
+    if match.over:
+        pacer.stop()
+        screen.onscreenclick(lambda x, y: screen.bye()) # a click closes the window, like exitonclick
 
 
-screen.exitonclick()
\ No newline at end of file
+pacer = FramePacer(screen, play_frame, FPS, FpsReadout())
+pacer.start()
+screen.mainloop()
@@ -0,0 +1,277 @@
+"""
+Pong Game Match
+
+This script defines a `Match` class that runs the rules of a Pong match with a fixed time step.
+The ball, the paddles and the scoreboard are moved by steps of `PHYSICS_STEP` seconds, whatever the frame rate is:
+the time of every frame is added to an accumulator, and as many whole steps as it holds are run (the accumulator pattern).
+A match therefore plays the same on a slow and a fast machine, and a match that runs the same number of steps with the same
+key presses always ends the same way.
+The collisions are swept: the path of the ball over a step is a segment, and the first wall or paddle it meets is found
+with the time of impact, so the ball bounces at the exact point of contact and goes on for the rest of the step.
+A fast ball or a long step cannot carry the ball through a paddle between two checks.
+
+Key Features:
+-------------
+1. **Fixed Time Step**:
+   - The ball and the computer's paddle move by their velocity in pixels per second times the step, never by a per-frame amount.
+   - The computer's `Computer` player, if there is one, moves its paddle at the start of every step.
+   - The points are checked after every step.
+
+2. **Swept Collisions**:
+   - The ball's segment is tested against the wall lines and against every paddle's box grown by the ball's radius (a slab test),
+     and the earliest hit is resolved first: the ball moves to it, bounces, and the search goes on for the time that is left.
+   - A hit on the front of a paddle bounces the ball back and speeds it up, a hit on its top or bottom only reverses its vertical direction.
+   - A paddle that moves onto the ball (a keyboard step of 40 px, for example) hits it at the start of the next step:
+     the ball is put back in front of the paddle and bounces, instead of passing through it.
+
+3. **Accumulator**:
+   - `advance(elapsed)` runs the steps that fit in the elapsed time and keeps the rest for the next frame.
+   - A long pause (a dragged window, for example) is cut to `MAX_FRAME_TIME`, so the game does not run a burst of steps to catch up.
+
+4. **Headless**:
+   - `step()` can be called directly, without a clock or a screen update, to play matches as fast as possible.
+
+Constants:
+----------
+- **PHYSICS_STEP**: The default time of one step of the physics, in seconds.
+- **MAX_FRAME_TIME**: The longest frame time the accumulator takes, in seconds.
+- **WALL_TOP** and **WALL_BOTTOM**: The y-coordinates where the ball bounces off the walls.
+- **MAX_BOUNCES**: The most bounces resolved within one step.
+- **OUT_X**: The x-coordinate past which the ball is out and the other player scores.
+
+Classes:
+--------
+1. **Match**:
+   - Holds the ball, the paddles and the scoreboard of a match and runs its steps.
+
+Usage:
+------
+- `advance(elapsed)` is called once per frame with the time since the last frame.
+- `step()` runs a single step, and `over` tells whether a player has won.
+"""
+
+from ball import RADIUS
+from paddle import HALF_WIDTH, HALF_HEIGHT
+
+# Constants
+PHYSICS_STEP = 1 / 240
+MAX_FRAME_TIME = 0.25
+WALL_TOP = 290
+WALL_BOTTOM = -285
+OUT_X = 390
+MAX_BOUNCES = 8
+
+# The kinds of surfaces the ball can hit
+WALL = "wall"
+FACE = "face" # the front or back of a paddle
+EDGE = "edge" # the top or bottom of a paddle
+
+
+def sweep_box(x, y, vx, vy, box, limit):
+    """
+    Finds when a moving point enters a box, with the slab test.
+
+    Parameters:
+    -----------
+    x, y : float
+        The position of the point.
+    vx, vy : float
+        The velocity of the point.
+    box : tuple[float, float, float, float]
+        The left, right, bottom and top of the box.
+    limit : float
+        The end of the time range to search.
+
+    Returns:
+    --------
+    tuple[float, str] or None
+        The time the point enters the box and FACE or EDGE for the side it enters through,
+        or None if it does not enter the box within the time range (or is already inside it, see `Match.push_out`).
+    """
+    left, right, bottom, top = box
+    enter = float("-inf")
+    leave = float("inf")
+    side = None
+    for position, velocity, low, high, slab_side in ((x, vx, left, right, FACE), (y, vy, bottom, top, EDGE)):
+        if velocity == 0:
+            if not low < position < high:
+                return None
+            continue
+        near = (low - position) / velocity
+        far = (high - position) / velocity
+        if near > far:
+            near, far = far, near
+        if near > enter:
+            enter, side = near, slab_side
+        leave = min(leave, far)
+    if enter > leave or enter < 0 or enter > limit:
+        return None
+    return enter, side
+
+
+class Match:
+    """
+    A class to run a Pong match with a fixed time step.
+
+    Attributes:
+    -----------
+    accumulator : float
+        The time that passed and was not run as steps yet, in seconds.
+    steps : int
+        The number of steps run since the match started.
+    over : bool
+        True once a player has won.
+    physics_step : float
+        The time of one step, in seconds.
+    """
+
+    def __init__(self, ball, left_paddle, right_paddle, scoreboard, computer=None, physics_step=PHYSICS_STEP):
+        """
+        Initializes the Match object.
+
+        Parameters:
+        -----------
+        ball : Ball
+            The ball of the match.
+        left_paddle : Paddle
+            The left paddle, moved by the computer if one is given.
+        right_paddle : Paddle
+            The right paddle.
+        scoreboard : Scoreboard
+            The scoreboard of the match.
+        computer : Computer, optional
+            The computer player of the left paddle, None if a player controls it.
+        physics_step : float, optional
+            The time of one step, in seconds. The swept collisions keep long steps exact.
+        """
+        self.ball = ball
+        self.left_paddle = left_paddle
+        self.right_paddle = right_paddle
+        self.scoreboard = scoreboard
+        self.computer = computer
+        self.physics_step = physics_step
+        self.accumulator = 0.0
+        self.steps = 0
+        self.over = False
+
+
+    def advance(self, elapsed):
+        """
+        Adds the time of a frame to the accumulator and runs the whole steps it holds.
+
+        Parameters:
+        -----------
+        elapsed : float
+            The time since the last frame, in seconds.
+
+        Returns:
+        --------
+        int
+            The number of steps that were run.
+        """
+        self.accumulator += min(elapsed, MAX_FRAME_TIME)
+        steps = 0
+        while self.accumulator >= self.physics_step and not self.over:
+            self.step()
+            self.accumulator -= self.physics_step
+            steps += 1
+        return steps
+
+
+    def step(self):
+        """
+        Runs one step: moves the computer's paddle, moves the ball through its bounces, then handles the points and the end of the match.
+        """
+        ball = self.ball
+        self.steps += 1
+
+        # The player chose to play against the computer
+        if self.computer is not None:
+            self.computer.update(self.physics_step)
+
+        # A paddle that moved onto the ball hits it before the ball moves
+        self.push_out()
+
+        # Collisions with the walls and the paddles, resolved in the order they happen within the step
+        remaining = self.physics_step
+        for _ in range(MAX_BOUNCES):
+            hit = self.first_hit(remaining)
+            if hit is None:
+                break
+            impact, surface = hit
+            ball.move(impact)
+            remaining -= impact
+            if surface == FACE:
+                ball.paddle_bounce()
+            else:
+                ball.wall_bounce()
+        ball.move(remaining)
+
+        # The ball was missed by one of the paddles
+        # Left player point
+        if ball.xcor() > OUT_X:
+            self.scoreboard.l_increase()
+            ball.respawn_ball()
+
+        # Right player point
+        if ball.xcor() < -OUT_X:
+            self.scoreboard.r_increase()
+            ball.respawn_ball()
+
+        if self.scoreboard.win():
+            self.over = True
+
+
+    def push_out(self):
+        """
+        Bounces the ball off a paddle it is inside of, which happens when the paddle moves onto the ball, and puts it back
+        in front of the paddle. A ball that is already moving back toward the court is left to come out on its own.
+        """
+        ball = self.ball
+        x, y = ball.xcor(), ball.ycor()
+        for paddle in (self.left_paddle, self.right_paddle):
+            box = (paddle.xcor() - HALF_WIDTH - RADIUS, paddle.xcor() + HALF_WIDTH + RADIUS,
+                   paddle.ycor() - HALF_HEIGHT - RADIUS, paddle.ycor() + HALF_HEIGHT + RADIUS)
+            side = 1 if paddle.xcor() > 0 else -1 # the direction from the front of the paddle to its back
+            if box[0] < x < box[1] and box[2] < y < box[3] and ball.x_move * side > 0:
+                ball.goto(box[0] if side > 0 else box[1], y)
+                ball.paddle_bounce()
+                return
+
+
+    def first_hit(self, limit):
+        """
+        Finds the first wall or paddle the ball hits within a time range, if it keeps its current velocity.
+
+        Parameters:
+        -----------
+        limit : float
+            The end of the time range to search, in seconds.
+
+        Returns:
+        --------
+        tuple[float, str] or None
+            The time of impact and the surface hit (WALL, FACE or EDGE), or None if the ball hits nothing.
+        """
+        ball = self.ball
+        x, y = ball.xcor(), ball.ycor()
+        vx = ball.x_move * ball.ball_speed
+        vy = ball.y_move * ball.ball_speed
+        hits = []
+
+        # Collision with wall, a ball that is already past a wall bounces right away
+        if vy > 0:
+            hits.append((max(0.0, (WALL_TOP - y) / vy), WALL))
+        elif vy < 0:
+            hits.append((max(0.0, (WALL_BOTTOM - y) / vy), WALL))
+
+        # Collision with paddle, the ball's center against the paddle's box grown by the ball's radius
+        for paddle in (self.left_paddle, self.right_paddle):
+            box = (paddle.xcor() - HALF_WIDTH - RADIUS, paddle.xcor() + HALF_WIDTH + RADIUS,
+                   paddle.ycor() - HALF_HEIGHT - RADIUS, paddle.ycor() + HALF_HEIGHT + RADIUS)
+            hit = sweep_box(x, y, vx, vy, box, limit)
+            if hit is not None:
+                hits.append(hit)
+
+        hits = [hit for hit in hits if hit[0] <= limit]
+        return min(hits) if hits else None
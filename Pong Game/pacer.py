@@ -0,0 +1,198 @@
+"""
+Pong Game Frame Pacer
+
+This script defines a `FramePacer` class that draws the frames of the Pong game at a target frame rate with the screen's timer,
+and an `FpsReadout` class that shows the measured frame rate and frame time in a corner of the screen.
+Instead of spinning in a `while` loop (which keeps a core busy at 100% for a two-paddle game), the pacer draws a frame,
+measures how long it took and sets `screen.ontimer` for the time that is left until the next frame is due.
+Between the frames the process sleeps in Tk's event loop, so it only uses the CPU for the work of the frames.
+
+Key Features:
+-------------
+1. **Frame Rate Cap**:
+   - Frames are drawn at a configurable target rate, 60 frames per second by default.
+
+2. **Adaptive Sleep**:
+   - Every frame is due at an absolute deadline, and the timer is set for the time left until it after the frame was drawn,
+     so the measured render time is taken off the sleep instead of being added to it.
+   - A frame that is more than a whole frame late moves the deadlines forward instead of drawing a burst of late frames.
+
+3. **Readout**:
+   - The measured frames per second, the mean and longest frame time and the share of the frame budget used
+     are shown on the screen twice a second.
+
+Constants:
+----------
+- **TARGET_FPS**: The default target frame rate.
+- **SAMPLES**: The number of recent frames the statistics are computed from.
+- **READOUT_LOC**, **READOUT_FONT** and **READOUT_EVERY**: The position, font and refresh interval of the readout.
+
+Classes:
+--------
+1. **FramePacer**:
+   - Calls a frame function at a target rate with `screen.ontimer` and measures the frames.
+2. **FpsReadout**:
+   - Inherits from the `Turtle` class and writes the statistics of a `FramePacer`.
+
+Usage:
+------
+- `FramePacer(screen, frame, fps)` is created with a function that takes the time since the last frame, then `start()` is called
+  before the screen's main loop.
+- `stats()` returns the measured frame rate and frame times.
+"""
+
+from collections import deque
+import time
+from turtle import Turtle
+
+# Constants
+TARGET_FPS = 60
+SAMPLES = 120
+READOUT_LOC = (-390, -290)
+READOUT_FONT = ("Courier", 10, "normal")
+READOUT_EVERY = 0.5
+
+
+class FramePacer:
+    """
+    A class to draw frames at a target rate with the screen's timer.
+
+    Attributes:
+    -----------
+    interval : float
+        The time between two frames at the target rate, in seconds.
+    deadline : float
+        The clock time the next frame is due.
+    frames : int
+        The number of frames drawn.
+    skipped : int
+        The number of frames that were due but not drawn because the game ran late.
+    """
+
+    def __init__(self, screen, frame, fps=TARGET_FPS, readout=None):
+        """
+        Initializes the FramePacer object.
+        The frames are timed with time.perf_counter, or with the screen's own clock if it has one
+        (the headless screen keeps a virtual clock, so the frames run as fast as possible and always get the same times).
+
+        Parameters:
+        -----------
+        screen : Screen
+            The screen whose `ontimer` method schedules the frames and whose `update` method draws them.
+        frame : Callable[[float], None]
+            The function that moves the game, given the time since the last frame in seconds.
+        fps : float, optional
+            The target frame rate.
+        readout : FpsReadout, optional
+            The readout to show the statistics on, None for no readout.
+        """
+        self.screen = screen
+        self.clock = getattr(screen, "clock", time.perf_counter)
+        self.frame = frame
+        self.interval = 1 / fps
+        self.readout = readout
+        self.running = False
+        self.deadline = 0.0
+        self.last_frame = None
+        self.last_readout = 0.0
+        self.frames = 0
+        self.skipped = 0
+        self.intervals = deque(maxlen=SAMPLES) # the measured times between the frames, in seconds
+        self.work = deque(maxlen=SAMPLES) # the time every frame took to move the game and draw it, in seconds
+
+
+    def start(self):
+        """Starts drawing frames, the first one right away."""
+        self.running = True
+        self.last_frame = self.clock()
+        self.deadline = self.last_frame
+        self.schedule()
+
+
+    def stop(self):
+        """Stops drawing frames after the current one."""
+        self.running = False
+
+
+    def schedule(self):
+        """Sets the screen's timer to the time left until the next frame is due."""
+        delay = max(0, round((self.deadline - self.clock()) * 1000))
+        self.screen.ontimer(self.run, delay)
+
+
+    def run(self):
+        """Moves the game, draws the frame, measures it and schedules the next one."""
+        if not self.running:
+            return
+
+        start = self.clock()
+        self.intervals.append(start - self.last_frame)
+        self.frame(start - self.last_frame)
+        self.last_frame = start
+        self.screen.update()
+        self.work.append(self.clock() - start)
+        self.frames += 1
+
+        if self.readout is not None and start - self.last_readout >= READOUT_EVERY:
+            self.readout.show(self.stats())
+            self.last_readout = start
+
+        self.deadline += self.interval
+        # if the frame ran more than a frame late, the frames that were missed are skipped
+        late = self.clock() - self.deadline
+        if late > self.interval:
+            missed = int(late / self.interval)
+            self.skipped += missed
+            self.deadline += missed * self.interval
+        if self.running:
+            self.schedule()
+
+
+    def stats(self):
+        """
+        Returns the statistics of the recent frames.
+
+        Returns:
+        --------
+        dict[str, float]
+            The measured frames per second, the mean and longest frame time in milliseconds,
+            the share of the frame interval spent drawing (an estimate of the CPU use) and the number of skipped frames.
+        """
+        intervals = self.intervals or [self.interval]
+        work = self.work or [0.0]
+        mean_interval = sum(intervals) / len(intervals)
+        mean_work = sum(work) / len(work)
+        return {
+            "fps": 1 / mean_interval if mean_interval else 0.0,
+            "frame_ms": mean_work * 1000,
+            "max_frame_ms": max(work) * 1000,
+            "busy": mean_work / mean_interval if mean_interval else 1.0,
+            "skipped": self.skipped,
+        }
+
+
+class FpsReadout(Turtle):
+    """
+    A class to show the frame rate and the frame time in a corner of the screen.
+    """
+
+    def __init__(self):
+        """Initializes the FpsReadout as a hidden turtle in the bottom left corner."""
+        super().__init__()
+        self.hideturtle()
+        self.penup()
+        self.color("gray")
+        self.goto(READOUT_LOC)
+
+
+    def show(self, stats):
+        """
+        Writes the statistics of a `FramePacer`, replacing the previous ones.
+
+        Parameters:
+        -----------
+        stats : dict[str, float]
+            The result of `FramePacer.stats()`.
+        """
+        self.clear()
+        self.write(arg=f"{stats['fps']:.0f} FPS  {stats['frame_ms']:.1f} ms/frame  {stats['busy']:.0%} busy", font=READOUT_FONT)
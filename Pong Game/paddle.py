@@ -13,8 +13,9 @@ Key Features:
    - Paddles are constrained to the boundaries of the screen to prevent them from moving off-screen.
 
 2. **Automatic Paddle Movement**:
-   - The `move()` method allows paddles to automatically move up and down at a specified speed.
+   - The `move()` method allows paddles to automatically move up and down at a specified speed, in pixels per second.
    - The paddle changes direction upon reaching the top or bottom screen boundary.
+   - The `move_to()` method moves the paddle toward a target height at a capped speed, for the computer's `Computer` player.
 
 3. **Manual Control**:
    - The `up()` and `down()` methods allow manual control of the paddle, moving it up or down by a fixed amount.
@@ -28,11 +29,18 @@ Classes:
 Usage:
 ------
 - The `up()` and `down()` methods are used to manually move the paddle up or down.
-- The `move()` method enables automatic movement of the paddle at a given speed.
+- The `move()` method enables automatic movement of the paddle at a given speed over a time step.
+- The `move_to()` method moves the paddle toward a height, no faster than a given speed.
 """
 
 from turtle import Turtle
 
+# Constants
+HALF_WIDTH = 10 # half the size of the paddle's shape, a 20-px square stretched 5 times vertically
+HALF_HEIGHT = 50
+LIMIT = 220 # the height past which the paddle stops moving away from the center
+AUTO_SPEED = 1500 # px/s for every unit of speed, the old loop moved the paddle 5 px per frame for every pixel of the ball
+
 
 class Paddle(Turtle):
     """
@@ -64,31 +72,53 @@ class Paddle(Turtle):
 
     def up(self):
         """ Moves the paddle upward by 40 units, ensuring it stays within the screen's top boundary. """
-        if self.ycor() < 220:
+        if self.ycor() < LIMIT:
             self.sety(self.ycor() + 40)
 
 
     def down(self):
         """ Moves the paddle downward by 40 units, ensuring it stays within the screen's bottom boundary. """
-        if self.ycor() > -220:
+        if self.ycor() > -LIMIT:
             self.sety(self.ycor() -40)
 
 
-    def move(self, speed):
+    def move(self, speed, dt):
         """
         Automatically moves the paddle up and down at a given speed, bouncing off the top and bottom boundaries.
 
         Parameters:
         -----------
         speed : int
-            The speed factor controlling how fast the paddle moves.
+            The speed factor controlling how fast the paddle moves, in units of `AUTO_SPEED`.
+        dt : float
+            The time step, in seconds.
         """
-        if self.ycor() < 220 and self.going_up:
-            self.sety(self.ycor() + 5 * speed)
+        distance = AUTO_SPEED * speed * dt
+        if self.ycor() < LIMIT and self.going_up:
+            self.sety(self.ycor() + distance)
         else:
             self.going_up = False
 
-        if self.ycor() > -220 and not self.going_up:
-            self.sety(self.ycor() - 5 * speed)
+        if self.ycor() > -LIMIT and not self.going_up:
+            self.sety(self.ycor() - distance)
         else:
             self.going_up = True
+
+
+    def move_to(self, target, max_speed, dt):
+        """
+        Moves the paddle toward a height, no faster than a given speed and within the screen's boundaries.
+
+        Parameters:
+        -----------
+        target : float
+            The y-coordinate the paddle's center moves toward.
+        max_speed : float
+            The highest speed of the paddle, in pixels per second.
+        dt : float
+            The time step, in seconds.
+        """
+        target = max(-LIMIT, min(LIMIT, target))
+        reach = max_speed * dt
+        offset = target - self.ycor()
+        self.sety(self.ycor() + max(-reach, min(reach, offset)))
@@ -0,0 +1,343 @@
+"""
+Snake Game arena
+
+This script defines the `Arena` class, a Snake game with many snakes and many food items on one large board.
+Every snake moves on every tick, and every head must be checked against the bodies of all the snakes, its own included.
+Instead of comparing each head with every other segment (which grows with the number of snakes times their length),
+all the snakes share one occupancy grid: a cell holds SNAKE, FOOD, WALL or nothing, and a second array holds the number of the snake on it.
+A single lookup of a new head's cell tells whether it hits a wall, a body or a food item, and which snake it ran into,
+and a dictionary of the new head cells finds the heads that meet on the same cell.
+The cost of a tick grows with the number of snakes that move, not with their length or the number of pairs.
+
+Classes:
+    - ArenaSnake: A class that holds one snake of the arena, played by a person or by a bot.
+    - Arena: A class that holds the board, the snakes and the food and runs the arena's ticks.
+
+Features:
+    - Moves all the snakes at once: the tails leave their cells first, then the heads move in.
+    - Kills a snake whose head hits a wall or a body, and both snakes whose heads meet on the same cell.
+    - Counts the kills of the snake that was run into.
+    - Keeps a number of food items on the board, each one respawned in O(1) on a random free cell.
+    - Respawns the dead snakes on a free part of the board.
+    - Steers the bot snakes with a simple greedy policy that avoids walls and bodies and goes for the food next to it.
+    - Plays the arena on a Turtle screen through a camera that follows the player's snake, with `python arena.py`.
+
+Usage:
+    python arena.py [--snakes 100] [--foods 200] [--board 200x200]
+"""
+
+from array import array
+import sys
+
+from options import option
+from engine import Board, CellRing, UP, DOWN, RIGHT, LEFT, START_LENGTH, EMPTY, SNAKE, FOOD, WALL
+
+# Constants for the arena
+COLUMNS = 200
+ROWS = 200
+SNAKES = 100
+FOODS = 200
+NOBODY = -1 # the owner of the cells that are not taken by a snake
+SPAWN_TRIES = 50 # random cells tried before a snake gives up respawning on this tick
+BOT_TURN_CHANCE = 0.1 # the chance that a bot turns when it does not have to
+INTERVAL = 0.075 # the time between two ticks when the arena is played on a screen, in seconds
+
+
+class ArenaSnake:
+    """
+    A class to hold one snake of the arena.
+
+    The body is a `CellRing` of cells from the head to the tail, like the body of `SnakeEngine`.
+    """
+
+    def __init__(self, number, bot=True):
+        """
+        Initializes the ArenaSnake object, the snake is placed on the board by `Arena.spawn`.
+
+        Args:
+            number (int): The number of the snake, its index in the arena's list of snakes.
+            bot (bool, optional): Whether the arena steers the snake, or a player does.
+        """
+        self.number = number
+        self.bot = bot
+        self.body = CellRing() # the cells of the snake, from head to tail
+        self.direction = RIGHT # the direction of the last move
+        self.grow = 0 # the number of moves left in which the tail stays in place
+        self.alive = False
+        self.score = 0 # the food eaten since the snake last spawned
+        self.kills = 0 # the snakes that died running into this one
+        self.deaths = 0
+
+    @property
+    def head(self):
+        """
+        int: The cell of the snake's head.
+        """
+        return self.body[0]
+
+
+class Arena(Board):
+    """
+    A class to run a Snake game of many snakes and many food items on one board.
+
+    `grid` holds the content of every cell and `owners` holds the number of the snake on every SNAKE cell.
+    `step()` advances all the snakes by one tick and returns the snakes that ate and the snakes that died,
+    and it keeps the snakes it spawned and the food cells it placed in `spawned` and `placed_food` until the next tick.
+    """
+
+    def __init__(self, snakes=SNAKES, foods=FOODS, seed=None, columns=COLUMNS, rows=ROWS, players=1, respawn=True):
+        """
+        Initializes the Arena object and spawns the snakes and the food.
+
+        Args:
+            snakes (int, optional): The number of snakes, players and bots together.
+            foods (int, optional): The number of food items kept on the board.
+            seed (int, optional): The seed of the random generator that places the snakes and the food and steers the bots.
+            columns (int, optional): The number of columns of the board.
+            rows (int, optional): The number of rows of the board.
+            players (int, optional): The number of snakes played by people, the first snakes of the list.
+            respawn (bool, optional): Whether dead snakes come back on the next ticks.
+        """
+        super().__init__(seed, columns, rows)
+        self.snakes = [ArenaSnake(number, bot=number >= players) for number in range(snakes)]
+        self.foods = foods
+        self.respawn = respawn
+        self.owners = array("i", [NOBODY]) * (self.width * self.height) # the number of the snake on each cell
+        self.food_count = 0 # the number of food items on the board
+        self.ticks = 0
+        self.spawned = [] # the snakes spawned on the last tick
+        self.placed_food = [] # the food cells placed on the last tick
+        self.reset()
+
+    def reset(self, seed=None):
+        """
+        Resets the arena: empties the board, spawns every snake and places the food.
+
+        Args:
+            seed (int, optional): A new seed for the random generator. The generator goes on if None.
+        """
+        if seed is not None:
+            self.random.seed(seed)
+        self.clear_board()
+        self.index_free_cells()
+        self.owners = array("i", [NOBODY]) * (self.width * self.height)
+        self.food_count = 0
+        self.ticks = 0
+        for snake in self.snakes:
+            snake.body.clear()
+            snake.alive = False
+            snake.score = snake.kills = snake.deaths = 0
+            self.spawn(snake)
+        self.respawn_food()
+
+    def spawn(self, snake):
+        """
+        Places a snake facing right on a random free cell that has room for its body on the left.
+
+        Args:
+            snake (ArenaSnake): The dead snake to place.
+
+        Returns:
+            bool: True if the snake was placed, False if no free place was found.
+        """
+        grid = self.grid
+        for _ in range(SPAWN_TRIES):
+            if not self.free_cells:
+                return False
+            head = self.free_cells[self.random.randrange(len(self.free_cells))]
+            # the cell in front of the head is free too, so the snake does not die on its first move
+            cells = [head - i for i in range(START_LENGTH)]
+            if all(grid[cell] == EMPTY for cell in cells) and grid[head + 1] == EMPTY:
+                break
+        else:
+            return False
+
+        snake.body.clear()
+        for cell in cells:
+            snake.body.append(cell)
+            grid[cell] = SNAKE
+            self.owners[cell] = snake.number
+            self.take_cell(cell)
+        snake.direction = RIGHT
+        snake.grow = 0
+        snake.score = 0
+        snake.alive = True
+        self.spawned.append(snake)
+        return True
+
+    def respawn_food(self):
+        """
+        Places food items on random free cells until the board has as many as it should, each one picked in O(1).
+        """
+        while self.food_count < self.foods and self.free_cells:
+            cell = self.free_cells[self.random.randrange(len(self.free_cells))]
+            self.take_cell(cell)
+            self.grid[cell] = FOOD
+            self.food_count += 1
+            self.placed_food.append(cell)
+
+    def bot_direction(self, snake):
+        """
+        Chooses the direction of a bot: food next to the head first, then the current direction, and another free direction
+        when the way ahead is blocked (or, now and then, to wander). The snake keeps its direction if it is trapped.
+
+        Args:
+            snake (ArenaSnake): The bot snake.
+
+        Returns:
+            int: The direction of the next move.
+        """
+        grid = self.grid
+        head = snake.body[0]
+        free = []
+        for direction in (snake.direction, (snake.direction + 90) % 360, (snake.direction + 270) % 360):
+            content = grid[head + self.moves[direction]]
+            if content == FOOD:
+                return direction
+            if content == EMPTY:
+                free.append(direction)
+        if not free:
+            return snake.direction
+        if free[0] == snake.direction and self.random.random() >= BOT_TURN_CHANCE:
+            return snake.direction
+        return self.random.choice(free)
+
+    def step(self, directions=None):
+        """
+        Advances the arena by one tick: turns the snakes, moves their tails and heads and checks for food and collisions.
+
+        Args:
+            directions (dict[int, int], optional): The directions the players turn to, by snake number. The bots steer themselves.
+
+        Returns:
+            tuple[list[ArenaSnake], list[ArenaSnake]]: The snakes that ate on this tick and the snakes that died on it.
+        """
+        directions = directions or {}
+        self.spawned = []
+        self.placed_food = []
+        grid = self.grid
+        owners = self.owners
+        moving = [snake for snake in self.snakes if snake.alive]
+
+        # turns the snakes, the same way `SnakeEngine.turn` does
+        for snake in moving:
+            direction = self.bot_direction(snake) if snake.bot else directions.get(snake.number)
+            if direction is not None and (direction - snake.direction) % 360 != 180:
+                snake.direction = direction
+
+        # the tails leave their cells before any head moves, unless the snake is growing
+        for snake in moving:
+            if snake.grow:
+                snake.grow -= 1
+            else:
+                tail = snake.body.pop()
+                grid[tail] = EMPTY
+                owners[tail] = NOBODY
+                self.release_cell(tail)
+
+        # counts the heads that move into each cell, two heads on the same cell both die
+        heads = {}
+        for snake in moving:
+            new_head = snake.body[0] + self.moves[snake.direction]
+            heads[new_head] = heads.get(new_head, 0) + 1
+
+        eaten = []
+        dead = []
+        for snake in moving:
+            new_head = snake.body[0] + self.moves[snake.direction]
+            content = grid[new_head]
+            if content == WALL or content == SNAKE or heads[new_head] > 1:
+                if content == SNAKE and owners[new_head] != snake.number:
+                    self.snakes[owners[new_head]].kills += 1
+                dead.append(snake)
+                continue
+            snake.body.appendleft(new_head)
+            grid[new_head] = SNAKE
+            owners[new_head] = snake.number
+            if content == EMPTY:
+                self.take_cell(new_head) # the food cell is already out of the free-cell index
+            else:
+                snake.grow += 1
+                snake.score += 1
+                self.food_count -= 1
+                eaten.append(snake)
+
+        # the bodies of the dead snakes are cleared once all the heads have moved, so no head moves into a cell that is cleared on the same tick
+        for snake in dead:
+            snake.alive = False
+            snake.deaths += 1
+            for cell in snake.body:
+                grid[cell] = EMPTY
+                owners[cell] = NOBODY
+                self.release_cell(cell)
+            snake.body.clear()
+
+        self.respawn_food()
+        if self.respawn:
+            for snake in self.snakes:
+                if not snake.alive:
+                    self.spawn(snake)
+        self.ticks += 1
+        return eaten, dead
+
+
+def play(snakes=SNAKES, foods=FOODS, columns=COLUMNS, rows=ROWS, interval=INTERVAL):
+    """
+    Plays an arena on a Turtle screen. The player's snake is steered with the arrow keys and followed by the camera,
+    and it comes back on the next tick when it dies, like the bots.
+
+    Args:
+        snakes (int, optional): The number of snakes, the player's and the bots.
+        foods (int, optional): The number of food items.
+        columns (int, optional): The number of columns of the board.
+        rows (int, optional): The number of rows of the board.
+        interval (float, optional): The time between two ticks, in seconds.
+    """
+    from turtle import Screen
+    from inputs import InputQueue
+    from scheduler import TickScheduler
+    from scoreboard import TextItem, SCORE_LOC, HIGHEST_SCORE_LOC
+    from viewport import ArenaView
+
+    screen = Screen()
+    screen.setup(width=600, height=600)
+    screen.bgcolor("black")
+    screen.title("Snake Game arena")
+    screen.tracer(0)
+
+    arena = Arena(snakes, foods, columns=columns, rows=rows)
+    player = arena.snakes[0]
+    view = ArenaView(arena, player)
+    score = TextItem(SCORE_LOC)
+    kills = TextItem(HIGHEST_SCORE_LOC)
+
+    def tick():
+        """
+        Runs one tick of the arena and draws the window around the player's snake.
+        """
+        direction = inputs.pop(player.direction) if player.alive else None
+        eaten, dead = arena.step({player.number: direction})
+        if player in dead:
+            inputs.clear()
+        view.draw()
+        score.set(f"Score: {player.score}")
+        kills.set(f"Kills: {player.kills}  Deaths: {player.deaths}")
+        screen.update()
+
+    scheduler = TickScheduler(screen, interval, tick)
+    inputs = InputQueue(scheduler.clock)
+    screen.onkey(lambda: inputs.push(UP), "Up")
+    screen.onkey(lambda: inputs.push(DOWN), "Down")
+    screen.onkey(lambda: inputs.push(LEFT), "Left")
+    screen.onkey(lambda: inputs.push(RIGHT), "Right")
+    screen.listen()
+    view.draw()
+    screen.update()
+    scheduler.start()
+    screen.mainloop()
+
+
+if __name__ == "__main__":
+    board_columns, board_rows = option(sys.argv[1:], "--board", f"{COLUMNS}x{ROWS}").lower().split("x")
+    play(int(option(sys.argv[1:], "--snakes", SNAKES)), int(option(sys.argv[1:], "--foods", FOODS)),
+         int(board_columns), int(board_rows))
@@ -0,0 +1,290 @@
+"""
+Snake Game autopilot
+
+This script defines the `Autopilot` class, which plays the Snake game by choosing the snake's direction on every tick.
+It searches the engine's occupancy grid with an A* search (a breadth-first search that looks at the cells closest to the target first)
+for the shortest path to the food, and only takes the path if a search shows that the snake could still reach its own tail after eating,
+so it does not trap itself.
+When there is no safe path it follows its tail, and when the tail cannot be reached it moves to the neighbouring cell with the most room.
+A safe path stays safe while the snake follows it, so it is searched once and reused on the next ticks until the food moves.
+Every search and flood fill stops after `limit` cells, so a tick takes a bounded time even on the largest boards:
+food further than that is approached along the path to the closest cell the search reached, which is reused like a path to the food,
+a tail further than that is treated as out of reach, and a snake with that much room is treated as safe.
+Following the tail can repeat forever when the food stays out of a safe reach, so the autopilot keeps count of the ticks since
+the snake last ate: after `patience` ticks it takes any path to the food, safe or not, and after twice as many it reports the snake
+as `starved`, so the game can end the round. The autopilot never steers into a wall or the snake on purpose.
+
+Classes:
+    - Autopilot: A class that chooses the snake's direction on every tick and measures the time it spends searching.
+
+Features:
+    - Finds the shortest path to the food with A* over the occupancy grid, visiting at most `limit` cells.
+    - Checks that the snake can reach its tail at the end of the path before taking it.
+    - Reuses the path to the food across ticks instead of searching from scratch on every tick.
+    - Reports a snake that went too long without eating as starved, so a tail-following loop does not go on forever.
+    - Reports the search time of every tick, and how many ticks went over the time budget.
+"""
+
+from collections import deque
+from heapq import heappush, heappop
+import time
+
+from engine import EMPTY, FOOD, WALL
+
+# Constants for the autopilot
+BUDGET = 0.025 # the time of a tick on the "Hardest" difficulty, in seconds
+SAMPLES = 500 # the number of recent ticks that the statistics are computed from
+LIMIT = 2_000 # the most cells a search or a flood fill visits, which keeps a tick within the budget on the largest boards
+
+
+class Autopilot:
+    """
+    A class to play the Snake game.
+
+    The autopilot reads the engine's grid and body but never changes them. `choose()` is called once per tick
+    before the engine steps, and its direction is passed to the engine like a key press.
+    """
+
+    def __init__(self, engine, budget=BUDGET, patience=None, limit=LIMIT):
+        """
+        Initializes the Autopilot object.
+
+        Args:
+            engine (SnakeEngine): The engine of the game to play.
+            budget (float, optional): The time a tick's search may take, in seconds.
+            patience (int, optional): The ticks without eating after which the autopilot takes unsafe paths to the food.
+                The number of cells of the board if None, enough for the snake to go around all of it.
+            limit (int, optional): The most cells a search or a flood fill visits.
+        """
+        self.engine = engine
+        self.budget = budget
+        self.patience = patience or engine.columns * engine.rows
+        self.limit = limit
+        self.truncated = False # whether the last search stopped at the limit before it could tell if the target is reachable
+        self.directions = {offset: direction for direction, offset in engine.moves.items()} # the direction of a move from its change of the cell index
+        self.offsets = tuple(engine.moves.values())
+        self.enabled = False # whether the autopilot controls the snake
+        self.path = deque() # the cells of the planned path to the food, from the next cell on
+        self.path_food = -1 # the food cell the path leads to
+        self.last_food = engine.food # the food cell of the previous tick, a new one means the snake ate
+        self.hungry = 0 # the ticks since the food last moved
+        self.search_times = deque(maxlen=SAMPLES) # the search time of each recent tick, in seconds
+        self.over_budget = 0 # the number of ticks whose search took longer than the budget
+
+    def toggle(self):
+        """
+        Turns the autopilot on or off.
+        """
+        self.enabled = not self.enabled
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets the planned path and the ticks without eating, for a new round or when the player hands over the snake.
+        """
+        self.path.clear()
+        self.path_food = -1
+        self.last_food = self.engine.food
+        self.hungry = 0
+
+    @property
+    def starved(self):
+        """
+        bool: Whether the snake went around the board twice without eating, the game should end the round.
+        """
+        return self.hungry > 2 * self.patience
+
+    def choose(self):
+        """
+        Chooses the direction of the next move and measures the time it took.
+
+        Returns:
+            int: The direction to pass to the engine, or None to keep the current direction.
+        """
+        start = time.perf_counter()
+        cell = self.next_cell()
+        elapsed = time.perf_counter() - start
+        self.search_times.append(elapsed)
+        if elapsed > self.budget:
+            self.over_budget += 1
+        if cell is None:
+            return None
+        return self.directions[cell - self.engine.head]
+
+    def next_cell(self):
+        """
+        Finds the cell the snake should move to next.
+
+        Returns:
+            int: The next cell, or None if every neighbouring cell is blocked.
+        """
+        engine = self.engine
+        head = engine.head
+        if engine.food != self.last_food:
+            self.last_food = engine.food
+            self.hungry = 0
+        self.hungry += 1
+
+        # the snake went around the board without eating, so following the tail will not open a safe path
+        if self.hungry > self.patience:
+            self.path.clear()
+            path = self.search(head, engine.food)
+            if path:
+                return path[0]
+
+        # the path from the previous ticks is still safe if the food did not move and it goes on from the head
+        if self.path and self.path_food == engine.food and self.path[0] - head in self.directions:
+            return self.path.popleft()
+
+        self.path.clear()
+        path = self.search(head, engine.food, partial=True)
+        if path and self.is_safe(path):
+            self.path = deque(path)
+            self.path_food = engine.food
+            return self.path.popleft()
+
+        # there is no safe path to the food, so the snake follows its tail to wait for one to open up
+        path = self.search(head, engine.tail)
+        if path and not (engine.grow and len(path) == 1): # a growing tail stays in its cell
+            return path[0]
+
+        # the tail cannot be reached, so the snake moves to the neighbouring cell with the most room
+        best_cell = None
+        best_room = -1
+        for offset in self.offsets:
+            cell = head + offset
+            if engine.grid[cell] in (EMPTY, FOOD):
+                room = self.room(cell)
+                if room > best_room:
+                    best_cell, best_room = cell, room
+        return best_cell
+
+    def search(self, start, target, blocked=None, partial=False):
+        """
+        Finds the shortest path between two cells with A*, using the distance along the rows and columns to the target.
+        Every cell that is not empty or food is blocked, except the target.
+        If a set of blocked cells is given, those cells and the walls are blocked instead (it describes a future snake).
+        The search gives up after visiting `limit` cells and sets `truncated`,
+        and returns the path to the cell closest to the target that it reached if partial is True.
+
+        Args:
+            start (int): The cell the path starts from (not included in the path).
+            target (int): The cell the path leads to.
+            blocked (set[int], optional): Cells to treat as taken instead of the engine's grid. The grid is used if None.
+            partial (bool, optional): Whether to return the path to the closest cell when the search stops at the limit.
+
+        Returns:
+            list[int]: The cells of the path, ending with the target, or None if the target cannot be reached within the limit.
+        """
+        grid = self.engine.grid
+        offsets = self.offsets
+        width = self.engine.width
+        target_row, target_column = divmod(target, width)
+        parents = {start: start}
+        steps = {start: 0} # the length of the shortest path found to each cell
+        row, column = divmod(start, width)
+        # the queue is ordered by the length of the path through a cell, and then by the longest path so far, which goes straight on an open board
+        queue = [(abs(row - target_row) + abs(column - target_column), 0, start)]
+        closest = (queue[0][0], start) # the distance to the target and the cell of the closest cell reached
+        self.truncated = False
+        while queue:
+            estimate, length, cell = heappop(queue)
+            length = -length
+            if cell == target:
+                return self.trace(parents, start, cell)
+            if length > steps[cell]:
+                continue # a shorter path to the cell was queued after this one
+            closest = min(closest, (estimate - length, cell))
+            if len(parents) > self.limit:
+                self.truncated = True
+                return self.trace(parents, start, closest[1]) if partial and closest[1] != start else None
+            length += 1
+            for offset in offsets:
+                neighbour = cell + offset
+                if length >= steps.get(neighbour, length + 1):
+                    continue
+                if neighbour != target:
+                    if blocked is None:
+                        if grid[neighbour] not in (EMPTY, FOOD):
+                            continue
+                    elif neighbour in blocked or grid[neighbour] == WALL:
+                        continue
+                parents[neighbour] = cell
+                steps[neighbour] = length
+                row, column = divmod(neighbour, width)
+                heappush(queue, (length + abs(row - target_row) + abs(column - target_column), -length, neighbour))
+        return None
+
+    def trace(self, parents, start, cell):
+        """
+        Follows the parents of a search back from a cell to the start.
+
+        Args:
+            parents (dict[int, int]): The cell each reached cell was reached from.
+            start (int): The cell the search started from (not included in the path).
+            cell (int): The cell the path leads to.
+
+        Returns:
+            list[int]: The cells of the path, ending with the cell.
+        """
+        path = []
+        while cell != start:
+            path.append(cell)
+            cell = parents[cell]
+        path.reverse()
+        return path
+
+    def is_safe(self, path):
+        """
+        Checks if the snake could still reach its tail after following the path and eating the food at its end.
+
+        Args:
+            path (list[int]): The cells of the path to the food.
+
+        Returns:
+            bool: True if the tail can be reached from the head at the end of the path, or if the search found `limit` cells of room.
+        """
+        engine = self.engine
+        length = len(engine.body) + engine.grow + 1 # the snake grows by one after eating
+        future_body = (path[::-1] + list(engine.body))[:length]
+        if len(future_body) < 2:
+            return True
+        return self.search(future_body[0], future_body[-1], blocked=set(future_body)) is not None or self.truncated
+
+    def room(self, start):
+        """
+        Counts the cells that can be reached from a cell with a flood fill, which stops after `limit` cells.
+
+        Args:
+            start (int): The cell to flood from.
+
+        Returns:
+            int: The number of reachable empty or food cells, including the start, at most `limit`.
+        """
+        grid = self.engine.grid
+        offsets = self.offsets
+        limit = self.limit
+        seen = {start}
+        queue = deque([start])
+        while queue and len(seen) < limit:
+            cell = queue.popleft()
+            for offset in offsets:
+                neighbour = cell + offset
+                if neighbour not in seen and grid[neighbour] in (EMPTY, FOOD):
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        return min(len(seen), limit)
+
+    def stats(self):
+        """
+        Returns the search time statistics of the recent ticks.
+
+        Returns:
+            dict[str, float]: The mean and maximum search time in milliseconds, and the number of ticks over the budget.
+        """
+        times = self.search_times or [0.0]
+        return {
+            "mean_ms": sum(times) / len(times) * 1000,
+            "max_ms": max(times) * 1000,
+            "over_budget": self.over_budget,
+        }
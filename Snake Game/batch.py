@@ -0,0 +1,177 @@
+"""
+Snake Game batch environment
+
+This script defines the `BatchSnakeEnv` class, which runs many Snake games in lockstep using NumPy arrays.
+Every game has the same board and rules as `SnakeEngine`: a grid with a wall border, a snake that grows on the tick after it eats,
+and food that respawns on a random free cell. All the games are advanced together by a single `step(actions)` call,
+which makes it possible to train and evaluate Snake bots at millions of steps per second.
+
+Classes:
+    - BatchSnakeEnv: A class that holds N Snake boards as arrays and steps all of them at once.
+
+Features:
+    - Stores the occupancy grids, head positions, direction codes, ring-buffer bodies and food cells of N games.
+    - Advances every game by one tick with vectorized NumPy operations, without a Python loop over the games.
+    - Applies the same wall, self and food collision rules as `SnakeEngine`.
+    - Automatically resets the games that ended on the tick.
+"""
+
+import numpy as np
+from engine import UP, DOWN, RIGHT, LEFT, MOVES, WIDTH, HEIGHT, COLUMNS, ROWS, START_LENGTH, EMPTY, SNAKE, FOOD, WALL, SnakeEngine
+
+# Constants for the direction codes used by the actions (-1 keeps the current direction)
+DIRECTIONS = (UP, DOWN, RIGHT, LEFT)
+OFFSETS = np.array([MOVES[direction] for direction in DIRECTIONS], dtype=np.int32)
+OPPOSITES = np.array([1, 0, 3, 2], dtype=np.int8)
+KEEP = -1
+CELLS = WIDTH * HEIGHT
+CAPACITY = COLUMNS * ROWS # the longest possible snake
+RESPAWN_TRIES = 8 # random draws before the free cells of a board are listed one by one
+
+
+class BatchSnakeEnv:
+    """
+    A class to run N Snake games in lockstep.
+
+    The body of each snake is a ring buffer of cells: `head_index` points to the head, and the rest of the body follows it
+    (wrapping around the end of the buffer) for `length` cells. A move writes the new head before the current one
+    and shortens the snake from the tail, so it costs the same no matter how long the snakes are.
+    """
+
+    def __init__(self, n, seed=None):
+        """
+        Initializes the BatchSnakeEnv object with N new games.
+
+        Args:
+            n (int): The number of games to run.
+            seed (int, optional): The seed of the random generator used to place the food.
+        """
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.games = np.arange(n)
+
+        # an engine in its initial state is the template for the reset boards
+        template = SnakeEngine()
+        template.grid[template.food] = EMPTY
+        self.start_grid = np.frombuffer(bytes(template.grid), dtype=np.uint8)
+        self.start_body = np.array(template.body, dtype=np.int32)
+        self.playable = np.flatnonzero(self.start_grid != WALL).astype(np.int32)
+
+        self.grid = np.empty((n, CELLS), dtype=np.uint8) # the occupancy grid of each game
+        self.body = np.zeros((n, CAPACITY), dtype=np.int32) # the ring-buffer body of each game
+        self.head_index = np.zeros(n, dtype=np.int32) # the position of the head in the ring buffer
+        self.length = np.zeros(n, dtype=np.int32)
+        self.direction = np.zeros(n, dtype=np.int8) # the code of the direction of the last move
+        self.grow = np.zeros(n, dtype=np.int32) # the number of moves left in which the tail stays in place
+        self.food = np.zeros(n, dtype=np.int32)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.reset()
+
+    @property
+    def heads(self):
+        """
+        np.ndarray: The cell of the head of every snake.
+        """
+        return self.body[self.games, self.head_index]
+
+    def reset(self, games=None):
+        """
+        Resets the given games to their initial state, a three-cell snake facing right and a new food cell.
+
+        Args:
+            games (np.ndarray, optional): The indexes of the games to reset. All the games are reset if None.
+        """
+        if games is None:
+            games = self.games
+        if len(games) == 0:
+            return
+        self.grid[games] = self.start_grid
+        self.body[games, :START_LENGTH] = self.start_body
+        self.head_index[games] = 0
+        self.length[games] = START_LENGTH
+        self.direction[games] = DIRECTIONS.index(RIGHT)
+        self.grow[games] = 0
+        self.score[games] = 0
+        self.respawn_food(games)
+
+    def step(self, actions):
+        """
+        Advances every game by one tick: turns the snakes, moves them one cell forward and checks for food and collisions.
+        The games that ended on this tick are reset before returning.
+
+        Args:
+            actions (np.ndarray): The direction code (an index of DIRECTIONS) of every game, or KEEP to keep its direction.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (ate, died), boolean arrays of the games that ate the food and the games that collided.
+        """
+        games = self.games
+        grid = self.grid
+        actions = np.asarray(actions, dtype=np.int8)
+
+        # changes the direction of the snakes that are not reversed onto themselves
+        turning = (actions != KEEP) & (actions != OPPOSITES[self.direction])
+        self.direction = np.where(turning, actions, self.direction)
+
+        new_heads = self.body[games, self.head_index] + OFFSETS[self.direction]
+
+        # snake collision with the wall
+        hit_wall = grid[games, new_heads] == WALL
+
+        # the tails leave their cells before the heads move, unless the snakes are growing
+        moving = ~hit_wall
+        growing = moving & (self.grow > 0)
+        self.grow[growing] -= 1
+        popping = np.flatnonzero(moving & ~growing)
+        tails = self.body[popping, (self.head_index[popping] + self.length[popping] - 1) % CAPACITY]
+        grid[popping, tails] = EMPTY
+        self.length[popping] -= 1
+
+        # snake collision with its own body
+        content = grid[games, new_heads]
+        died = hit_wall | (content == SNAKE)
+        alive = np.flatnonzero(~died)
+        alive_heads = new_heads[alive]
+        self.head_index[alive] = (self.head_index[alive] - 1) % CAPACITY
+        self.body[alive, self.head_index[alive]] = alive_heads
+        grid[alive, alive_heads] = SNAKE
+        self.length[alive] += 1
+
+        # snake collision with food
+        ate = np.zeros(self.n, dtype=bool)
+        ate[alive] = content[alive] == FOOD
+        eaters = np.flatnonzero(ate)
+        self.grow[eaters] += 1
+        self.score[eaters] += 1
+        self.respawn_food(eaters)
+
+        self.reset(np.flatnonzero(died))
+        return ate, died
+
+    def respawn_food(self, games):
+        """
+        Places the food of the given games on a random cell that is not taken by the snake.
+
+        Args:
+            games (np.ndarray): The indexes of the games whose food should respawn.
+        """
+        # draws random cells for all the games at once and draws again only for those that landed on the snake
+        pending = games
+        for i in range(RESPAWN_TRIES):
+            if len(pending) == 0:
+                return
+            cells = self.playable[self.rng.integers(len(self.playable), size=len(pending))]
+            free = self.grid[pending, cells] == EMPTY
+            placed = pending[free]
+            self.food[placed] = cells[free]
+            self.grid[placed, cells[free]] = FOOD
+            pending = pending[~free]
+
+        # the boards of the games that are left are mostly full, so their free cells are listed
+        for game in pending:
+            free_cells = np.flatnonzero(self.grid[game] == EMPTY)
+            if len(free_cells) == 0:
+                self.food[game] = -1 # -1 means the board is full
+            else:
+                self.food[game] = free_cells[self.rng.integers(len(free_cells))]
+                self.grid[game, self.food[game]] = FOOD
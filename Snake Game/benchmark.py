@@ -0,0 +1,533 @@
+"""
+Snake Game benchmarks
+
+This script measures the speed of the Snake game's building blocks, so changes to them can be compared before and after.
+Each benchmark is a function that prints its results, and the benchmarks to run are chosen by name on the command line.
+
+Usage:
+    python benchmark.py engine batch
+
+The benchmarks that draw the game (pool, render, ticks, scoreboard, viewport, memory) open a Turtle screen.
+
+Features:
+    - engine: Steps of a single `SnakeEngine` per second.
+    - batch: Steps of a `BatchSnakeEnv` per second, counting every game in the batch.
+    - pool: Turtles created, canvas items and memory across many play-again rounds of a `Snake` with a `SegmentPool`.
+    - render: Time to draw one frame of the snake in the "follow", "recycle", "stamp" and "smooth" rendering modes, for short and long snakes,
+      and of a frame drawn between two ticks in "smooth" mode.
+    - ticks: Measured tick interval and jitter of a `TickScheduler` at the speed of every difficulty.
+    - scoreboard: Frame time of a point scored with a full scoreboard redraw and with the layered `ScoreBoard`.
+    - highscores: Time to load a `HighScoreStore` journal of many games and to query its leaderboards.
+    - autopilot: Scores of headless games played by the `Autopilot`, and its search time per tick against the "Hardest" tick budget.
+    - viewport: Frame time of a `ViewportSnake` for boards of different sizes and long snakes, which should only depend on the size of the window.
+    - arena: Ticks per second of an `Arena` of 10, 100 and 1000 snakes, against a pairwise check of every head against every segment.
+    - inputs: Key presses lost when quick double presses set the direction directly, against an `InputQueue`, and the queue's latency.
+    - memory: Bytes per segment of a body stored in a deque against a `CellRing`, and of a drawn snake with a turtle per segment against stamps.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from engine import SnakeEngine, UP, DOWN, RIGHT, LEFT, COLUMNS, ROWS, WIDTH
+
+# Constants for the benchmark sizes
+ENGINE_STEPS = 1_000_000
+BATCH_GAMES = 4096
+BATCH_STEPS = 250
+POOL_ROUNDS = 300
+POOL_GROWTH = 40 # extra segments added to the snake in every round
+RENDER_LENGTHS = (3, 50, 200, 750) # the cycle the snake follows has room for 754 segments
+RENDER_FRAMES = 200
+CYCLE_ROWS = 26
+TICKS = 80 # ticks measured at every difficulty
+DIFFICULTY_FACTOR = 40
+SCORE_POINTS = 200
+HIGHSCORE_GAMES = 300_000
+HIGHSCORE_PLAYERS = 1000
+AUTOPILOT_GAMES = 20
+AUTOPILOT_PATIENCE = 4 * COLUMNS * ROWS # a game that goes this many ticks without eating is stopped, the autopilot is chasing its tail
+VIEWPORT_BOARDS = ((COLUMNS, ROWS), (200, 200), (500, 500), (1000, 1000))
+VIEWPORT_LENGTHS = (50, 2000, 20000) # the lengths are capped to what the cycle of the board has room for
+VIEWPORT_CYCLE_ROWS = 40
+VIEWPORT_FRAMES = 300
+ARENA_SIZES = ((10, 200), (100, 200), (1000, 500)) # (snakes, board columns and rows)
+ARENA_TICKS = 500
+ARENA_PAIRWISE_TICKS = 50 # the pairwise check is slow, so it runs on fewer ticks
+INPUT_TICKS = 100_000
+INPUT_INTERVAL = 0.025 # the tick of the "Hardest" difficulty, in seconds
+INPUT_DOUBLE = 0.15 # the chance that the player presses two keys within a tick
+INPUT_SINGLE = 0.15 # the chance that the player presses one key within a tick
+MEMORY_LENGTHS = (1000, 100_000, 1_000_000)
+MEMORY_DRAWN_LENGTH = 750
+
+
+def cycle_direction(cell, width=WIDTH, cycle_rows=CYCLE_ROWS):
+    """
+    Returns the direction that keeps the snake on a cycle over the bottom rows of the grid, so it can move forever without dying.
+    The even rows are crossed to the right, the odd rows to the left, and the first column leads back down to the bottom row.
+
+    Args:
+        cell (int): The cell of the snake's head.
+        width (int, optional): The width of the engine's grid, the classic board's if not given.
+        cycle_rows (int, optional): The number of rows of the cycle, an even number.
+
+    Returns:
+        int: The direction of the next move.
+    """
+    row, column = divmod(cell, width)
+    row, column = row - 1, column - 1
+    if column == 0:
+        return DOWN if row > 0 else RIGHT
+    if row % 2 == 0:
+        return RIGHT if column < width - 3 else UP
+    if column > 1 or row == cycle_rows - 1:
+        return LEFT
+    return UP
+
+
+def bench_engine():
+    """
+    Measures how many steps per second a single engine runs with random turns, resetting it after every game over.
+    """
+    engine = SnakeEngine()
+    turns = [random.choice((None, None, None, UP, DOWN, RIGHT, LEFT)) for i in range(ENGINE_STEPS)]
+    start = time.perf_counter()
+    for direction in turns:
+        ate, died = engine.step(direction)
+        if died:
+            engine.reset()
+    elapsed = time.perf_counter() - start
+    print(f"engine: {ENGINE_STEPS / elapsed:,.0f} steps/s")
+
+
+def bench_batch():
+    """
+    Measures how many game steps per second a batch environment runs with random actions.
+    """
+    import numpy as np
+    from batch import BatchSnakeEnv, KEEP
+
+    env = BatchSnakeEnv(BATCH_GAMES, seed=0)
+    actions = np.random.default_rng(0).integers(KEEP, 4, size=(BATCH_STEPS, BATCH_GAMES), dtype=np.int8)
+    start = time.perf_counter()
+    for step_actions in actions:
+        env.step(step_actions)
+    elapsed = time.perf_counter() - start
+    print(f"batch: {BATCH_GAMES * BATCH_STEPS / elapsed:,.0f} steps/s ({BATCH_GAMES} games)")
+
+
+def bench_pool():
+    """
+    Plays many short rounds, growing the snake in each one, and checks that the turtles, the canvas items and the memory stay flat.
+    """
+    from turtle import Screen
+    from snake import Snake, RECYCLE
+
+    screen = Screen()
+    screen.tracer(0)
+    canvas = screen.getcanvas()
+    engine = SnakeEngine()
+    snake = Snake(engine, render_mode=RECYCLE)
+    tracemalloc.start()
+    for game in range(1, POOL_ROUNDS + 1):
+        engine.grow = POOL_GROWTH
+        died = False
+        while not died:
+            snake.next_direction = random.choice((None, None, None, UP, DOWN, RIGHT, LEFT))
+            ate, died = snake.move_forward()
+        screen.update()
+        snake.reset()
+        if game % (POOL_ROUNDS // 5) == 0:
+            memory = tracemalloc.get_traced_memory()[0]
+            print(f"pool: round {game}: {snake.pool.counters()}, "
+                  f"{len(canvas.find_all())} canvas items, {memory / 1024:,.0f} KiB")
+    tracemalloc.stop()
+
+
+def bench_render():
+    """
+    Measures the average time of a frame (a move of the snake and a screen update) for snakes of different lengths in every rendering mode.
+    In "smooth" mode it also measures the frames drawn between the ticks, which only slide the head and the tail.
+    """
+    from turtle import Screen
+    from snake import Snake, FOLLOW, RECYCLE, STAMP, SMOOTH
+
+    screen = Screen()
+    screen.tracer(0)
+    for render_mode in (FOLLOW, RECYCLE, STAMP, SMOOTH):
+        engine = SnakeEngine()
+        snake = Snake(engine, render_mode=render_mode)
+        for length in RENDER_LENGTHS:
+            grow_on_cycle(snake, engine, length)
+
+            start = time.perf_counter()
+            for frame in range(RENDER_FRAMES):
+                snake.next_direction = cycle_direction(engine.head)
+                snake.move_forward()
+                screen.update()
+            elapsed = time.perf_counter() - start
+            print(f"render: {render_mode}, length {len(engine.body)}: {elapsed / RENDER_FRAMES * 1000:.3f} ms/frame")
+
+            if render_mode == SMOOTH:
+                start = time.perf_counter()
+                for frame in range(RENDER_FRAMES):
+                    snake.draw_frame(frame / RENDER_FRAMES)
+                    screen.update()
+                elapsed = time.perf_counter() - start
+                print(f"render: {render_mode}, length {len(engine.body)}: {elapsed / RENDER_FRAMES * 1000:.3f} ms/frame between ticks")
+        snake.reset()
+
+
+def bench_ticks():
+    """
+    Runs a snake on a tick scheduler at the speed of every difficulty and prints the measured interval and jitter of the ticks.
+    """
+    from turtle import Screen
+    from menu import MENU_BUTTONS_TEXT
+    from scheduler import TickScheduler
+    from snake import Snake
+
+    screen = Screen()
+    screen.tracer(0)
+    engine = SnakeEngine()
+    snake = Snake(engine)
+    difficulties = list(enumerate(MENU_BUTTONS_TEXT, start=1))
+
+    def run_next():
+        """
+        Starts a scheduler for the next difficulty, or closes the screen after the last one.
+        """
+        if not difficulties:
+            screen.bye()
+            return
+        difficulty, name = difficulties.pop(0)
+
+        def tick():
+            """
+            Moves the snake along the cycle and stops after the measured number of ticks.
+            """
+            snake.next_direction = cycle_direction(engine.head)
+            snake.move_forward()
+            screen.update()
+            if scheduler.ticks == TICKS:
+                scheduler.stop()
+                stats = scheduler.stats()
+                print(f"ticks: {name}: target {stats['target_ms']:.1f} ms, mean {stats['mean_interval_ms']:.2f} ms, "
+                      f"jitter {stats['jitter_ms']:.2f} ms, max late {stats['max_late_ms']:.2f} ms, skipped {stats['skipped']}")
+                run_next()
+
+        scheduler = TickScheduler(screen, difficulty / DIFFICULTY_FACTOR, tick)
+        scheduler.start()
+
+    run_next()
+    screen.mainloop()
+
+
+def bench_scoreboard():
+    """
+    Measures the frame time of scoring a point when the whole scoreboard is redrawn (the way it was drawn before it had layers)
+    and when only the changed value of the layered scoreboard is rewritten.
+    """
+    from turtle import Screen, Turtle
+    from scoreboard import ScoreBoard, UPPER_LINE
+
+    screen = Screen()
+    screen.tracer(0)
+
+    # the full redraw clears the turtle, draws the boundary line and writes the whole text on every point
+    board = Turtle()
+    board.penup()
+    board.hideturtle()
+    start = time.perf_counter()
+    for score in range(SCORE_POINTS):
+        board.clear()
+        board.goto(UPPER_LINE)
+        board.pendown()
+        board.pensize(width=2)
+        board.forward(600)
+        board.penup()
+        board.goto(0, 260)
+        board.write(arg=f"Score: {score} | Highest score: 0 | Difficulty: Normal", align="center", font=("Arial", 20, "normal"))
+        screen.update()
+    full = time.perf_counter() - start
+    board.clear()
+
+    scoreboard = ScoreBoard(2)
+    start = time.perf_counter()
+    for score in range(SCORE_POINTS):
+        scoreboard.increase()
+        screen.update()
+    layered = time.perf_counter() - start
+    print(f"scoreboard: full redraw {full / SCORE_POINTS * 1000:.3f} ms/frame, "
+          f"layered {layered / SCORE_POINTS * 1000:.3f} ms/frame")
+
+
+def bench_highscores():
+    """
+    Writes a journal of many games by many players to a temporary directory and measures loading it, querying it and recording a game.
+    """
+    from highscores import HighScoreStore
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "scores.log")
+        with open(path, mode="w", encoding="utf-8") as journal:
+            for game in range(HIGHSCORE_GAMES):
+                journal.write(f"{random.randrange(5)}\t{random.randrange(200)}\tplayer{random.randrange(HIGHSCORE_PLAYERS)}\n")
+
+        start = time.perf_counter()
+        store = HighScoreStore(path)
+        loaded = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for difficulty in range(5):
+            store.top(difficulty, 10)
+        queried = (time.perf_counter() - start) / 5
+
+        start = time.perf_counter()
+        store.record("player0", 0, 500)
+        recorded = time.perf_counter() - start
+        print(f"highscores: load {HIGHSCORE_GAMES:,} games {loaded * 1000:.1f} ms, "
+              f"top 10 {queried * 1e6:.1f} us, record {recorded * 1000:.2f} ms (compacted to {store.lines:,} lines)")
+
+
+def bench_autopilot():
+    """
+    Plays headless games with the autopilot and prints their scores and the time the autopilot searched on every tick.
+    """
+    from autopilot import Autopilot
+
+    scores = []
+    search_times = []
+    over_budget = 0
+    starved = 0 # the games stopped because the snake went too long without eating
+    for game in range(AUTOPILOT_GAMES):
+        engine = SnakeEngine(game)
+        autopilot = Autopilot(engine)
+        score = 0
+        hungry = 0 # the ticks since the snake last ate
+        died = False
+        while not died and hungry < AUTOPILOT_PATIENCE:
+            ate, died = engine.step(autopilot.choose())
+            score += ate
+            hungry = 0 if ate else hungry + 1
+            search_times.append(autopilot.search_times[-1])
+        starved += not died
+        scores.append(score)
+        over_budget += autopilot.over_budget
+    print(f"autopilot: mean score {sum(scores) / len(scores):.1f}, best {max(scores)}, {starved} of {AUTOPILOT_GAMES} games starved, "
+          f"search {sum(search_times) / len(search_times) * 1000:.3f} ms/tick mean, {max(search_times) * 1000:.3f} ms max, "
+          f"{over_budget} of {len(search_times):,} ticks over the {autopilot.budget * 1000:.0f} ms budget")
+
+
+def bench_viewport():
+    """
+    Measures the time of a frame of a `ViewportSnake` on boards of different sizes with snakes of different lengths.
+    The snake follows a cycle along the rows of the board, so on the large boards the camera scrolls on most frames.
+    """
+    from turtle import Screen
+    from snake import SegmentPool
+    from viewport import ViewportSnake
+
+    screen = Screen()
+    screen.tracer(0)
+    pool = SegmentPool()
+    for columns, rows in VIEWPORT_BOARDS:
+        engine = SnakeEngine(0, columns, rows)
+        cycle_rows = min(VIEWPORT_CYCLE_ROWS, rows - rows % 2)
+        snake = ViewportSnake(engine, pool)
+        for length in sorted({min(length, cycle_rows * (columns - 1) - 1) for length in VIEWPORT_LENGTHS}):
+            # grows the snake along the cycle without drawing it, then draws the window around its head
+            engine.grow = max(0, length - len(engine.body))
+            while len(engine.body) < length:
+                engine.step(cycle_direction(engine.head, engine.width, cycle_rows))
+            engine.grow = 0
+            snake.center()
+
+            frame_times = []
+            for frame in range(VIEWPORT_FRAMES):
+                start = time.perf_counter()
+                snake.next_direction = cycle_direction(engine.head, engine.width, cycle_rows)
+                snake.move_forward()
+                screen.update()
+                frame_times.append(time.perf_counter() - start)
+            print(f"viewport: board {columns}x{rows}, length {len(engine.body):,}: "
+                  f"{sum(frame_times) / len(frame_times) * 1000:.3f} ms/frame, {max(frame_times) * 1000:.3f} ms max, "
+                  f"{len(snake.segments)} segments drawn, {pool.created} turtles created")
+        snake.clear()
+
+
+def pairwise_collisions(arena):
+    """
+    Finds the snakes whose next head cell is taken by a body, by comparing every head with every segment of every snake.
+    This is the quadratic check (like comparing `Turtle.distance` of every pair) that the arena's shared grid replaces.
+
+    Args:
+        arena (Arena): The arena, with the directions of the snakes already chosen.
+
+    Returns:
+        int: The number of heads that would hit a body.
+    """
+    hits = 0
+    for snake in arena.snakes:
+        if not snake.alive:
+            continue
+        new_head = snake.body[0] + arena.moves[snake.direction]
+        for other in arena.snakes:
+            if new_head in other.body: # a linear scan of the body
+                hits += 1
+                break
+    return hits
+
+
+def bench_arena():
+    """
+    Measures the ticks per second of arenas of bots of different sizes, and the time of one tick's pairwise collision check for comparison.
+    """
+    from arena import Arena
+
+    for snakes, size in ARENA_SIZES:
+        arena = Arena(snakes, 2 * snakes, seed=0, columns=size, rows=size, players=0)
+        # lets the snakes grow for a while before measuring
+        for tick in range(ARENA_TICKS):
+            arena.step()
+        start = time.perf_counter()
+        for tick in range(ARENA_TICKS):
+            arena.step()
+        elapsed = (time.perf_counter() - start) / ARENA_TICKS
+
+        segments = sum(len(snake.body) for snake in arena.snakes)
+        start = time.perf_counter()
+        for tick in range(ARENA_PAIRWISE_TICKS):
+            pairwise_collisions(arena)
+        pairwise = (time.perf_counter() - start) / ARENA_PAIRWISE_TICKS
+        print(f"arena: {snakes} snakes on {size}x{size} ({segments:,} segments): {1 / elapsed:,.0f} ticks/s, "
+              f"{elapsed * 1000:.3f} ms/tick with bots and food, {elapsed / snakes * 1e6:.1f} us per snake, "
+              f"pairwise collision check alone {pairwise * 1000:.3f} ms/tick")
+
+
+def bench_inputs():
+    """
+    Simulates a fast player who often presses two turns within one tick, and counts the presses that never turn the snake
+    when the key callback sets the direction directly and when the presses go through an `InputQueue`.
+    The presses are timed with a virtual clock, so the latencies are exact.
+    """
+    from inputs import InputQueue
+
+    for mode in ("direct", "queue"):
+        rng = random.Random(0)
+        now = [0.0] # the virtual clock, in seconds
+        inputs = InputQueue(clock=lambda: now[0])
+        engine = SnakeEngine(0)
+        intended = engine.direction # the direction the player wants after the presses so far
+        next_direction = None
+        presses = 0
+        turns = 0
+        for tick in range(INPUT_TICKS):
+            chance = rng.random()
+            count = 2 if chance < INPUT_DOUBLE else 1 if chance < INPUT_DOUBLE + INPUT_SINGLE else 0
+            for offset in sorted(rng.random() * INPUT_INTERVAL for _ in range(count)):
+                now[0] = tick * INPUT_INTERVAL + offset
+                intended = (intended + rng.choice((90, 270))) % 360 # a turn to the left or right of the intended direction
+                presses += 1
+                if mode == "direct":
+                    next_direction = intended
+                else:
+                    inputs.push(intended)
+
+            now[0] = (tick + 1) * INPUT_INTERVAL
+            if mode == "queue":
+                next_direction = inputs.pop(engine.direction)
+            direction = engine.direction
+            died = engine.step(next_direction)[1]
+            turns += engine.direction != direction
+            next_direction = None
+            if died:
+                engine.reset()
+                inputs.clear()
+                intended = engine.direction
+
+        line = f"inputs: {mode}: {presses:,} presses, {turns:,} turns, {presses - turns:,} lost"
+        if mode == "queue":
+            stats = inputs.stats()
+            line += (f" ({stats['dropped']} dropped), latency {stats['mean_ms']:.1f} ms mean, {stats['max_ms']:.1f} ms max, "
+                     f"{stats['max_ticks']} ticks max, {stats['carried_over']} of the last {len(inputs.waits)} carried over")
+        print(line)
+
+
+def grow_on_cycle(snake, engine, length):
+    """
+    Grows a drawn snake along the cycle over the bottom rows until it reaches a length.
+
+    Args:
+        snake (Snake): The snake that draws the engine.
+        engine (SnakeEngine): The engine of the snake.
+        length (int): The length to reach.
+    """
+    engine.grow = max(0, length - len(engine.body))
+    while len(engine.body) < length:
+        snake.next_direction = cycle_direction(engine.head)
+        snake.move_forward()
+    engine.grow = 0
+
+
+def bench_memory():
+    """
+    Measures the memory a segment of the snake takes, first for the cells of the body alone and then for a snake drawn on the screen.
+    The traced memory counts the Python objects only: the canvas items of the segments (one per segment in every mode) live in Tk.
+    """
+    from collections import deque
+    from turtle import Screen
+    from engine import CellRing
+    from snake import Snake, RECYCLE, STAMP
+
+    # the cells of a large board, past the small ints Python keeps cached
+    for length in MEMORY_LENGTHS:
+        for name, make in (("deque", deque), ("CellRing", CellRing)):
+            tracemalloc.start()
+            body = make()
+            for cell in range(1000, 1000 + length):
+                body.appendleft(cell)
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del body
+            print(f"memory: body of {length:,} cells in a {name}: {memory / length:.1f} bytes/segment")
+
+    screen = Screen()
+    screen.tracer(0)
+    canvas = screen.getcanvas()
+    for render_mode in (RECYCLE, STAMP):
+        items = len(canvas.find_all())
+        tracemalloc.start()
+        engine = SnakeEngine()
+        snake = Snake(engine, render_mode=render_mode)
+        grow_on_cycle(snake, engine, MEMORY_DRAWN_LENGTH)
+        screen.update()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"memory: {render_mode}, length {len(engine.body)}: {memory / len(engine.body):,.0f} bytes/segment, "
+              f"{snake.pool.created} turtles, {len(canvas.find_all()) - items} canvas items")
+        snake.reset()
+
+
+BENCHMARKS = {
+    "engine": bench_engine,
+    "batch": bench_batch,
+    "pool": bench_pool,
+    "render": bench_render,
+    "ticks": bench_ticks,
+    "scoreboard": bench_scoreboard,
+    "highscores": bench_highscores,
+    "autopilot": bench_autopilot,
+    "viewport": bench_viewport,
+    "arena": bench_arena,
+    "inputs": bench_inputs,
+    "memory": bench_memory,
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
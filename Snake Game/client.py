@@ -0,0 +1,153 @@
+"""
+Snake Game client
+
+This script connects to a Snake server (see server.py) and plays one of the snakes of its arena on a Turtle screen.
+The client has no game rules: it sends the arrow keys to the server as directions, applies the snapshot and the deltas it gets to a
+`Mirror` of the arena, and draws the mirror with the same `ArenaView` as the local arena game.
+The socket is non-blocking and read from a Turtle timer, so the window keeps handling its events while it waits for the server.
+
+Classes:
+    - Connection: A class that reads the framed messages of the server from a non-blocking socket and sends the turns.
+
+Features:
+    - Draws the arena through a camera that follows the client's snake.
+    - Applies all the ticks that arrived since the last poll and draws the board once.
+    - Shows the score, the deaths and the time the server took for its last tick.
+
+Usage:
+    python client.py [--host 127.0.0.1] [--port 5005]
+"""
+
+import socket
+import sys
+
+from options import option
+from engine import UP, DOWN, RIGHT, LEFT
+from protocol import DIRECTIONS, LENGTH, Mirror
+
+# Constants for the client
+HOST = "127.0.0.1"
+PORT = 5005
+POLL_INTERVAL = 10 # the time between two reads of the socket, in milliseconds
+READ_SIZE = 65536
+
+
+class Connection:
+    """
+    A class to exchange messages with the server over a non-blocking TCP socket.
+    """
+
+    def __init__(self, host=HOST, port=PORT):
+        """
+        Initializes the Connection object and connects to the server.
+
+        Args:
+            host (str, optional): The address of the server.
+            port (int, optional): The TCP port of the server.
+        """
+        self.socket = socket.create_connection((host, port))
+        self.socket.setblocking(False)
+        self.buffer = bytearray() # the bytes received that do not make a whole message yet
+        self.closed = False
+
+    def receive(self):
+        """
+        Reads what the server sent since the last call, without waiting.
+
+        Returns:
+            list[bytes]: The whole messages received, in order.
+        """
+        while not self.closed:
+            try:
+                data = self.socket.recv(READ_SIZE)
+            except BlockingIOError:
+                break
+            except ConnectionError:
+                data = b""
+            if not data:
+                self.closed = True
+                break
+            self.buffer += data
+
+        messages = []
+        offset = 0
+        while len(self.buffer) - offset >= LENGTH.size:
+            length, = LENGTH.unpack_from(self.buffer, offset)
+            if len(self.buffer) - offset - LENGTH.size < length:
+                break
+            offset += LENGTH.size
+            messages.append(bytes(self.buffer[offset:offset + length]))
+            offset += length
+        del self.buffer[:offset]
+        return messages
+
+    def send_turn(self, direction):
+        """
+        Sends a direction to turn to.
+
+        Args:
+            direction (int): The direction, such as UP.
+        """
+        if not self.closed:
+            try:
+                self.socket.send(bytes([DIRECTIONS.index(direction)]))
+            except (BlockingIOError, ConnectionError):
+                pass
+
+
+def play(host=HOST, port=PORT):
+    """
+    Plays a snake of a server's arena on a Turtle screen until the window is closed or the server goes away.
+
+    Args:
+        host (str, optional): The address of the server.
+        port (int, optional): The TCP port of the server.
+    """
+    from turtle import Screen
+    from scoreboard import TextItem, SCORE_LOC, HIGHEST_SCORE_LOC
+    from viewport import ArenaView
+
+    connection = Connection(host, port)
+    screen = Screen()
+    screen.setup(width=600, height=600)
+    screen.bgcolor("black")
+    screen.title(f"Snake Game - {host}:{port}")
+    screen.tracer(0)
+    score = TextItem(SCORE_LOC)
+    status = TextItem(HIGHEST_SCORE_LOC)
+    game = {} # the mirror and its view, once the snapshot arrived
+
+    def poll():
+        """
+        Applies the messages that arrived and draws the board if anything changed.
+        """
+        messages = connection.receive()
+        if messages and "mirror" not in game:
+            game["mirror"] = Mirror(messages.pop(0))
+            game["view"] = ArenaView(game["mirror"], game["mirror"].player)
+        mirror = game.get("mirror")
+        if mirror is not None and (messages or "drawn" not in game):
+            for message in messages:
+                mirror.apply(message)
+            game["view"].draw()
+            game["drawn"] = True
+            score.set(f"Score: {mirror.player.score}")
+            status.set(f"Deaths: {mirror.player.deaths}  Server tick: {mirror.work * 1000:.1f} ms")
+            screen.update()
+        if connection.closed:
+            status.set("Disconnected from the server")
+            screen.update()
+            return
+        screen.ontimer(poll, POLL_INTERVAL)
+
+    screen.onkey(lambda: connection.send_turn(UP), "Up")
+    screen.onkey(lambda: connection.send_turn(DOWN), "Down")
+    screen.onkey(lambda: connection.send_turn(LEFT), "Left")
+    screen.onkey(lambda: connection.send_turn(RIGHT), "Right")
+    screen.listen()
+    poll()
+    screen.mainloop()
+
+
+if __name__ == "__main__":
+    play(option(sys.argv[1:], "--host", HOST), int(option(sys.argv[1:], "--port", PORT)))
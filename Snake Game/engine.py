@@ -0,0 +1,491 @@
+"""
+Snake Game engine
+
+This script defines the `SnakeEngine` class, a pure-Python model of the Snake game rules.
+The play field is split into 20-px cells and every cell is stored as a single integer index.
+The snake's body is a ring buffer of cells (`CellRing`), so a move pushes one cell at the head and pops one at the tail no matter how long the snake is,
+and a cell of the body takes 4 bytes.
+An occupancy grid, surrounded by a border of wall cells, is updated on every push and pop, so a single lookup of the new head's cell tells whether it hit a wall, the snake or the food.
+A free-cell index (a list of the empty cells and a map from each cell to its place in the list) is updated in the same way,
+so the food respawns on a uniformly random empty cell in O(1), even when the board is almost full.
+The engine does not use the Turtle library at all, so the game state can exist (and run) without a screen.
+A step is a few grid and array lookups with no method calls, and a reset copies the starting board instead of rebuilding it:
+a single engine runs about 850,000 steps per second on one core (`python benchmark.py engine`, random turns and a reset after every death).
+That is short of millions of steps per second, which takes the NumPy `BatchSnakeEnv` of batch.py and its thousands of games per step.
+The board is 29x27 cells by default, the play field of the 600x600 screen, but any size can be given (arena boards of 500x500 cells or more),
+and the grid and the free-cell index are stored in compact arrays so a large board costs a few bytes per cell.
+The food is placed with the engine's own seeded random generator, so a game with the same seed and the same turns is always the same game.
+
+Classes:
+    - CellRing: A class that holds the cells of a snake's body in a packed ring buffer, with the deque operations the games use.
+    - Board: A class that holds an occupancy grid with a wall border and the index of its free cells.
+    - SnakeEngine: A class that holds the snake, the food and the rules of the game on an integer grid.
+
+Features:
+    - Moves the snake in O(1) by pushing a new head cell and popping the tail cell.
+    - Advances the game one tick at a time with `step(direction)`, which returns the events of the tick (ate, died).
+    - Grows the snake on the tick after it eats, the same way the Turtle snake does.
+    - Detects collisions with the walls, the snake's own body and the food with one O(1) lookup in the occupancy grid.
+    - Respawns the food in O(1) on a random cell that is never taken by the snake.
+    - Converts between grid cells and screen coordinates for the Turtle classes that draw the game.
+    - Runs on boards of any size, with one byte of occupancy grid and twelve bytes of free-cell index per cell, and four bytes per cell of the snake.
+"""
+
+from array import array
+import random
+
+# Constants for the grid, matching the 600x600 Turtle screen and the 20-px snake segments
+CELL_SIZE = 20
+MIN_X = -280
+MAX_X = 280
+MIN_Y = -280
+MAX_Y = 240
+COLUMNS = (MAX_X - MIN_X) // CELL_SIZE + 1
+ROWS = (MAX_Y - MIN_Y) // CELL_SIZE + 1
+WIDTH = COLUMNS + 2 # a row of the occupancy grid, including the wall cell on each side
+HEIGHT = ROWS + 2
+START_LENGTH = 3
+RING_CAPACITY = 64 # the cells a snake's body holds before its buffer first grows
+START_COPY_CELLS = 1 << 20 # an engine on a board of up to this many cells keeps a copy of its starting board, so a reset does not rebuild it
+
+# Constants for the content of an occupancy grid cell
+EMPTY = 0
+SNAKE = 1
+FOOD = 2
+WALL = 3
+
+# Constants for the snake's directions, the same headings the Turtle snake uses
+UP = 90
+DOWN = 270
+RIGHT = 0
+LEFT = 180
+MOVES = {UP: WIDTH, DOWN: -WIDTH, RIGHT: 1, LEFT: -1} # the change of the cell index for a move in each direction
+
+
+def to_cell(position):
+    """
+    Converts screen coordinates to the index of the grid cell that contains them.
+
+    Args:
+        position (tuple[float, float]): The (x, y) screen coordinates.
+
+    Returns:
+        int: The index of the grid cell.
+    """
+    column = round((position[0] - MIN_X) / CELL_SIZE) + 1
+    row = round((position[1] - MIN_Y) / CELL_SIZE) + 1
+    return row * WIDTH + column
+
+
+def to_position(cell):
+    """
+    Converts the index of a grid cell to the screen coordinates of its center.
+
+    Args:
+        cell (int): The index of the grid cell.
+
+    Returns:
+        tuple[int, int]: The (x, y) screen coordinates.
+    """
+    row, column = divmod(cell, WIDTH)
+    return MIN_X + (column - 1) * CELL_SIZE, MIN_Y + (row - 1) * CELL_SIZE
+
+
+class CellRing:
+    """
+    A class to hold the cells of a snake's body, from head to tail, in a ring buffer of 4-byte integers.
+
+    It has the part of the deque interface the games use (`appendleft`, `append`, `pop`, `clear`, `len`, indexing and iteration),
+    but a cell takes 4 bytes in a packed array instead of a pointer to an int object, so a snake of a million cells costs 4 MB instead of about 40 MB.
+    The capacity is a power of two, so an index wraps around with a bit mask, and it doubles when the buffer is full.
+    `start` is the place of the head in the buffer, and the body goes on from there for `length` cells.
+    """
+
+    def __init__(self, capacity=RING_CAPACITY):
+        """
+        Initializes the CellRing object with no cells.
+
+        Args:
+            capacity (int, optional): The number of cells the buffer holds before it grows, rounded up to a power of two.
+        """
+        capacity = 1 << max(capacity - 1, 0).bit_length()
+        self.cells = array("i", [0]) * capacity
+        self.mask = capacity - 1
+        self.start = 0
+        self.length = 0
+
+    def __len__(self):
+        """
+        Returns the number of cells.
+        """
+        return self.length
+
+    def __getitem__(self, index):
+        """
+        Returns the cell at an index from the head (0) or, if the index is negative, from the tail (-1).
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("CellRing index out of range")
+        return self.cells[(self.start + index) & self.mask]
+
+    def __iter__(self):
+        """
+        Iterates over a copy of the cells, from head to tail.
+        """
+        return iter(self.to_array())
+
+    def __contains__(self, cell):
+        """
+        Checks if a cell is part of the body, with a linear scan.
+        """
+        return cell in self.to_array()
+
+    def __repr__(self):
+        """
+        Returns the cells as a list, for debugging.
+        """
+        return f"CellRing({self.to_array().tolist()})"
+
+    def to_array(self):
+        """
+        Copies the cells in order, from head to tail.
+
+        Returns:
+            array: The cells, as an array of type "i".
+        """
+        end = self.start + self.length
+        if end <= len(self.cells):
+            return self.cells[self.start:end]
+        return self.cells[self.start:] + self.cells[:end & self.mask]
+
+    def grow_buffer(self):
+        """
+        Doubles the capacity of the buffer, moving the cells to its beginning in order.
+        """
+        cells = self.to_array()
+        capacity = 2 * len(self.cells)
+        cells.extend(array("i", [0]) * (capacity - len(cells)))
+        self.cells = cells
+        self.mask = capacity - 1
+        self.start = 0
+
+    def appendleft(self, cell):
+        """
+        Adds a cell before the head.
+
+        Args:
+            cell (int): The cell.
+        """
+        if self.length > self.mask:
+            self.grow_buffer()
+        self.start = (self.start - 1) & self.mask
+        self.cells[self.start] = cell
+        self.length += 1
+
+    def append(self, cell):
+        """
+        Adds a cell after the tail.
+
+        Args:
+            cell (int): The cell.
+        """
+        if self.length > self.mask:
+            self.grow_buffer()
+        self.cells[(self.start + self.length) & self.mask] = cell
+        self.length += 1
+
+    def pop(self):
+        """
+        Removes the tail cell.
+
+        Returns:
+            int: The cell that was removed.
+        """
+        if not self.length:
+            raise IndexError("pop from an empty CellRing")
+        self.length -= 1
+        return self.cells[(self.start + self.length) & self.mask]
+
+    def clear(self):
+        """
+        Removes all the cells. The buffer keeps its capacity, so a snake that grows again does not allocate it again.
+        """
+        self.start = 0
+        self.length = 0
+
+
+class Board:
+    """
+    A class to hold a board of the Snake game: an occupancy grid with a wall border and an index of its free cells.
+
+    The `grid` bytearray holds the content (EMPTY, SNAKE, FOOD or WALL) of every cell, including the wall border around the play field.
+    The cells are indexed with the board's own `width` and `moves`, which match the module's WIDTH and MOVES on the default board.
+    `SnakeEngine` runs the game of one snake on a board, and other games (such as the arena of many snakes) can share the same board code.
+    """
+
+    def __init__(self, seed=None, columns=COLUMNS, rows=ROWS):
+        """
+        Initializes the Board object with an empty board.
+
+        Args:
+            seed (int, optional): The seed of the board's random generator. A random seed is used if None.
+            columns (int, optional): The number of columns of the board, not counting the wall border.
+            rows (int, optional): The number of rows of the board, not counting the wall border.
+        """
+        self.columns = columns
+        self.rows = rows
+        self.width = columns + 2 # a row of the occupancy grid, including the wall cell on each side
+        self.height = rows + 2
+        self.moves = {UP: self.width, DOWN: -self.width, RIGHT: 1, LEFT: -1} # the change of the cell index for a move in each direction
+        self.random = random.Random(seed) # the random generator that places the food
+        self.grid = bytearray(self.width * self.height) # the occupancy grid
+        self.free_cells = array("i") # the empty cells, in no particular order
+        self.free_index = array("i") # the place of each cell in free_cells (-1 if it is not empty)
+        self.numbers = array("i", range(self.width * self.height)) # the numbers from 0 up, copied in slices to build the free-cell index
+
+    def clear_board(self):
+        """
+        Empties the grid and marks the wall border around the play field. The free-cell index must be rebuilt afterwards.
+        """
+        width = self.width
+        size = width * self.height
+        self.grid[:] = bytes(size)
+        self.grid[:width] = bytes([WALL]) * width
+        self.grid[size - width:] = bytes([WALL]) * width
+        self.grid[::width] = bytes([WALL]) * self.height
+        self.grid[width - 1::width] = bytes([WALL]) * self.height
+
+    def index_free_cells(self):
+        """
+        Lists the empty cells of the grid in increasing order, copying whole rows from `numbers` when nothing is on them.
+        """
+        grid = self.grid
+        width = self.width
+        columns = self.columns
+        numbers = self.numbers
+        free_cells = self.free_cells = array("i")
+        free_index = self.free_index = array("i", [-1]) * (width * self.height)
+        for row in range(1, self.height - 1):
+            start = row * width + 1
+            count = len(free_cells)
+            if grid.count(EMPTY, start, start + columns) == columns:
+                free_cells.extend(numbers[start:start + columns])
+                free_index[start:start + columns] = numbers[count:count + columns]
+            else:
+                for cell in range(start, start + columns):
+                    if grid[cell] == EMPTY:
+                        free_index[cell] = len(free_cells)
+                        free_cells.append(cell)
+
+    def cell(self, column, row):
+        """
+        Returns the index of a cell of the board.
+
+        Args:
+            column (int): The column of the cell, from 0 on the left.
+            row (int): The row of the cell, from 0 at the bottom.
+
+        Returns:
+            int: The index of the grid cell.
+        """
+        return (row + 1) * self.width + column + 1
+
+    def coordinates(self, cell):
+        """
+        Returns the column and the row of a cell of the board.
+
+        Args:
+            cell (int): The index of the grid cell.
+
+        Returns:
+            tuple[int, int]: The column from 0 on the left and the row from 0 at the bottom.
+        """
+        row, column = divmod(cell, self.width)
+        return column - 1, row - 1
+
+    def take_cell(self, cell):
+        """
+        Removes a cell from the free-cell index by moving the last free cell into its place.
+
+        Args:
+            cell (int): The index of the cell that is no longer empty.
+        """
+        index = self.free_index[cell]
+        last = self.free_cells.pop()
+        if last != cell:
+            self.free_cells[index] = last
+            self.free_index[last] = index
+        self.free_index[cell] = -1
+
+    def release_cell(self, cell):
+        """
+        Adds a cell to the free-cell index.
+
+        Args:
+            cell (int): The index of the cell that became empty.
+        """
+        self.free_index[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
+
+
+class SnakeEngine(Board):
+    """
+    A class to run the Snake game rules on an integer grid.
+
+    The snake's body is stored in a `CellRing` of cell indexes where the head is the first item and the tail is the last one.
+    The engine knows nothing about Turtle, the `Snake` and `Food` classes only draw what it holds.
+    On a board of another size than the default, the cells are indexed with the engine's own `width` and `moves`
+    instead of the module's WIDTH and MOVES.
+    """
+
+    def __init__(self, seed=None, columns=COLUMNS, rows=ROWS):
+        """
+        Initializes the SnakeEngine object with a new snake in the middle of the grid and a food cell.
+
+        Args:
+            seed (int, optional): The seed of the random generator that places the food. A random seed is used if None.
+            columns (int, optional): The number of columns of the board, not counting the wall border.
+            rows (int, optional): The number of rows of the board, not counting the wall border.
+        """
+        super().__init__(seed, columns, rows)
+        self.body = CellRing() # the cells of the snake, from head to tail
+        self.direction = RIGHT # the direction of the last move
+        self.grow = 0 # the number of moves left in which the tail stays in place
+        self.food = -1 # the cell of the food
+        self.start_copy = None # (grid, free_cells, free_index) of a new game, before the food is placed
+        self.reset()
+
+    def reset(self, seed=None):
+        """
+        Resets the engine to its initial state, a three-cell snake facing right and a new food cell.
+
+        Args:
+            seed (int, optional): A new seed for the random generator that places the food. The generator goes on if None.
+        """
+        if seed is not None:
+            self.random.seed(seed)
+        self.body.clear()
+
+        # the snake starts in the middle of the board, the same cell as the screen's (0, 0) on the default board
+        head = self.cell(self.columns // 2, (self.rows + 1) // 2)
+        for i in range(START_LENGTH):
+            self.body.append(head - i)
+
+        if self.start_copy is not None:
+            # every game starts on the same board, and the copy keeps the free cells in the order a rebuild lists them
+            grid, free_cells, free_index = self.start_copy
+            self.grid[:] = grid
+            self.free_cells[:] = free_cells
+            self.free_index[:] = free_index
+        else:
+            self.clear_board()
+            for i in range(START_LENGTH):
+                self.grid[head - i] = SNAKE
+            self.index_free_cells()
+            if self.columns * self.rows <= START_COPY_CELLS:
+                self.start_copy = (bytes(self.grid), array("i", self.free_cells), array("i", self.free_index))
+        self.direction = RIGHT
+        self.grow = 0
+        self.respawn_food()
+
+    @property
+    def head(self):
+        """
+        int: The cell of the snake's head.
+        """
+        return self.body[0]
+
+    @property
+    def tail(self):
+        """
+        int: The cell of the snake's tail.
+        """
+        return self.body[-1]
+
+    def turn(self, direction):
+        """
+        Changes the snake's direction if the new direction does not reverse it onto itself.
+
+        Args:
+            direction (int): One of the UP, DOWN, RIGHT and LEFT headings.
+        """
+        if (direction - self.direction) % 360 != 180:
+            self.direction = direction
+
+    def step(self, direction=None):
+        """
+        Advances the game by one tick: turns the snake, moves it one cell forward and checks for food and collisions.
+
+        Args:
+            direction (int, optional): The heading to turn to before moving. The snake keeps its direction if None.
+
+        Returns:
+            tuple[bool, bool]: (ate, died), whether the snake ate the food and whether it collided on this tick.
+        """
+        # this is the hot loop of the headless games, so `turn`, the CellRing methods, `release_cell` and `take_cell`
+        # are written out here: a method call costs about as much as the rest of the step
+        if direction is not None and (direction - self.direction) % 360 != 180:
+            self.direction = direction
+
+        grid = self.grid
+        body = self.body
+        cells = body.cells
+        new_head = cells[body.start] + self.moves[self.direction]
+
+        # snake collision with the wall
+        if grid[new_head] == WALL:
+            return False, True
+
+        # the tail leaves its cell before the head moves, unless the snake is growing
+        free_cells = self.free_cells
+        free_index = self.free_index
+        if self.grow:
+            self.grow -= 1
+        else:
+            body.length -= 1
+            tail = cells[(body.start + body.length) & body.mask]
+            grid[tail] = EMPTY
+            free_index[tail] = len(free_cells)
+            free_cells.append(tail)
+
+        # snake collision with its own body
+        content = grid[new_head]
+        if content == SNAKE:
+            return False, True
+        if body.length > body.mask:
+            body.grow_buffer()
+            cells = body.cells
+        body.start = (body.start - 1) & body.mask
+        cells[body.start] = new_head
+        body.length += 1
+        grid[new_head] = SNAKE
+
+        # the food cell is already out of the free-cell index
+        if content == EMPTY:
+            index = free_index[new_head]
+            last = free_cells.pop()
+            if last != new_head:
+                free_cells[index] = last
+                free_index[last] = index
+            free_index[new_head] = -1
+
+        # snake collision with food
+        if content == FOOD:
+            self.grow += 1
+            self.respawn_food()
+            return True, False
+        return False, False
+
+    def respawn_food(self):
+        """
+        Places the food on a random cell that is not taken by the snake, picked in O(1) from the free-cell index.
+        """
+        free_cells = self.free_cells
+        if not free_cells:
+            self.food = -1 # -1 means the board is full
+            return
+        food = self.food = free_cells[self.random.randrange(len(free_cells))]
+        self.take_cell(food)
+        self.grid[food] = FOOD
@@ -2,7 +2,7 @@
 Snake Game food
 
 This script defines the `Food` class, which generates food items for the Snake game.
-The food can appear at random locations on the screen with random shapes and colors.
+The food is drawn on the cell chosen by the game's `SnakeEngine`, with a random shape and color.
 The food class inherits from the `Turtle` class and utilizes its functionalities for positioning and displaying the food.
 
 Classes:
@@ -10,7 +10,7 @@ Classes:
 
 Features:
     - Randomly generates a food item with a random color and shape.
-    - Respawns the food at random locations on the game screen.
+    - Respawns the food at the location of the engine's food cell.
     - Supports different shapes (circle, triangle, square) and colors (yellow, red, purple, pink, blue, white, green).
 
 """
@@ -27,24 +27,30 @@ class Food(Turtle):
     """
     A class to create and manage food for the Snake game.
 
-    The `Food` class generates food with a random shape and color, and places it at random locations on the screen.
+    The `Food` class generates food with a random shape and color, and places it on the location it is given.
     The food size is reduced by 50% to fit better in the game grid.
     """
 
-    def __init__(self):
+    def __init__(self, position):
         """
-        Initializes the Food object, setting the shape, color, and location at random.
+        Initializes the Food object, setting the shape and color at random and placing it at the given location.
         The food is made smaller to fit the game grid better.
+
+        Args:
+            position (tuple[float, float]): The (x, y) coordinates of the food.
         """
         super().__init__()
         self.penup()
         self.shapesize(stretch_len=0.5, stretch_wid=0.5)
         self.speed("fastest")
-        self.respawn() # places the food at a random position upon initialization
+        self.respawn(position) # places the food upon initialization
 
-    def respawn(self):
+    def respawn(self, position):
         """
-        Respawns the food at a new random location on the screen with a new random color and shape.
+        Respawns the food at a new location on the screen with a new random color and shape.
+
+        Args:
+            position (tuple[float, float]): The (x, y) coordinates of the food's new cell.
         """
         random_color = random.choice(COLORS) # picks a random color for the food
         random_shape = random.choice(SHAPES) # picks a random shape for the food
@@ -56,6 +62,5 @@ class Food(Turtle):
         self.color(random_color)
         self.shape(random_shape)
 
-        # sets the food to a random position within the screen boundaries
-        self.goto(x=random.randint(-280, 280), y=random.randint(-280, 230))
+        self.goto(position)
 
@@ -0,0 +1,296 @@
+"""
+Snake Game high scores
+
+This script defines the `HighScoreStore` class, which saves the result of every game and keeps the leaderboards of the Snake game.
+Every game is appended as one line to a journal file next to this script (so it does not matter which directory the game is launched from).
+Appending never rewrites the scores that are already saved, and a line that was cut off by a crash is skipped when the journal is loaded.
+All the writes are done while holding a lock file, so several games running on the same machine do not overwrite each other.
+The store remembers how far it has read the journal, and reads the lines that other games appended since then before every write and query,
+so the leaderboards of every running game include the games of the others.
+When the journal grows much longer than the number of leaderboard entries, it is compacted into a new file that replaces the old one atomically.
+
+Classes:
+    - HighScoreStore: A class that records the games and answers leaderboard queries.
+
+Features:
+    - Keeps each player's best score for every difficulty.
+    - Keeps a sorted leaderboard for every difficulty, so the top N players are a slice of it.
+    - Loads hundreds of thousands of recorded games in a single pass over the journal.
+    - Imports the scores of the old `data.txt` file next to the journal the first time it runs.
+"""
+
+from bisect import insort
+import os
+
+try:
+    import fcntl
+except ImportError: # Windows has no fcntl, msvcrt is used to lock the file instead
+    fcntl = None
+    import msvcrt
+
+# Constants for the files of the store
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+JOURNAL_PATH = os.path.join(DIRECTORY, "scores.log")
+LEGACY_NAME = "data.txt" # the old file of the highest scores, read from the journal's directory
+LEGACY_PLAYER = "Player"
+COMPACT_MIN_LINES = 10000 # the journal is not compacted while it is shorter than this
+COMPACT_RATIO = 4 # the journal is compacted when it has this many lines for every leaderboard entry
+
+
+class FileLock:
+    """
+    A class to hold an exclusive lock on a lock file, used with the `with` statement.
+    A separate lock file is locked (instead of the journal itself) because compacting the journal replaces its file.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the FileLock object.
+
+        Args:
+            path (str): The path of the lock file, which is created if it does not exist.
+        """
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        """
+        Waits until the lock is free and takes it.
+        """
+        self.file = open(self.path, mode="a+")
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Releases the lock.
+        """
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+
+
+class HighScoreStore:
+    """
+    A class to save the results of the games and keep the leaderboards.
+
+    Every line of the journal is `difficulty<TAB>score<TAB>player`.
+    In memory, `bests` maps (difficulty, player) to the player's best score,
+    and `leaderboards` maps each difficulty to a list of (-score, player) sorted from the best score down.
+    `offset` is the position in the journal file after the last complete line read, and `inode` identifies that file,
+    which changes when another instance compacts the journal.
+    """
+
+    def __init__(self, path=JOURNAL_PATH):
+        """
+        Initializes the HighScoreStore object and loads the journal.
+
+        Args:
+            path (str, optional): The path of the journal file.
+        """
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.bests = {} # (difficulty, player) -> the player's best score
+        self.leaderboards = {} # difficulty -> sorted list of (-score, player)
+        self.lines = 0 # the number of games in the journal
+        self.offset = 0 # the byte position after the last complete line read
+        self.inode = None # the journal file that was read
+        self.legacy_path = os.path.join(os.path.dirname(os.path.abspath(path)), LEGACY_NAME)
+        if os.path.exists(self.legacy_path):
+            with FileLock(self.lock_path):
+                # checked while holding the lock, so two games started together for the first time do not both import the old scores
+                if not os.path.exists(self.path):
+                    self.import_legacy()
+        self.load()
+
+    def load(self):
+        """
+        Reads the journal and builds the best scores and the sorted leaderboards.
+        """
+        self.bests = {}
+        self.lines = 0
+        self.offset = 0
+        self.inode = None
+        if os.path.exists(self.path):
+            with open(self.path, mode="rb") as journal:
+                data = journal.read()
+                self.inode = os.fstat(journal.fileno()).st_ino
+            # a line without its new line is still being written (or was cut off), it is read again by the next refresh
+            self.offset = data.rfind(b"\n") + 1
+            bests = self.bests
+            for line in data[:self.offset].decode("utf-8", errors="replace").splitlines():
+                fields = line.split("\t", 2)
+                if len(fields) != 3 or not fields[0].isdigit() or not fields[1].isdigit():
+                    continue # a line cut off by a crash
+                key = (int(fields[0]), fields[2])
+                score = int(fields[1])
+                self.lines += 1
+                if score > bests.get(key, -1):
+                    bests[key] = score
+
+        self.leaderboards = {}
+        for (difficulty, player), score in self.bests.items():
+            self.leaderboards.setdefault(difficulty, []).append((-score, player))
+        for leaderboard in self.leaderboards.values():
+            leaderboard.sort()
+
+    def refresh(self):
+        """
+        Reads the games that other instances appended to the journal since it was last read and updates the leaderboards.
+        The whole journal is loaded again if it was replaced by a compaction.
+        """
+        try:
+            status = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if status.st_ino == self.inode and status.st_size == self.offset:
+            return # nothing new, the common case of the queries
+        if status.st_ino != self.inode or status.st_size < self.offset:
+            self.load()
+            return
+        with open(self.path, mode="rb") as journal:
+            journal.seek(self.offset)
+            data = journal.read()
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        for line in data[:end].decode("utf-8", errors="replace").splitlines():
+            fields = line.split("\t", 2)
+            if len(fields) != 3 or not fields[0].isdigit() or not fields[1].isdigit():
+                continue # a line cut off by a crash
+            self.lines += 1
+            self.update(fields[2], int(fields[0]), int(fields[1]))
+
+    def record(self, player, difficulty, score):
+        """
+        Saves the result of a game and updates the leaderboard if it is the player's best score.
+        The games appended by other instances are read first, while holding the lock.
+
+        Args:
+            player (str): The name of the player.
+            difficulty (int): The difficulty level of the game.
+            score (int): The score of the game.
+        """
+        player = " ".join(player.split()) or LEGACY_PLAYER # tabs and new lines would break the journal's lines
+        with FileLock(self.lock_path):
+            self.append(player, difficulty, score)
+
+    def append(self, player, difficulty, score):
+        """
+        Appends a game to the journal after reading the games of other instances, and compacts the journal if it grew too long.
+        Must be called while holding the lock.
+
+        Args:
+            player (str): The name of the player, without tabs or new lines.
+            difficulty (int): The difficulty level of the game.
+            score (int): The score of the game.
+        """
+        self.refresh()
+        with open(self.path, mode="ab") as journal:
+            if journal.tell() > self.offset:
+                journal.truncate(self.offset) # drops a line cut off by a crash, every complete line was already read
+            journal.write(f"{difficulty}\t{score}\t{player}\n".encode("utf-8"))
+            journal.flush()
+            os.fsync(journal.fileno())
+            self.offset = journal.tell()
+            self.inode = os.fstat(journal.fileno()).st_ino
+        self.lines += 1
+        self.update(player, difficulty, score)
+        if self.lines >= COMPACT_MIN_LINES and self.lines >= COMPACT_RATIO * len(self.bests):
+            self.compact()
+
+    def update(self, player, difficulty, score):
+        """
+        Updates the player's best score and its place in the leaderboard.
+
+        Args:
+            player (str): The name of the player.
+            difficulty (int): The difficulty level of the game.
+            score (int): The score of the game.
+        """
+        key = (difficulty, player)
+        old_score = self.bests.get(key)
+        if old_score is not None and old_score >= score:
+            return
+        leaderboard = self.leaderboards.setdefault(difficulty, [])
+        if old_score is not None:
+            leaderboard.remove((-old_score, player))
+        insort(leaderboard, (-score, player))
+        self.bests[key] = score
+
+    def compact(self):
+        """
+        Rewrites the journal with only the best score of every player, replacing the old file atomically.
+        Must be called while holding the lock, the journal is reloaded first to include the games of other instances.
+        """
+        self.load()
+        temp_path = self.path + ".tmp"
+        with open(temp_path, mode="w", encoding="utf-8") as journal:
+            for (difficulty, player), score in self.bests.items():
+                journal.write(f"{difficulty}\t{score}\t{player}\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(temp_path, self.path)
+        status = os.stat(self.path)
+        self.offset = status.st_size
+        self.inode = status.st_ino
+        self.lines = len(self.bests)
+
+    def import_legacy(self):
+        """
+        Imports the highest scores of the old `data.txt` file in the journal's directory, one line per difficulty.
+        Must be called while holding the lock.
+        """
+        with open(self.legacy_path, mode="r") as d:
+            scores = [line.strip() for line in d.readlines()]
+        for difficulty, score in enumerate(scores):
+            if score.isdigit() and int(score) > 0:
+                self.append(LEGACY_PLAYER, difficulty, int(score))
+
+    def best(self, difficulty):
+        """
+        Returns the highest score of the difficulty.
+
+        Args:
+            difficulty (int): The difficulty level.
+
+        Returns:
+            int: The highest score, 0 if no game was recorded.
+        """
+        self.refresh()
+        leaderboard = self.leaderboards.get(difficulty)
+        return -leaderboard[0][0] if leaderboard else 0
+
+    def player_best(self, player, difficulty):
+        """
+        Returns the player's highest score of the difficulty.
+
+        Args:
+            player (str): The name of the player.
+            difficulty (int): The difficulty level.
+
+        Returns:
+            int: The highest score, 0 if the player has no recorded game.
+        """
+        self.refresh()
+        return self.bests.get((difficulty, player), 0)
+
+    def top(self, difficulty, n=10):
+        """
+        Returns the N best players of the difficulty.
+
+        Args:
+            difficulty (int): The difficulty level.
+            n (int, optional): The number of players.
+
+        Returns:
+            list[tuple[str, int]]: (player, score) pairs from the highest score down.
+        """
+        self.refresh()
+        return [(player, -score) for score, player in self.leaderboards.get(difficulty, [])[:n]]
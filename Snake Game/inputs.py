@@ -0,0 +1,114 @@
+"""
+Snake Game input queue
+
+This script defines the `InputQueue` class, which holds the player's key presses until the ticks that apply them.
+Setting the direction straight from the key callback loses presses: two presses within one tick overwrite each other,
+and a quick "up, left" while moving right could be read as "left" alone, which reverses the snake onto itself.
+The queue keeps the presses in order instead, and the game takes at most one of them on every tick, so the rest are carried over to the next ticks.
+Every press is timestamped, so the time from the key press to the move that applies it can be measured.
+
+Classes:
+    - InputQueue: A class that buffers the direction changes of the player and measures their latency.
+
+Features:
+    - Applies at most one direction change per tick and carries the others over, in the order they were pressed.
+    - Ignores presses that repeat the direction or reverse it, checked against the direction the snake will have when they are applied.
+    - Keeps at most a few presses, so a held or mashed key cannot queue up moves for seconds ahead.
+    - Reports the key-to-move latency of the recent presses in milliseconds and in ticks.
+"""
+
+from collections import deque
+import time
+
+# Constants for the queue
+MAX_INPUTS = 3 # the number of presses the queue holds, later presses are dropped until a tick takes one
+SAMPLES = 500 # the number of recent presses that the statistics are computed from
+
+
+class InputQueue:
+    """
+    A class to buffer the player's direction changes between ticks.
+
+    `push()` is called from the key callbacks, and `pop()` is called once on every tick, before the engine steps.
+    Each queued press is a (direction, time, tick) tuple, where the time and the tick are taken when the key was pressed.
+    """
+
+    def __init__(self, clock=time.perf_counter, size=MAX_INPUTS):
+        """
+        Initializes the InputQueue object.
+
+        Args:
+            clock (Callable[[], float], optional): The clock that timestamps the presses, in seconds.
+            size (int, optional): The number of presses the queue holds.
+        """
+        self.clock = clock
+        self.size = size
+        self.presses = deque() # the queued presses, oldest first
+        self.direction = None # the direction the snake will have after the queued presses are applied
+        self.ticks = 0 # the number of ticks so far
+        self.dropped = 0 # the number of presses dropped because the queue was full
+        self.latencies = deque(maxlen=SAMPLES) # the time from each recent press to its move, in seconds
+        self.waits = deque(maxlen=SAMPLES) # the number of ticks each recent press waited, 1 if it was applied on the next tick
+
+    def push(self, direction):
+        """
+        Queues a direction change, unless it repeats or reverses the direction the snake will have when it is applied.
+
+        Args:
+            direction (int): One of the UP, DOWN, RIGHT and LEFT headings.
+        """
+        if self.direction is not None and (direction - self.direction) % 360 in (0, 180):
+            return
+        if len(self.presses) >= self.size:
+            self.dropped += 1
+            return
+        self.presses.append((direction, self.clock(), self.ticks))
+        self.direction = direction
+
+    def pop(self, direction):
+        """
+        Takes the next direction change for this tick and records its latency. Must be called once on every tick.
+
+        Args:
+            direction (int): The current direction of the snake.
+
+        Returns:
+            int: The direction to pass to the engine, or None to keep the current direction.
+        """
+        self.ticks += 1
+        while self.presses:
+            new_direction, pressed, tick = self.presses.popleft()
+            # a press that was checked against a queued one is checked again, the snake could have turned another way since
+            if (new_direction - direction) % 360 not in (0, 180):
+                self.latencies.append(self.clock() - pressed)
+                self.waits.append(self.ticks - tick)
+                if not self.presses:
+                    self.direction = None
+                return new_direction
+        self.direction = None
+        return None
+
+    def clear(self):
+        """
+        Drops the queued presses, for a new round or when the autopilot takes over.
+        """
+        self.presses.clear()
+        self.direction = None
+
+    def stats(self):
+        """
+        Returns the latency statistics of the recent presses.
+
+        Returns:
+            dict[str, float]: The mean and maximum latency in milliseconds, the maximum number of ticks a press waited,
+            the number of presses that waited longer than one tick and the number of dropped presses.
+        """
+        latencies = self.latencies or [0.0]
+        waits = self.waits or [0]
+        return {
+            "mean_ms": sum(latencies) / len(latencies) * 1000,
+            "max_ms": max(latencies) * 1000,
+            "max_ticks": max(waits),
+            "carried_over": sum(1 for wait in waits if wait > 1),
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,125 @@
+"""
+Snake Game server load test
+
+This script connects hundreds of simulated clients to a running Snake server and measures what each one gets.
+Every client reads the snapshot and the deltas, keeps a `Mirror` of the game so the messages are checked to make sense,
+and sends a random turn now and then, like a player.
+At the end it reports the bandwidth each client received, the gaps in the tick numbers (ticks the server skipped),
+and the time the server spent on its ticks as reported in the deltas, with the number of ticks that overran the interval.
+
+Features:
+    - Opens many connections from one process with asyncio.
+    - Applies every delta to a mirror of the game, so a broken delta shows up as an error.
+    - Reports the bandwidth per client, the tick rate and the server's tick time and overruns.
+
+Usage:
+    python loadtest.py [--host 127.0.0.1] [--port 5005] [--clients 200] [--seconds 10]
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from options import option
+from protocol import DIRECTIONS, LENGTH, Mirror
+
+# Constants for the load test
+CLIENTS = 200
+SECONDS = 10.0
+TURN_CHANCE = 0.1 # the chance that a client sends a turn after a tick
+
+
+class Stats:
+    """
+    A class to hold the measurements of one simulated client.
+    """
+
+    def __init__(self):
+        """
+        Initializes the Stats object with nothing measured.
+        """
+        self.received = 0 # the number of bytes received, including the snapshot
+        self.snapshot = 0 # the size of the snapshot
+        self.deltas = 0
+        self.gaps = 0 # the ticks that were missing between two deltas
+        self.work = [] # the server's tick times reported in the deltas, in seconds
+        self.interval = 0.0 # the server's tick interval, in seconds
+        self.error = None
+
+
+async def simulate(host, port, seconds, stats, rng):
+    """
+    Runs one simulated client until the time is up.
+
+    Args:
+        host (str): The address of the server.
+        port (int): The TCP port of the server.
+        seconds (float): How long to stay connected.
+        stats (Stats): The measurements to fill in.
+        rng (random.Random): The random generator of the client's turns.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    end = time.perf_counter() + seconds
+    mirror = None
+    try:
+        while time.perf_counter() < end:
+            length, = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+            message = await reader.readexactly(length)
+            stats.received += LENGTH.size + length
+            if mirror is None:
+                mirror = Mirror(message)
+                stats.snapshot = LENGTH.size + length
+                stats.interval = mirror.interval
+                continue
+
+            tick = mirror.tick
+            mirror.apply(message)
+            stats.deltas += 1
+            stats.gaps += mirror.tick - tick - 1
+            stats.work.append(mirror.work)
+            if rng.random() < TURN_CHANCE:
+                writer.write(bytes([rng.randrange(len(DIRECTIONS))]))
+    except (asyncio.IncompleteReadError, ConnectionError) as error:
+        stats.error = repr(error)
+    finally:
+        writer.close()
+
+
+async def run(host, port, clients, seconds):
+    """
+    Runs the simulated clients together and prints the report.
+
+    Args:
+        host (str): The address of the server.
+        port (int): The TCP port of the server.
+        clients (int): The number of clients.
+        seconds (float): How long every client stays connected.
+    """
+    stats = [Stats() for _ in range(clients)]
+    start = time.perf_counter()
+    await asyncio.gather(*(simulate(host, port, seconds, stats[i], random.Random(i)) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    connected = [s for s in stats if s.deltas]
+    failed = [s for s in stats if s.error]
+    if not connected:
+        print(f"loadtest: no client got a tick ({len(failed)} errors: {failed[0].error if failed else ''})")
+        return
+    bandwidth = sorted((s.received - s.snapshot) / elapsed for s in connected)
+    work = [w for s in connected for w in s.work]
+    interval = connected[0].interval
+    overruns = sum(1 for w in connected[0].work if w > interval) # the server's ticks, as seen by one client
+    print(f"loadtest: {len(connected)} of {clients} clients got ticks, {len(failed)} errors, "
+          f"{sum(s.deltas for s in connected) / len(connected) / elapsed:.1f} ticks/s per client, "
+          f"{sum(s.gaps for s in connected)} missing ticks")
+    print(f"loadtest: bandwidth per client {bandwidth[len(bandwidth) // 2]:,.0f} B/s median, {bandwidth[-1]:,.0f} B/s max, "
+          f"snapshot {sum(s.snapshot for s in connected) / len(connected):,.0f} B")
+    print(f"loadtest: server tick {sum(work) / len(work) * 1000:.2f} ms mean, {max(work) * 1000:.2f} ms max, "
+          f"{overruns} of {len(connected[0].work)} ticks over the {interval * 1000:.0f} ms interval")
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    asyncio.run(run(option(arguments, "--host", "127.0.0.1"), int(option(arguments, "--port", 5005)),
+                    int(option(arguments, "--clients", CLIENTS)), float(option(arguments, "--seconds", SECONDS))))
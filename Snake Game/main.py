@@ -5,20 +5,34 @@ Version: 2
 
 This script implements the main functionality of the Snake game using the Turtle library.
 It initializes the game window, handles user inputs, and manages game logic such as snake movement, food spawning, collision detection, and scoring.
+The rules of the game run on a `SnakeEngine`, and the Turtle classes draw its state after every tick.
+The game is event-driven: the menus react to clicks and the ticks are run by a `TickScheduler` on the screen's timer, so nothing polls or sleeps.
 
 Features:
     - Initializes the game window with a menu for difficulty selection.
-    - Controls snake movement with keyboard inputs.
+    - Controls snake movement with keyboard inputs, queued and applied one per tick so quick presses are not lost.
     - Detects collisions with food, walls, and the snake's body.
     - Updates the scoreboard and allows the player to restart the game after a game over.
+    - Runs the game at the difficulty's tick rate with drift compensation.
+    - Records every game (its seed and the player's turns) to the recordings folder, so it can be replayed with replay.py.
+    - Lets an autopilot play the game, toggled with the "a" key.
+    - Plays on a large board with a camera that follows the snake, with `python main.py --board 500x500`.
+    - Draws the snake between its last two positions at the display's rate on the classic board, while the game ticks at the difficulty's rate.
 """
 
 from turtle import Screen
-from snake import Snake
+from engine import SnakeEngine, COLUMNS, ROWS, to_position
+from snake import Snake, SMOOTH
+from viewport import ViewportSnake
 from food import Food
 from scoreboard import ScoreBoard
 from menu import Menu
-import time
+from scheduler import TickScheduler, RenderLoop
+from inputs import InputQueue
+from replay import Recorder
+from autopilot import Autopilot
+import random
+import sys
 
 # this function is used to disable listening for key inputs
 def dont_move():
@@ -27,12 +41,14 @@ def dont_move():
 # movement enabling and disabling functions
 def enable_movement():
     """
-    Enables the snake's movement by binding keyboard keys to the corresponding movement methods.
+    Enables the snake's movement by binding keyboard keys to the corresponding movement methods,
+    and the "a" key to turning the autopilot on and off.
     """
     screen.onkey(snake.up, "Up")
     screen.onkey(snake.down, "Down")
     screen.onkey(snake.left, "Left")
     screen.onkey(snake.right, "Right")
+    screen.onkey(autopilot.toggle, "a")
 
 def disable_movement():
     """
@@ -42,85 +58,188 @@ def disable_movement():
     screen.onkey(dont_move, "Down")
     screen.onkey(dont_move, "Left")
     screen.onkey(dont_move, "Right")
+    screen.onkey(dont_move, "a")
 
 
 # Constants for game configuration
 DIFFICULTY_FACTOR = 40
-EDGE = 290
-TOP_EDGE = 250
-CLOSE_TO_ITSELF = 10
-CLOSE_TO_FOOD = 15
+MIN_BOARD = (COLUMNS, ROWS) # the camera shows a window of this size, a smaller board would leave its walls inside the screen
+MAX_BOARD = (4000, 4000) # 16 million cells, the grid and the index of the free cells take a few hundred MB
+USAGE = "usage: python main.py [--board COLUMNSxROWS]"
 
-# sets up the game window
-screen = Screen()
-screen.setup(width=600, height=600)
-screen.bgcolor("black")
-screen.title("Snake Game")
-screen.tracer(0)
 
-menu = Menu() # initializes the game menu
+def board_size(arguments):
+    """
+    Reads the size of the board from the command line, given as `--board COLUMNSxROWS`.
+    Exits with a usage message if the size cannot be read or is outside MIN_BOARD and MAX_BOARD.
 
-screen.onscreenclick(menu.menu_button_clicked) # sets up click events for menu selection
-screen.listen()
+    Args:
+        arguments (list[str]): The command line arguments.
 
-# waits for the user to choose a difficulty
-while menu.difficulty == -1:
-    screen.update()
-    time.sleep(0.2)
+    Returns:
+        tuple[int, int]: The number of columns and rows, the classic board if no size is given.
+    """
+    if "--board" not in arguments:
+        return COLUMNS, ROWS
+    if "--board" not in arguments[:-1]:
+        sys.exit(f"{USAGE}\n--board needs a size, such as 500x500")
+    value = arguments[arguments.index("--board") + 1]
+    try:
+        columns, rows = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        sys.exit(f"{USAGE}\n--board must be two whole numbers joined by an x, such as 500x500, not {value!r}")
+    if not (MIN_BOARD[0] <= columns <= MAX_BOARD[0] and MIN_BOARD[1] <= rows <= MAX_BOARD[1]):
+        sys.exit(f"{USAGE}\n--board must be from {MIN_BOARD[0]}x{MIN_BOARD[1]} to {MAX_BOARD[0]}x{MAX_BOARD[1]}, not {value}")
+    return columns, rows
 
-# sets the game speed based on chosen difficulty
-difficulty = menu.difficulty / DIFFICULTY_FACTOR
 
-snake = Snake()
-food = Food()
-scoreboard = ScoreBoard(menu.difficulty - 1)
+BOARD = board_size(sys.argv[1:])
 
-enable_movement() # # enables the snake's movement controls
-menu.countdown() # displays a countdown to start the game
 
-game_is_on = True
-while game_is_on: # Main game loop
-    screen.update()
-    time.sleep(difficulty)
+def difficulty_clicked(x, y):
+    """
+    Handles a click on the difficulty menu and starts the game once a difficulty is chosen.
+
+    Args:
+        x (float): The x-coordinate of the mouse click.
+        y (float): The y-coordinate of the mouse click.
+    """
+    menu.menu_button_clicked(x, y)
+    if menu.difficulty != -1:
+        screen.onscreenclick(None)
+        start_game()
+
+
+def start_game():
+    """
+    Creates the game objects for the chosen difficulty and starts the first round.
+    """
+    global engine, snake, food, scoreboard, scheduler, renderer, recorder, autopilot
+
+    # sets the game speed based on chosen difficulty
+    difficulty = menu.difficulty / DIFFICULTY_FACTOR
+
+    seed = random.getrandbits(64) # the seed of the game's food placement, saved in the recording
+    scheduler = TickScheduler(screen, difficulty, game_tick)
+    engine = SnakeEngine(seed, *BOARD)
+    inputs = InputQueue(scheduler.clock) # the key presses are timed with the scheduler's clock
+    if BOARD == (COLUMNS, ROWS):
+        # the frames between the ticks slide the snake's head and tail, the ticks only stamp the cells they leave
+        snake = Snake(engine, render_mode=SMOOTH, inputs=inputs)
+        food = Food(to_position(engine.food))
+        renderer = RenderLoop(screen, scheduler, snake.draw_frame)
+    else:
+        # a large board is drawn through a camera, and the viewport snake draws the food too
+        snake = ViewportSnake(engine, inputs=inputs)
+        food = None
+        renderer = None
+    scoreboard = ScoreBoard(menu.difficulty - 1)
+    recorder = Recorder(seed, difficulty, *BOARD)
+    autopilot = Autopilot(engine, budget=difficulty)
+    start_round()
+
+
+def start_round():
+    """
+    Enables the snake's movement and starts ticking after a countdown.
+    """
+    enable_movement() # enables the snake's movement controls
+    menu.countdown(start_ticks) # displays a countdown to start the game
+
+
+def start_ticks():
+    """
+    Starts the game's ticks and, on the classic board, the frames drawn between them.
+    """
+    scheduler.start()
+    if renderer is not None:
+        renderer.start()
+
 
-    # snake movement
-    snake.move_forward()
+def game_tick():
+    """
+    Runs one tick of the game: moves the snake, handles food and collisions and updates the screen.
+    """
+    # the autopilot chooses the direction instead of the keys when it is on, otherwise one queued key press is applied
+    if autopilot.enabled:
+        snake.inputs.clear()
+        snake.next_direction = autopilot.choose()
+    else:
+        snake.take_input()
+
+    # snake movement, the engine checks the collisions with food, the wall and the snake's own body
+    recorder.log(snake.next_direction)
+    ate, died = snake.move_forward()
 
     # snake collision with food
-    if snake.snake_head.distance(food) < CLOSE_TO_FOOD:
-        snake.extend()
+    if ate:
         scoreboard.increase()
-        food.respawn()
-
-    # snake collision with its own body
-    for part in snake.snake_body[1:]:
-        if snake.snake_head.distance(part) < CLOSE_TO_ITSELF:
-            game_is_on = False
-
-    # snake collision with the wall
-    if (
-        game_is_on and # the snake did not collide with itself
-        snake.snake_head.xcor() >= EDGE or # collision with right wall
-        snake.snake_head.xcor() <= -EDGE or # collision with left wall
-        snake.snake_head.ycor() >= TOP_EDGE or # collision with top wall
-        snake.snake_head.ycor() <= -EDGE # collision with bottom wall
-        ):
-        game_is_on = False
-
-    # game over handling
-    if not game_is_on:
-        disable_movement() # disables snake movement
-        snake.reset()
-        scoreboard.reset()
-        menu.play_again() # presents the play again menu
-        screen.onscreenclick(menu.play_again_button_clicked) # sets up click events for play again options
-        while menu.play_again_val == -1: # waits for the user to select an option
-            screen.update()
-            time.sleep(0.2)
-        if menu.play_again_val == 0: # if the user wants to play again
-            game_is_on = True
-            menu.countdown()
-            enable_movement()
+        respawn_food()
+
+    # the autopilot cannot finish a round in which the snake goes around the board without eating, so the round ends there
+    if died or (autopilot.enabled and autopilot.starved):
+        game_over()
+    screen.update()
+
+
+def respawn_food():
+    """
+    Moves the food to the engine's new food cell on the classic board. On a large board the viewport snake draws the food.
+    """
+    if food is not None:
+        food.respawn(to_position(engine.food))
+
+
+def game_over():
+    """
+    Stops the game, saves its recording, resets the snake and the scoreboard and presents the play again menu.
+    """
+    global recorder
+
+    scheduler.stop()
+    if renderer is not None:
+        renderer.stop()
+    disable_movement() # disables snake movement
+    recorder.finish(scoreboard.score)
+    seed = random.getrandbits(64)
+    recorder = Recorder(seed, scheduler.interval, *BOARD)
+    snake.reset(seed)
+    autopilot.reset() # the path and the hunger of the last round do not apply to the new snake
+    respawn_food()
+    scoreboard.reset()
+    menu.play_again() # presents the play again menu
+    screen.onscreenclick(play_again_clicked) # sets up click events for play again options
+
+
+def play_again_clicked(x, y):
+    """
+    Handles a click on the play again menu, starting a new round or closing the game.
 
+    Args:
+        x (float): The x-coordinate of the mouse click.
+        y (float): The y-coordinate of the mouse click.
+    """
+    menu.play_again_button_clicked(x, y)
+    if menu.play_again_val == -1: # the click missed the buttons
+        return
+    screen.onscreenclick(None)
+    if menu.play_again_val == 0: # if the user wants to play again
         menu.play_again_val = -1 # resets play again value for the next round
+        start_round()
+    else:
+        screen.bye()
 
+
+# sets up the game window
+screen = Screen()
+screen.setup(width=600, height=600)
+screen.bgcolor("black")
+screen.title("Snake Game")
+screen.tracer(0)
+
+menu = Menu() # initializes the game menu
+
+screen.onscreenclick(difficulty_clicked) # sets up click events for menu selection
+screen.listen()
+screen.update()
+screen.mainloop()
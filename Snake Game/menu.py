@@ -10,13 +10,12 @@ Classes:
 
 Features:
     - Displays a welcome message and difficulty selection buttons.
-    - Launches the game with a countdown timer.
+    - Launches the game with a countdown timer that runs on the screen's timer events, without blocking.
     - Displays a "Game Over" message with options to retry or exit.
     - Allows interaction via mouse clicks to select buttons.
 """
 
 import turtle
-import time
 
 # Constants for fonts, button sizes, and positions
 WELCOME_FONT = ("David", 30, "normal")
@@ -36,6 +35,8 @@ MENU_BUTTONS_LOC = [(-260, 110), (-150, 110), (-40, 110), (70, 110), (180, 110)]
 PLAY_AGAIN_BUTTONS_LOC = ((-160, 100), (30, 100))
 PLAY_AGAIN_BUTTONS_TEXT = ("Try again", "Exit")
 MENU_BUTTONS_TEXT = ["Hardest", "Hard", "Normal", "Easy", "Easiest"]
+COUNTDOWN_START = 3
+COUNTDOWN_DELAY = 1000 # the time each number of the countdown is shown, in milliseconds
 
 
 class Menu(turtle.Turtle):
@@ -136,18 +137,23 @@ class Menu(turtle.Turtle):
                 self.clear()
 
 
-    def countdown(self):
+    def countdown(self, on_done, count=COUNTDOWN_START):
         """
         Displays a countdown from 3 to 1 and then shows "GO!" to start the game.
+        Every step of the countdown is scheduled with a timer, so the screen keeps handling events while it runs.
+
+        Args:
+            on_done (Callable[[], None]): The function to call when the countdown ends.
+            count (int, optional): The number to display, 0 displays "GO!".
         """
-        self.goto(0, 0)
-        for i in range(3, 0, -1):
-            self.write(arg=f"{i}", align="center", font=LAUNCH_FONT)
+        self.clear()
+        if count < 0:
             turtle.update()
-            time.sleep(1)
-            self.clear()
-        self.write(arg="GO!", align="center", font=LAUNCH_FONT)
+            on_done()
+            return
+
+        self.goto(0, 0)
+        self.write(arg=f"{count}" if count else "GO!", align="center", font=LAUNCH_FONT)
         turtle.update()
-        time.sleep(1)
-        self.clear()
+        turtle.ontimer(lambda: self.countdown(on_done, count - 1), COUNTDOWN_DELAY)
 
@@ -0,0 +1,26 @@
+"""
+Snake Game command line options
+
+This script defines the small command line helper shared by the scripts of the Snake game that take options
+(arena.py, server.py, client.py, loadtest.py and rollout.py), so none of them depends on another entry point to read its arguments.
+
+Features:
+    - Reads the value that follows an option such as "--port", or a default when the option is not given.
+"""
+
+
+def option(arguments, name, default):
+    """
+    Reads the value of a command line option.
+
+    Args:
+        arguments (list[str]): The command line arguments.
+        name (str): The option, such as "--snakes".
+        default (str): The value to use if the option is not given.
+
+    Returns:
+        str: The value of the option.
+    """
+    if name in arguments[:-1]:
+        return arguments[arguments.index(name) + 1]
+    return default
@@ -0,0 +1,247 @@
+"""
+Snake Game network protocol
+
+This script defines the messages the Snake server and its clients exchange, and the `Mirror` class that keeps a client's copy of the game.
+The server is authoritative: it runs an `Arena` and the clients only send the directions they want to turn to.
+A client that joins gets one snapshot of the whole board, and after that only the changes of every tick:
+which snakes moved (one byte each), which died, which were spawned and which food cells were placed.
+A head that moves into a food cell eats it, so eaten food and scores need no message of their own.
+
+Classes:
+    - Mirror: A class that rebuilds the game from a snapshot and applies the deltas of the ticks, so it can be drawn with `ArenaView`.
+
+Features:
+    - Frames every message with its length, so messages can be read from a TCP stream.
+    - Encodes a move as a single byte: the direction of the head (2 bits) and whether the tail left its cell (1 bit).
+    - Sends the same encoded delta to every client, so a tick is encoded once however many clients are connected.
+    - Carries the time the server spent on the previous tick in every delta, so clients can watch for overruns.
+
+Messages (all little-endian):
+    - Client to server: one byte per turn, the index of the direction in DIRECTIONS.
+    - SNAPSHOT: the header, then the number of food cells (4 bytes) and the food cells (4 bytes each),
+      then every snake: its number (2 bytes), its length (0 if dead) and its score (4 bytes each) and its cells from the head (4 bytes each).
+    - DELTA: the header, then the numbers of the snakes that died (2 bytes each), one move byte for every other snake that was alive
+      before the tick (in order of number), the spawned snakes (their number, 2 bytes, and head cell, 4 bytes) and the placed food cells (4 bytes each).
+"""
+
+from array import array
+import struct
+
+from engine import Board, UP, DOWN, RIGHT, LEFT, START_LENGTH, EMPTY, SNAKE, FOOD
+from arena import ArenaSnake, NOBODY
+
+# Constants for the messages
+DIRECTIONS = (UP, DOWN, RIGHT, LEFT) # a direction is sent as its index in this tuple
+SNAPSHOT = 1
+DELTA = 2
+LENGTH = struct.Struct("<I") # the length of a message, before every message
+SNAPSHOT_HEADER = struct.Struct("<BIHHHHH") # type, tick, interval in ms, columns, rows, snakes, the client's snake
+DELTA_HEADER = struct.Struct("<BIIHHH") # type, tick, work of the previous tick in microseconds, died, spawned, placed food
+SNAKE_HEADER = struct.Struct("<HII") # number, length, score (4 bytes, a snake on a large board can be longer than 65535 cells)
+SPAWN = struct.Struct("<HI") # number, head cell
+POPPED = 0b100 # the bit of a move byte that tells that the tail left its cell
+
+
+def frame(message):
+    """
+    Prefixes a message with its length.
+
+    Args:
+        message (bytes): The message.
+
+    Returns:
+        bytes: The framed message.
+    """
+    return LENGTH.pack(len(message)) + message
+
+
+def encode_state(arena):
+    """
+    Encodes the food cells and the snakes of an arena, the part of a snapshot that is the same for every client.
+
+    Args:
+        arena (Arena): The arena.
+
+    Returns:
+        bytes: The food count, the food cells and the snakes of the SNAPSHOT message.
+    """
+    grid = arena.grid
+    foods = array("I")
+    cell = grid.find(FOOD)
+    while cell != -1:
+        foods.append(cell)
+        cell = grid.find(FOOD, cell + 1)
+    data = bytearray(LENGTH.pack(len(foods)))
+    data += foods.tobytes()
+    for snake in arena.snakes:
+        data += SNAKE_HEADER.pack(snake.number, len(snake.body) if snake.alive else 0, snake.score)
+        if snake.alive:
+            data += snake.body.to_array().tobytes()
+    return bytes(data)
+
+
+def encode_snapshot(arena, interval, player, state=None):
+    """
+    Encodes the whole state of an arena, sent to a client when it joins.
+
+    Args:
+        arena (Arena): The arena.
+        interval (float): The time between two ticks, in seconds.
+        player (int): The number of the snake the client controls.
+        state (bytes, optional): The result of `encode_state` for the current tick, shared by the clients that join on the same tick.
+
+    Returns:
+        bytes: The message.
+    """
+    if state is None:
+        state = encode_state(arena)
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT, arena.ticks, round(interval * 1000), arena.columns, arena.rows, len(arena.snakes), player)
+    return header + state
+
+
+def encode_delta(arena, before, dead, work):
+    """
+    Encodes the changes of the last tick.
+
+    Args:
+        arena (Arena): The arena, after its step.
+        before (list[tuple[int, int]]): The head cell and the growth counter of every snake before the step, (-1, 0) for dead snakes.
+        dead (list[ArenaSnake]): The snakes that died on the tick.
+        work (float): The time the server spent on the previous tick, in seconds.
+
+    Returns:
+        bytes: The message.
+    """
+    offsets = {arena.moves[direction]: code for code, direction in enumerate(DIRECTIONS)}
+    died = {snake.number for snake in dead}
+    moves = bytearray()
+    for snake, (head, grow) in zip(arena.snakes, before):
+        if head != -1 and snake.number not in died:
+            moves.append(offsets[snake.body[0] - head] | (POPPED if grow == 0 else 0))
+
+    data = bytearray(DELTA_HEADER.pack(DELTA, arena.ticks, min(round(work * 1e6), 0xFFFFFFFF), len(dead),
+                                       len(arena.spawned), len(arena.placed_food)))
+    data += array("H", sorted(died)).tobytes()
+    data += moves
+    for snake in arena.spawned:
+        data += SPAWN.pack(snake.number, snake.body[0])
+    data += array("I", arena.placed_food).tobytes()
+    return bytes(data)
+
+
+class Mirror(Board):
+    """
+    A class to keep a client's copy of the server's arena.
+
+    It has the attributes `ArenaView` draws (`grid`, `owners`, `columns`, `rows` and the snakes), but no rules:
+    the snapshot sets the state and every delta is applied as it is.
+    """
+
+    def __init__(self, message):
+        """
+        Initializes the Mirror object from a snapshot.
+
+        Args:
+            message (bytes): The SNAPSHOT message.
+        """
+        kind, tick, interval, columns, rows, snakes, player = SNAPSHOT_HEADER.unpack_from(message)
+        super().__init__(None, columns, rows)
+        self.tick = tick
+        self.interval = interval / 1000
+        self.clear_board()
+        self.owners = array("i", [NOBODY]) * (self.width * self.height)
+        self.snakes = [ArenaSnake(number) for number in range(snakes)]
+        self.player = self.snakes[player]
+        self.work = 0.0 # the time the server spent on its last tick, in seconds
+        self.offsets = [self.moves[direction] for direction in DIRECTIONS]
+
+        foods, = LENGTH.unpack_from(message, SNAPSHOT_HEADER.size)
+        offset = SNAPSHOT_HEADER.size + LENGTH.size
+        for cell in array("I", message[offset:offset + 4 * foods]):
+            self.grid[cell] = FOOD
+        offset += 4 * foods
+        for _ in range(snakes):
+            number, length, score = SNAKE_HEADER.unpack_from(message, offset)
+            offset += SNAKE_HEADER.size
+            snake = self.snakes[number]
+            snake.score = score
+            for cell in array("I", message[offset:offset + 4 * length]):
+                self.occupy(snake, cell, append=True)
+            snake.alive = length > 0
+            offset += 4 * length
+
+    def occupy(self, snake, cell, append=False):
+        """
+        Puts a cell of a snake on the grid, at its head or at its tail.
+
+        Args:
+            snake (ArenaSnake): The snake.
+            cell (int): The cell.
+            append (bool, optional): Whether the cell is added at the tail instead of the head.
+        """
+        if self.grid[cell] == FOOD:
+            snake.score += 1
+        if append:
+            snake.body.append(cell)
+        else:
+            snake.body.appendleft(cell)
+        self.grid[cell] = SNAKE
+        self.owners[cell] = snake.number
+
+    def vacate(self, cell):
+        """
+        Empties a cell of the grid.
+
+        Args:
+            cell (int): The cell.
+        """
+        self.grid[cell] = EMPTY
+        self.owners[cell] = NOBODY
+
+    def apply(self, message):
+        """
+        Applies a delta, in the same order as the server's step: the dead snakes are cleared, the tails leave their cells,
+        the heads move in and then the new snakes and food are placed.
+
+        Args:
+            message (bytes): The DELTA message.
+
+        Returns:
+            list[ArenaSnake]: The snakes that died on the tick.
+        """
+        kind, tick, work, died, spawned, foods = DELTA_HEADER.unpack_from(message)
+        self.tick = tick
+        self.work = work / 1e6
+        offset = DELTA_HEADER.size
+        dead = [self.snakes[number] for number in array("H", message[offset:offset + 2 * died])]
+        offset += 2 * died
+
+        moving = [snake for snake in self.snakes if snake.alive]
+        for snake in dead:
+            snake.alive = False
+            snake.deaths += 1
+            for cell in snake.body:
+                self.vacate(cell)
+            snake.body.clear()
+
+        moving = [snake for snake in moving if snake.alive]
+        moves = message[offset:offset + len(moving)]
+        offset += len(moving)
+        for snake, move in zip(moving, moves):
+            if move & POPPED:
+                self.vacate(snake.body.pop())
+        for snake, move in zip(moving, moves):
+            self.occupy(snake, snake.body[0] + self.offsets[move & 0b11])
+
+        for _ in range(spawned):
+            number, head = SPAWN.unpack_from(message, offset)
+            offset += SPAWN.size
+            snake = self.snakes[number]
+            snake.body.clear()
+            snake.score = 0
+            for i in range(START_LENGTH):
+                self.occupy(snake, head - i, append=True)
+            snake.alive = True
+        for cell in array("I", message[offset:offset + 4 * foods]):
+            self.grid[cell] = FOOD
+        return dead
@@ -0,0 +1,348 @@
+"""
+Snake Game record and replay
+
+This script records Snake games and replays them exactly.
+A game is fully defined by the seed of the engine's random generator and the turns the player made, so a recording holds only those:
+a small header and a list of tick-indexed direction changes in a compact binary format (usually one or two bytes per turn).
+A recording can be replayed without a screen at maximum speed, or drawn with the game's Turtle classes in real time or as fast as possible.
+Recordings of games on large boards also hold the size of the board (format version 2), and version 1 recordings are read as classic board games.
+Replaying a folder of recordings checks that every game still ends on the same tick with the same score and measures the engine's throughput.
+
+Classes:
+    - Recording: A class that holds a recorded game and reads and writes its binary format.
+    - Recorder: A class that logs the turns of a game while it is played.
+
+Features:
+    - Saves every game as a binary file of a few dozen bytes.
+    - Replays a recording headless with `replay`, or draws recordings on a Turtle screen with `replay_on_screen`.
+    - Verifies that the replayed game ends with the recorded number of ticks and score.
+
+Usage:
+    python replay.py recordings/ [--render] [--realtime]
+
+The binary format:
+    - A header: the magic bytes b"SNKR", the format version (1 byte), the seed (8 bytes), the tick interval in milliseconds (2 bytes),
+      the number of ticks (4 bytes) and the score (4 bytes), all little-endian.
+      Version 2 adds the number of columns and rows of the board (2 bytes each), and is only written for boards of another size than the classic one.
+    - One varint for every turn: the number of ticks since the previous turn, shifted left by 2, plus the direction code.
+"""
+
+import os
+import struct
+import sys
+import time
+
+from engine import SnakeEngine, UP, DOWN, RIGHT, LEFT, COLUMNS, ROWS
+
+# Constants for the binary format
+MAGIC = b"SNKR"
+VERSION = 2
+HEADER = struct.Struct("<4sBQHII") # the header of version 1, the classic board
+BOARD = struct.Struct("<HH") # the board size that follows the header in version 2
+DIRECTIONS = (UP, DOWN, RIGHT, LEFT) # a direction is stored as its index in this tuple
+RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings")
+
+
+class Recording:
+    """
+    A class to hold a recorded game.
+
+    Attributes:
+        seed (int): The seed of the engine's random generator at the start of the game.
+        interval (float): The time between two ticks, in seconds.
+        ticks (int): The number of ticks the game lasted, including the tick the snake died on.
+        score (int): The final score.
+        turns (list[tuple[int, int]]): (tick, direction) pairs, the directions the player turned to on each tick.
+        columns (int): The number of columns of the board.
+        rows (int): The number of rows of the board.
+    """
+
+    def __init__(self, seed, interval, ticks=0, score=0, turns=None, columns=COLUMNS, rows=ROWS):
+        """
+        Initializes the Recording object.
+
+        Args:
+            seed (int): The seed of the engine's random generator at the start of the game.
+            interval (float): The time between two ticks, in seconds.
+            ticks (int, optional): The number of ticks the game lasted.
+            score (int, optional): The final score.
+            turns (list[tuple[int, int]], optional): (tick, direction) pairs of the player's turns.
+            columns (int, optional): The number of columns of the board.
+            rows (int, optional): The number of rows of the board.
+        """
+        self.seed = seed
+        self.interval = interval
+        self.ticks = ticks
+        self.score = score
+        self.turns = turns if turns is not None else []
+        self.columns = columns
+        self.rows = rows
+
+    def to_bytes(self):
+        """
+        Encodes the recording in the binary format.
+
+        Returns:
+            bytes: The encoded recording.
+        """
+        # a classic board game is written in version 1, so older versions of the game can still read it
+        classic = (self.columns, self.rows) == (COLUMNS, ROWS)
+        data = bytearray(HEADER.pack(MAGIC, 1 if classic else VERSION, self.seed, round(self.interval * 1000), self.ticks, self.score))
+        if not classic:
+            data += BOARD.pack(self.columns, self.rows)
+        last_tick = 0
+        for tick, direction in self.turns:
+            value = (tick - last_tick) << 2 | DIRECTIONS.index(direction)
+            last_tick = tick
+
+            # writes the value as a varint, 7 bits per byte with the high bit set on every byte but the last
+            while value >= 0x80:
+                data.append(value & 0x7F | 0x80)
+                value >>= 7
+            data.append(value)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decodes a recording from the binary format.
+
+        Args:
+            data (bytes): The encoded recording.
+
+        Returns:
+            Recording: The decoded recording.
+
+        Raises:
+            ValueError: If the data is not a recording of a supported version.
+        """
+        magic, version, seed, interval, ticks, score = HEADER.unpack_from(data)
+        if magic != MAGIC or not 1 <= version <= VERSION:
+            raise ValueError("not a Snake recording of a supported version")
+        offset = HEADER.size
+        columns, rows = COLUMNS, ROWS
+        if version >= 2:
+            columns, rows = BOARD.unpack_from(data, offset)
+            offset += BOARD.size
+
+        turns = []
+        tick = 0
+        value = 0
+        shift = 0
+        for byte in data[offset:]:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                tick += value >> 2
+                turns.append((tick, DIRECTIONS[value & 0b11]))
+                value = 0
+                shift = 0
+        return cls(seed, interval / 1000, ticks, score, turns, columns, rows)
+
+    def save(self, path):
+        """
+        Writes the recording to a file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, mode="wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a recording from a file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            Recording: The recording.
+        """
+        with open(path, mode="rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class Recorder:
+    """
+    A class to record a game while it is played.
+
+    The recorder is told the direction passed to the engine on every tick (None when the player did not turn),
+    and keeps only the ticks on which the player turned.
+    """
+
+    def __init__(self, seed, interval, columns=COLUMNS, rows=ROWS):
+        """
+        Initializes the Recorder object for a new game.
+
+        Args:
+            seed (int): The seed the engine was reset with at the start of the game.
+            interval (float): The time between two ticks, in seconds.
+            columns (int, optional): The number of columns of the board.
+            rows (int, optional): The number of rows of the board.
+        """
+        self.recording = Recording(seed, interval, columns=columns, rows=rows)
+
+    def log(self, direction):
+        """
+        Logs one tick of the game.
+
+        Args:
+            direction (int): The direction passed to the engine on this tick, or None.
+        """
+        if direction is not None:
+            self.recording.turns.append((self.recording.ticks, direction))
+        self.recording.ticks += 1
+
+    def finish(self, score, directory=RECORDINGS_DIR):
+        """
+        Ends the game and saves its recording to a new file in the directory.
+
+        Args:
+            score (int): The final score of the game.
+            directory (str, optional): The directory of the recordings.
+
+        Returns:
+            Recording: The finished recording.
+        """
+        self.recording.score = score
+        os.makedirs(directory, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.recording.seed:016x}.snk"
+        self.recording.save(os.path.join(directory, name))
+        return self.recording
+
+
+def replay(recording):
+    """
+    Replays a recording without a screen, as fast as possible.
+
+    Args:
+        recording (Recording): The recording to replay.
+
+    Returns:
+        tuple[int, int]: The number of ticks the replayed game lasted and its score.
+    """
+    engine = SnakeEngine(recording.seed, recording.columns, recording.rows)
+    turns = dict(recording.turns)
+    score = 0
+    for tick in range(recording.ticks):
+        ate, died = engine.step(turns.get(tick))
+        score += ate
+        if died:
+            return tick + 1, score
+    return recording.ticks, score
+
+
+def replay_on_screen(recordings, realtime=True):
+    """
+    Replays recordings one after the other on a Turtle screen, drawn through a `ViewportSnake`,
+    which shows a classic board whole and follows the snake on a large one.
+
+    Args:
+        recordings (list[Recording]): The recordings to replay.
+        realtime (bool, optional): Whether to tick at the recorded speed. The ticks run as fast as possible if False.
+
+    Returns:
+        list[tuple[int, int]]: The number of ticks each replayed game lasted and its score.
+    """
+    from turtle import Screen
+    from scheduler import TickScheduler
+    from snake import SegmentPool
+    from viewport import ViewportSnake
+
+    screen = Screen()
+    screen.setup(width=600, height=600)
+    screen.bgcolor("black")
+    screen.title("Snake Game replay")
+    screen.tracer(0)
+
+    pool = SegmentPool() # the segments are shared by the snakes of all the boards
+    snakes = [] # the snake of the board that is drawn, replaced when a recording has another board size
+    pending = list(recordings)
+    results = []
+
+    def replay_next():
+        """
+        Starts replaying the next recording, or closes the screen after the last one.
+        """
+        if not pending:
+            screen.bye()
+            return
+        recording = pending.pop(0)
+        turns = dict(recording.turns)
+        board = (recording.columns, recording.rows)
+        if snakes and (snakes[0].engine.columns, snakes[0].engine.rows) == board:
+            snake = snakes[0]
+            snake.reset(recording.seed)
+        else:
+            if snakes:
+                snakes.pop().clear()
+            snake = ViewportSnake(SnakeEngine(recording.seed, *board), pool)
+            snakes.append(snake)
+        result = [0, 0] # the ticks and the score of the replayed game
+
+        def tick():
+            """
+            Replays one tick and moves on to the next recording when the game ends.
+            """
+            snake.next_direction = turns.get(result[0])
+            ate, died = snake.move_forward()
+            result[0] += 1
+            result[1] += ate
+            screen.update()
+            if died or result[0] == recording.ticks:
+                scheduler.stop()
+                results.append(tuple(result))
+                replay_next()
+
+        scheduler = TickScheduler(screen, recording.interval if realtime else 0, tick)
+        scheduler.start()
+
+    replay_next()
+    screen.mainloop()
+    return results
+
+
+def main(paths, render=False, realtime=False):
+    """
+    Replays the recordings, checks that each one ends as it was recorded and prints the throughput.
+
+    Args:
+        paths (list[str]): Recording files, or directories of recording files.
+        render (bool, optional): Whether to draw the replays on a Turtle screen.
+        realtime (bool, optional): Whether to draw the replays at the recorded speed.
+
+    Returns:
+        int: The number of recordings that did not end as recorded.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".snk"))
+        else:
+            files.append(path)
+
+    recordings = [Recording.load(file) for file in files]
+    start = time.perf_counter()
+    if render:
+        results = replay_on_screen(recordings, realtime)
+    else:
+        results = [replay(recording) for recording in recordings]
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    total_ticks = 0
+    for file, recording, (ticks, score) in zip(files, recordings, results):
+        total_ticks += ticks
+        if (ticks, score) != (recording.ticks, recording.score):
+            failures += 1
+            print(f"{file}: recorded {recording.ticks} ticks and score {recording.score}, replayed {ticks} ticks and score {score}")
+    print(f"replayed {len(files)} games, {failures} mismatched, {total_ticks:,} ticks in {elapsed:.2f} s "
+          f"({total_ticks / max(elapsed, 1e-9):,.0f} ticks/s)")
+    return failures
+
+
+if __name__ == "__main__":
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    sys.exit(main(arguments or [RECORDINGS_DIR], render="--render" in sys.argv, realtime="--realtime" in sys.argv) != 0)
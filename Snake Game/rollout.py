@@ -0,0 +1,255 @@
+"""
+Snake Game rollout runner
+
+This script plays many complete Snake games with a bot strategy and no screen, to compare strategies over thousands of games.
+The games run on `SnakeEngine` with the same rules as the window game, and every game has its own seed,
+so a game can be played again with the same food and the same result.
+The seeds are split into shards that run on a `ProcessPoolExecutor`, one process per core by default.
+The results of every game are written to a CSV file as the shards finish, and a summary of every strategy is printed at the end.
+
+Features:
+    - Plays the "autopilot", "greedy" and "random" strategies, or any of them by name.
+    - Records the score, the length, the steps and the cause of the end of every game: "wall", "self", "starved" (the snake went too long
+      without eating), "full" (no free cell is left for the food) or "steps" (the game reached the step limit).
+    - Sends each worker process a whole shard of games, so the work of a game is large against the cost of passing its results.
+    - Prints the mean, median and best score, the mean steps and the causes of the ends of every strategy, and the games per second.
+
+Usage:
+    python rollout.py [--strategies autopilot,greedy] [--games 1000] [--seed 0] [--workers N] [--out PATH]
+
+    The results are written to rollouts.csv next to this script unless --out gives another path.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import os
+import random
+import sys
+import time
+
+from options import option
+from engine import SnakeEngine, EMPTY, FOOD, WALL, COLUMNS, ROWS
+
+# Constants for the rollouts
+GAMES = 1000
+SHARD_SIZE = 25 # the games a worker plays for every task it is sent
+PATIENCE = 4 * COLUMNS * ROWS # a game that goes this many steps without eating is stopped, the bot is going around in circles
+MAX_STEPS = 200_000
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+OUTPUT = os.path.join(DIRECTORY, "rollouts.csv") # next to the script, whatever the working directory is
+FIELDS = ("strategy", "seed", "score", "length", "steps", "cause", "seconds")
+
+
+def random_bot(engine, rng):
+    """
+    Returns a bot that moves to a random neighbouring cell that is not blocked.
+
+    Args:
+        engine (SnakeEngine): The engine of the game to play.
+        rng (random.Random): The random generator of the bot.
+
+    Returns:
+        Callable[[], int]: A function that returns the direction of the next move, or None to keep going.
+    """
+    moves = list(engine.moves.items())
+
+    def choose():
+        """
+        Picks a random direction that does not run into a wall or the snake.
+        """
+        head = engine.head
+        open_moves = [direction for direction, offset in moves if engine.grid[head + offset] in (EMPTY, FOOD)]
+        return rng.choice(open_moves) if open_moves else None
+
+    return choose
+
+
+def greedy_bot(engine, rng):
+    """
+    Returns a bot that moves to the neighbouring cell closest to the food that is not blocked, without looking further ahead.
+
+    Args:
+        engine (SnakeEngine): The engine of the game to play.
+        rng (random.Random): Unused, every bot is given a random generator.
+
+    Returns:
+        Callable[[], int]: A function that returns the direction of the next move, or None to keep going.
+    """
+    moves = list(engine.moves.items())
+
+    def choose():
+        """
+        Picks the open direction that brings the head closest to the food.
+        """
+        head = engine.head
+        food_column, food_row = engine.coordinates(engine.food)
+        best_direction = None
+        best_distance = None
+        for direction, offset in moves:
+            cell = head + offset
+            if engine.grid[cell] in (EMPTY, FOOD):
+                column, row = engine.coordinates(cell)
+                distance = abs(column - food_column) + abs(row - food_row)
+                if best_distance is None or distance < best_distance:
+                    best_direction, best_distance = direction, distance
+        return best_direction
+
+    return choose
+
+
+def autopilot_bot(engine, rng):
+    """
+    Returns the path-finding `Autopilot` of the window game.
+
+    Args:
+        engine (SnakeEngine): The engine of the game to play.
+        rng (random.Random): Unused, every bot is given a random generator.
+
+    Returns:
+        Callable[[], int]: A function that returns the direction of the next move, or None to keep going.
+    """
+    from autopilot import Autopilot
+
+    return Autopilot(engine).choose
+
+
+# the strategies by name, each a function that makes a bot for an engine
+STRATEGIES = {
+    "autopilot": autopilot_bot,
+    "greedy": greedy_bot,
+    "random": random_bot,
+}
+
+
+def play_game(strategy, seed, max_steps=MAX_STEPS, patience=PATIENCE):
+    """
+    Plays one game with a strategy until the snake dies or the game is stopped.
+
+    Args:
+        strategy (str): The name of the strategy, a key of STRATEGIES.
+        seed (int): The seed of the food and of the bot.
+        max_steps (int, optional): The most steps the game may last.
+        patience (int, optional): The most steps the snake may go without eating.
+
+    Returns:
+        dict: The FIELDS of the game.
+    """
+    start = time.perf_counter()
+    engine = SnakeEngine(seed)
+    choose = STRATEGIES[strategy](engine, random.Random(seed))
+    score = 0
+    steps = 0
+    hungry = 0 # the steps since the snake last ate
+    cause = "steps"
+    while steps < max_steps:
+        if engine.food == -1:
+            cause = "full"
+            break
+        if hungry >= patience:
+            cause = "starved"
+            break
+        ate, died = engine.step(choose())
+        steps += 1
+        if died:
+            # the engine turned the snake before checking the cell in front of it, so the cell that killed it is known
+            cause = "wall" if engine.grid[engine.head + engine.moves[engine.direction]] == WALL else "self"
+            break
+        score += ate
+        hungry = 0 if ate else hungry + 1
+    return {
+        "strategy": strategy,
+        "seed": seed,
+        "score": score,
+        "length": len(engine.body),
+        "steps": steps,
+        "cause": cause,
+        "seconds": round(time.perf_counter() - start, 6),
+    }
+
+
+def play_shard(shard):
+    """
+    Plays a shard of games in a worker process.
+
+    Args:
+        shard (tuple[str, list[int]]): The strategy and the seeds of the games.
+
+    Returns:
+        list[dict]: The results of the games, in the order of the seeds.
+    """
+    strategy, seeds = shard
+    return [play_game(strategy, seed) for seed in seeds]
+
+
+def summarize(results):
+    """
+    Computes the summary of the games of every strategy.
+
+    Args:
+        results (list[dict]): The results of the games.
+
+    Returns:
+        dict[str, dict]: For every strategy, its number of games, mean, median and best score, mean steps and the count of every cause.
+    """
+    summary = {}
+    for strategy in dict.fromkeys(result["strategy"] for result in results):
+        games = [result for result in results if result["strategy"] == strategy]
+        scores = sorted(result["score"] for result in games)
+        causes = {}
+        for result in games:
+            causes[result["cause"]] = causes.get(result["cause"], 0) + 1
+        summary[strategy] = {
+            "games": len(games),
+            "mean_score": sum(scores) / len(scores),
+            "median_score": scores[len(scores) // 2],
+            "best_score": scores[-1],
+            "mean_steps": sum(result["steps"] for result in games) / len(games),
+            "causes": causes,
+        }
+    return summary
+
+
+def run(strategies, games=GAMES, seed=0, workers=None, output=OUTPUT, shard_size=SHARD_SIZE):
+    """
+    Plays the games of every strategy on a process pool, writes their results to a CSV file and prints the summary.
+
+    Args:
+        strategies (list[str]): The names of the strategies.
+        games (int, optional): The number of games of every strategy.
+        seed (int, optional): The seed of the first game. The games of a strategy use the seeds that follow it.
+        workers (int, optional): The number of worker processes. One per core if None.
+        output (str, optional): The path of the CSV file.
+        shard_size (int, optional): The number of games sent to a worker at once.
+
+    Returns:
+        dict[str, dict]: The summary of every strategy.
+    """
+    seeds = list(range(seed, seed + games))
+    shards = [(strategy, seeds[i:i + shard_size]) for strategy in strategies for i in range(0, games, shard_size)]
+    workers = workers or os.cpu_count() or 1
+    results = []
+    start = time.perf_counter()
+    with open(output, "w", newline="") as file, ProcessPoolExecutor(workers) as executor:
+        writer = csv.DictWriter(file, FIELDS)
+        writer.writeheader()
+        # map keeps the order of the shards, and the rows of a shard are written as soon as it and the ones before it are done
+        for shard_results in executor.map(play_shard, shards):
+            writer.writerows(shard_results)
+            file.flush()
+            results.extend(shard_results)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print(f"rollout: {len(results):,} games on {workers} workers in {elapsed:.1f} s ({len(results) / elapsed:,.1f} games/s), written to {output}")
+    for strategy, stats in summary.items():
+        causes = ", ".join(f"{cause} {count}" for cause, count in sorted(stats["causes"].items(), key=lambda item: -item[1]))
+        print(f"rollout: {strategy}: {stats['games']} games, score {stats['mean_score']:.1f} mean, {stats['median_score']} median, "
+              f"{stats['best_score']} best, {stats['mean_steps']:,.0f} steps mean, ended by {causes}")
+    return summary
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    workers = option(arguments, "--workers", None)
+    run(option(arguments, "--strategies", ",".join(STRATEGIES)).split(","), int(option(arguments, "--games", GAMES)),
+        int(option(arguments, "--seed", 0)), int(workers) if workers else None, option(arguments, "--out", OUTPUT))
@@ -0,0 +1,215 @@
+"""
+Snake Game tick scheduler
+
+This script defines the `TickScheduler` class, which runs the game's tick function at a fixed rate using the screen's timer events.
+Instead of sleeping for a fixed time after every frame (which lets the tick rate drift with the time it takes to draw),
+each tick is scheduled for an absolute deadline, and the delay to the next deadline is measured from the moment the timer is set.
+The scheduler also measures how late every tick ran, so the speed of every difficulty can be checked.
+
+The `RenderLoop` class draws frames between the ticks at the display's rate, telling the drawing function how far the game is
+into the current tick, so the snake can be drawn between its last two positions without changing the tick rate of the game.
+
+Classes:
+    - TickScheduler: A class that calls a tick function at a fixed rate with drift compensation and measures its jitter.
+    - RenderLoop: A class that draws frames between the ticks of a `TickScheduler` with the progress of the current tick.
+
+Features:
+    - Schedules ticks with `screen.ontimer` (Tk's `after`), so the game never blocks the event loop.
+    - Compensates for drift by scheduling every tick for a fixed deadline instead of a fixed delay.
+    - Skips the ticks that are already missed instead of running a burst of late ticks.
+    - Reports the number of ticks, the measured tick interval and the lateness of the ticks.
+    - Draws frames at a fixed rate between the ticks, and leaves a frame out when a tick is due so drawing never delays the game.
+"""
+
+from collections import deque
+import time
+
+# Constants for the measurements
+SAMPLES = 500 # the number of recent ticks that the statistics are computed from
+FRAME_INTERVAL = 1 / 60 # the time between two frames of a RenderLoop, in seconds
+
+
+class TickScheduler:
+    """
+    A class to call a tick function at a fixed rate.
+
+    The scheduler keeps the deadline of the next tick. After every tick it adds the interval to the deadline
+    and sets the screen's timer to the time left until it, so a slow tick shortens the wait for the next one.
+    """
+
+    def __init__(self, screen, interval, tick):
+        """
+        Initializes the TickScheduler object.
+        The deadlines are measured with time.perf_counter, or with the screen's own clock if it has one
+        (the headless screen keeps a virtual clock, so the ticks run as fast as possible).
+
+        Args:
+            screen (Screen): The screen whose `ontimer` method schedules the ticks.
+            interval (float): The time between two ticks, in seconds.
+            tick (Callable[[], None]): The function to call on every tick.
+        """
+        self.screen = screen
+        self.clock = getattr(screen, "clock", time.perf_counter)
+        self.interval = interval
+        self.tick = tick
+        self.running = False
+        self.generation = 0 # the number of times the scheduler was started, used to ignore timers of a previous run
+        self.deadline = 0.0 # the clock time of the next tick
+        self.last_tick = None # the clock time of the last tick
+        self.ticks = 0
+        self.skipped = 0 # the number of ticks that were missed and not run
+        self.intervals = deque(maxlen=SAMPLES) # the measured times between ticks, in seconds
+        self.lateness = deque(maxlen=SAMPLES) # how late each tick ran after its deadline, in seconds
+
+    def start(self):
+        """
+        Starts calling the tick function, the first tick runs one interval from now.
+        """
+        self.running = True
+        self.generation += 1
+        self.last_tick = None
+        self.deadline = self.clock() + self.interval
+        self.schedule()
+
+    def stop(self):
+        """
+        Stops calling the tick function, a timer that is already set is ignored when it fires.
+        """
+        self.running = False
+
+    def schedule(self):
+        """
+        Sets the screen's timer to the time left until the next deadline.
+        """
+        generation = self.generation
+        delay = max(0, round((self.deadline - self.clock()) * 1000))
+        self.screen.ontimer(lambda: self.run(generation), delay)
+
+    def run(self, generation):
+        """
+        Runs a tick, records its timing and schedules the next one.
+
+        Args:
+            generation (int): The run of the scheduler that set the timer.
+        """
+        if not self.running or generation != self.generation:
+            return
+
+        now = self.clock()
+        self.lateness.append(max(0.0, now - self.deadline))
+        if self.last_tick is not None:
+            self.intervals.append(now - self.last_tick)
+        self.last_tick = now
+        self.ticks += 1
+
+        self.deadline += self.interval
+        # if the tick ran more than an interval late, the missed ticks are skipped (an interval of 0 runs as fast as possible)
+        if self.interval and now - self.deadline > self.interval:
+            missed = int((now - self.deadline) / self.interval)
+            self.skipped += missed
+            self.deadline += missed * self.interval
+
+        self.tick()
+        if self.running and generation == self.generation:
+            self.schedule()
+
+    def stats(self):
+        """
+        Returns the timing statistics of the recent ticks.
+
+        Returns:
+            dict[str, float]: The number of ticks and skipped ticks, the target and mean interval,
+            the standard deviation of the interval (jitter) and the mean and maximum lateness, all times in milliseconds.
+        """
+        intervals = self.intervals or [self.interval]
+        lateness = self.lateness or [0.0]
+        mean_interval = sum(intervals) / len(intervals)
+        variance = sum((interval - mean_interval) ** 2 for interval in intervals) / len(intervals)
+        return {
+            "ticks": self.ticks,
+            "skipped": self.skipped,
+            "target_ms": self.interval * 1000,
+            "mean_interval_ms": mean_interval * 1000,
+            "jitter_ms": variance ** 0.5 * 1000,
+            "mean_late_ms": sum(lateness) / len(lateness) * 1000,
+            "max_late_ms": max(lateness) * 1000,
+        }
+
+
+class RenderLoop:
+    """
+    A class to draw frames between the ticks of a `TickScheduler`.
+
+    Every frame calls the draw function with the progress of the current tick, the time since the last tick as a part of the interval,
+    and updates the screen. The frames run on their own timer, and a frame that falls on a due tick is left out,
+    so the ticks keep their deadlines however long the frames take.
+    """
+
+    def __init__(self, screen, scheduler, draw, interval=FRAME_INTERVAL):
+        """
+        Initializes the RenderLoop object.
+
+        Args:
+            screen (Screen): The screen whose `ontimer` method schedules the frames.
+            scheduler (TickScheduler): The scheduler of the ticks the frames are drawn between.
+            draw (Callable[[float], None]): The function that draws a frame, given the progress of the tick from 0 to 1.
+            interval (float, optional): The time between two frames, in seconds.
+        """
+        self.screen = screen
+        self.scheduler = scheduler
+        self.draw = draw
+        self.interval = interval
+        self.running = False
+        self.generation = 0 # the number of times the loop was started, used to ignore timers of a previous run
+        self.frames = 0
+        self.skipped = 0 # the frames left out because a tick was due
+
+    def start(self):
+        """
+        Starts drawing frames.
+        """
+        self.running = True
+        self.generation += 1
+        self.schedule()
+
+    def stop(self):
+        """
+        Stops drawing frames, a timer that is already set is ignored when it fires.
+        """
+        self.running = False
+
+    def schedule(self):
+        """
+        Sets the screen's timer for the next frame.
+        """
+        generation = self.generation
+        self.screen.ontimer(lambda: self.run(generation), max(1, round(self.interval * 1000)))
+
+    def progress(self):
+        """
+        Returns how far the game is into the current tick.
+
+        Returns:
+            float: The time since the last tick as a part of the tick interval, from 0 to 1 (0 before the first tick).
+        """
+        scheduler = self.scheduler
+        if scheduler.last_tick is None or not scheduler.interval:
+            return 0.0
+        return min(1.0, (scheduler.clock() - scheduler.last_tick) / scheduler.interval)
+
+    def run(self, generation):
+        """
+        Draws a frame, unless a tick is due, and schedules the next one.
+
+        Args:
+            generation (int): The run of the loop that set the timer.
+        """
+        if not self.running or generation != self.generation:
+            return
+        if self.scheduler.running and self.scheduler.clock() >= self.scheduler.deadline:
+            self.skipped += 1
+        else:
+            self.draw(self.progress())
+            self.screen.update()
+            self.frames += 1
+        self.schedule()
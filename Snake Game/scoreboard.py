@@ -3,54 +3,116 @@ Snake Game Scoreboard
 
 This script defines the `ScoreBoard` class, which manages the score display for the Snake game.
 It keeps track of the current score, difficulty level, and the highest scores for each difficulty.
-The scoreboard is updated dynamically as the game progresses, and the highest scores are saved to a file.
+The scoreboard is updated dynamically as the game progresses, and every game is saved to a `HighScoreStore`.
+The scoreboard is drawn in two layers: the boundary line and the labels are drawn once,
+and each value (the score and the highest score) is a separate text item that is rewritten only when it changes.
 
 Classes:
+    - TextItem: A class that inherits from Turtle and keeps a single text item on the screen, rewriting it only when its value changes.
     - ScoreBoard: A class that inherits from Turtle and handles scoring, displaying the current score and the highest score, and updating the highest score if a new record is set.
 
 Features:
     - Displays the current score and the highest score for the selected difficulty.
-    - Draws an upper boundary line on the game screen.
-    - Reads highest scores from a file and updates them if a new record is set.
+    - Draws an upper boundary line and the labels on the game screen once.
+    - Rewrites only the text of a value that changed when the score is updated.
+    - Reads highest scores from the high-score store and records every game in it when the game ends.
     - Resets the score and updates the display when the game ends.
     - Automatically handles score refreshes and screen updates during the game.
 """
 
 
 from turtle import Turtle
+import getpass
+from highscores import HighScoreStore, LEGACY_PLAYER
 from menu import MENU_BUTTONS_TEXT
 
 # Constants for scoreboard position and the upper boundary line
-TOP = (0, 260)
 UPPER_LINE = (-300,250)
+SCORE_LOC = (-280, 260)
+HIGHEST_SCORE_LOC = (-90, 260)
+DIFFICULTY_LOC = (280, 260)
+SCORE_FONT = ("Arial", 20, "normal")
+
+
+def current_player():
+    """
+    Returns the name of the logged-in user, which is the default player name.
+
+    Returns:
+        str: The name of the player.
+    """
+    try:
+        return getpass.getuser()
+    except Exception: # getuser raises different errors when no user name is found, depending on the platform
+        return LEGACY_PLAYER
+
+
+class TextItem(Turtle):
+    """
+    A class to display a single value on the screen.
+
+    The text is written only when the value changes, and clearing it removes only this turtle's text item,
+    so the rest of the screen is not redrawn.
+    """
+
+    def __init__(self, position):
+        """
+        Initializes the TextItem object at the given position without writing anything.
+
+        Args:
+            position (tuple[float, float]): The (x, y) coordinates of the left end of the text.
+        """
+        super().__init__()
+        self.value = None # the value that is written on the screen
+        self.penup()
+        self.hideturtle()
+        self.color("white")
+        self.speed("fastest")
+        self.goto(position)
+
+    def set(self, value):
+        """
+        Writes the value on the screen, unless it is already written.
+
+        Args:
+            value (object): The value to display.
+        """
+        if value == self.value:
+            return
+        self.value = value
+        self.clear()
+        self.write(arg=f"{value}", align="left", font=SCORE_FONT)
+
 
 class ScoreBoard(Turtle):
     """
     A class to manage the score display in the Snake game.
 
     This class handles displaying the current score, the highest score for the selected difficulty, and the difficulty level itself.
-    It also reads and writes the highest scores to a file (`data.txt`).
+    It also reads the highest scores from a `HighScoreStore` and records the player's games in it.
+    The ScoreBoard turtle draws the static layer (the boundary line, the labels and the difficulty),
+    and the score and the highest score are drawn by their own `TextItem` objects.
     """
 
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, player=None, store=None):
         """
-        Initializes the ScoreBoard object, sets up the initial score and difficulty, and reads the highest scores from a file.
+        Initializes the ScoreBoard object, sets up the initial score and difficulty, and loads the high-score store.
 
         Args:
             difficulty (int): The current difficulty level selected by the player.
+            player (str, optional): The name the games are recorded under. The name of the logged-in user is used if None.
+            store (HighScoreStore, optional): The store of the high scores. The store next to the game's files is used if None.
         """
         super().__init__()
         self.score = 0 # initializes the current score
         self.difficulty = difficulty # stores the selected difficulty level
-
-        # Read the highest scores from a file and store them in a list
-        with open("data.txt", mode = "r") as d:
-            scores_str = d.readlines()
-            self.highest_scores = [int(score.strip()) for score in scores_str]
+        self.player = player if player is not None else current_player()
+        self.store = store if store is not None else HighScoreStore()
         self.penup()
         self.hideturtle()
         self.color("white")
         self.speed("fastest")
+        self.draw_background() # draws the static layer once
         self.refresh_score() # displays the initial scoreboard
 
 
@@ -61,12 +123,11 @@ class ScoreBoard(Turtle):
         self.score += 1
         self.refresh_score()
 
-    def refresh_score(self):
+    def draw_background(self):
         """
-        Clears the current scoreboard and redraws it with the updated score, highest score, and difficulty.
+        Draws the parts of the scoreboard that never change: the upper boundary line, the labels and the difficulty level.
+        The value items are placed right after their labels.
         """
-        self.clear()
-
         # draws the upper boundary line
         self.goto(UPPER_LINE)
         self.pendown()
@@ -74,25 +135,28 @@ class ScoreBoard(Turtle):
         self.forward(600)
         self.penup()
 
-        # displays the current score, highest score for the current difficulty, and the difficulty level
-        self.goto(TOP)
-        self.write(arg=f"Score: {self.score} | "
-                       f"Highest score: {self.highest_scores[self.difficulty]} | "
-                       f"Difficulty: {MENU_BUTTONS_TEXT[self.difficulty]}",
-                       align="center", font=("Arial", 20, "normal"))
+        # writes each label and places its value item where the label ends
+        self.goto(SCORE_LOC)
+        self.write(arg="Score: ", move=True, align="left", font=SCORE_FONT)
+        self.score_text = TextItem(self.position())
+        self.goto(HIGHEST_SCORE_LOC)
+        self.write(arg="Highest score: ", move=True, align="left", font=SCORE_FONT)
+        self.highest_score_text = TextItem(self.position())
+        self.goto(DIFFICULTY_LOC)
+        self.write(arg=f"Difficulty: {MENU_BUTTONS_TEXT[self.difficulty]}", align="right", font=SCORE_FONT)
+
+    def refresh_score(self):
+        """
+        Updates the displayed score and highest score, only the values that changed are rewritten.
+        """
+        self.score_text.set(self.score)
+        self.highest_score_text.set(self.store.best(self.difficulty))
 
 
     def reset(self):
         """
-        Resets the current score to 0, updates the highest score if a new record is set, and saves the new scores to a file.
+        Records the game in the high-score store, which updates the highest score if a new record is set, and resets the current score to 0.
         """
-        # checks if the current score is higher than the recorded highest score for the current difficulty
-        if self.score > self.highest_scores[self.difficulty]:
-            self.highest_scores[self.difficulty] = self.score # updates the highest score for the current difficulty
-            with open("data.txt", mode="w") as d:
-
-                # writes the updated highest scores back to the file
-                for score in self.highest_scores:
-                    d.write(f"{score}\n")
+        self.store.record(self.player, self.difficulty, self.score)
         self.score = 0
         self.refresh_score()
@@ -0,0 +1,247 @@
+"""
+Snake Game server
+
+This script runs an authoritative Snake arena for several clients from one process, on the local machine or a LAN.
+The server owns the game: it runs an `Arena` at a fixed tick with asyncio, and every client that connects over TCP takes over one of the
+arena's bot snakes and steers it by sending directions. The clients never send positions, so they cannot disagree with the server.
+A client gets one snapshot when it joins and then a small delta every tick (see protocol.py), the same bytes for every client.
+Like the game's `TickScheduler`, the ticks are scheduled for absolute deadlines, so a slow tick shortens the wait for the next one,
+and the ticks that are already missed are skipped.
+
+Classes:
+    - Client: A class that holds the connection, the snake and the queued turns of one client.
+    - Server: A class that runs the arena, accepts the clients and broadcasts the ticks.
+
+Features:
+    - Accepts up to one client per snake. A client's snake goes back to the bots when the client leaves.
+    - Applies at most one queued turn per client on every tick, with the game's `InputQueue`.
+    - Encodes every tick once and writes the same delta to every client.
+    - Disconnects a client whose unsent data grows too large, instead of letting a slow reader hold the server back.
+    - Prints the ticks, the overruns, the time of a tick and the bandwidth every few seconds.
+    - Listens on the local machine only, unless another address is given with --host (0.0.0.0 for every interface of a LAN).
+      The server has no authentication, so it should only be opened to a trusted network.
+
+Usage:
+    python server.py [--host 127.0.0.1] [--port 5005] [--snakes 100] [--foods 200] [--board 200x200] [--interval 0.075]
+"""
+
+import asyncio
+import sys
+
+from arena import Arena, SNAKES, FOODS, COLUMNS, ROWS, INTERVAL
+from options import option
+from inputs import InputQueue
+from protocol import DIRECTIONS, frame, encode_state, encode_snapshot, encode_delta
+
+# Constants for the server
+HOST = "127.0.0.1" # the local machine only, LAN play is opted into with --host
+PORT = 5005
+MAX_BUFFER = 1 << 20 # a client is disconnected when this many bytes are waiting to be sent to it
+REPORT_EVERY = 5.0 # the time between two printed reports, in seconds
+
+
+class Client:
+    """
+    A class to hold one connected client.
+    """
+
+    def __init__(self, writer, snake, clock):
+        """
+        Initializes the Client object.
+
+        Args:
+            writer (asyncio.StreamWriter): The stream the messages are written to.
+            snake (ArenaSnake): The snake the client steers.
+            clock (Callable[[], float]): The clock that times the client's key presses.
+        """
+        self.writer = writer
+        self.snake = snake
+        self.inputs = InputQueue(clock)
+        self.sent = 0 # the number of bytes sent to the client
+
+
+class Server:
+    """
+    A class to run an arena for the connected clients.
+
+    `run()` ticks the arena until it is cancelled, and `handle()` serves one client connection.
+    """
+
+    def __init__(self, snakes=SNAKES, foods=FOODS, columns=COLUMNS, rows=ROWS, interval=INTERVAL, seed=None):
+        """
+        Initializes the Server object with an arena of bots.
+
+        Args:
+            snakes (int, optional): The number of snakes, which is also the largest number of clients.
+            foods (int, optional): The number of food items.
+            columns (int, optional): The number of columns of the board.
+            rows (int, optional): The number of rows of the board.
+            interval (float, optional): The time between two ticks, in seconds.
+            seed (int, optional): The seed of the arena's random generator.
+        """
+        self.arena = Arena(snakes, foods, seed, columns, rows, players=0)
+        self.interval = interval
+        self.clients = {} # snake number -> Client
+        self.state = None # (tick, the encoded state of the tick) shared by the clients that join on the same tick
+        self.work = 0.0 # the time the last tick took, in seconds
+        self.ticks = 0
+        self.overruns = 0 # the ticks that took longer than the interval
+        self.skipped = 0 # the ticks that were missed and not run
+        self.max_work = 0.0
+        self.total_work = 0.0
+        self.sent = 0 # the number of bytes sent to all the clients
+
+    def clock(self):
+        """
+        Returns the time of the event loop, in seconds.
+        """
+        return asyncio.get_running_loop().time()
+
+    async def handle(self, reader, writer):
+        """
+        Serves a client: gives it a snake and a snapshot, then queues the turns it sends until it leaves.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of the client's turns.
+            writer (asyncio.StreamWriter): The stream the messages are written to.
+        """
+        free = [snake for snake in self.arena.snakes if snake.number not in self.clients]
+        if not free:
+            writer.close()
+            return
+        snake = free[0]
+        snake.bot = False
+        client = Client(writer, snake, self.clock)
+        self.clients[snake.number] = client
+
+        if self.state is None or self.state[0] != self.arena.ticks:
+            self.state = (self.arena.ticks, encode_state(self.arena))
+        self.send(client, frame(encode_snapshot(self.arena, self.interval, snake.number, self.state[1])))
+        try:
+            while True:
+                data = await reader.read(64)
+                if not data:
+                    break
+                for code in data:
+                    if code < len(DIRECTIONS):
+                        client.inputs.push(DIRECTIONS[code])
+        except ConnectionError:
+            pass
+        finally:
+            self.drop(client)
+
+    def send(self, client, data):
+        """
+        Writes a message to a client, or disconnects the client if it is not reading fast enough.
+
+        Args:
+            client (Client): The client.
+            data (bytes): The framed message.
+        """
+        if client.writer.transport.get_write_buffer_size() > MAX_BUFFER:
+            self.drop(client)
+            return
+        client.writer.write(data)
+        client.sent += len(data)
+        self.sent += len(data)
+
+    def drop(self, client):
+        """
+        Disconnects a client and gives its snake back to the bots.
+
+        Args:
+            client (Client): The client.
+        """
+        if self.clients.get(client.snake.number) is client:
+            del self.clients[client.snake.number]
+            client.snake.bot = True
+            client.writer.close()
+
+    def tick(self):
+        """
+        Runs one tick of the arena with the clients' turns and sends its delta to every client.
+        """
+        arena = self.arena
+        before = [(snake.body[0], snake.grow) if snake.alive else (-1, 0) for snake in arena.snakes]
+        directions = {}
+        for number, client in self.clients.items():
+            if client.snake.alive:
+                directions[number] = client.inputs.pop(client.snake.direction)
+        eaten, dead = arena.step(directions)
+        for snake in dead:
+            if snake.number in self.clients:
+                self.clients[snake.number].inputs.clear()
+
+        data = frame(encode_delta(arena, before, dead, self.work))
+        for client in list(self.clients.values()):
+            self.send(client, data)
+
+    async def run(self):
+        """
+        Ticks the arena at the fixed interval until the task is cancelled, scheduling every tick for an absolute deadline.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        report = deadline + REPORT_EVERY
+        while True:
+            deadline += self.interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            start = loop.time()
+            # if the tick runs more than an interval late, the missed ticks are skipped
+            if start - deadline > self.interval:
+                missed = int((start - deadline) / self.interval)
+                self.skipped += missed
+                deadline += missed * self.interval
+
+            self.tick()
+            self.work = loop.time() - start
+            self.ticks += 1
+            self.total_work += self.work
+            self.max_work = max(self.max_work, self.work)
+            if self.work > self.interval:
+                self.overruns += 1
+            if start >= report:
+                self.report(REPORT_EVERY + start - report)
+                report = start + REPORT_EVERY
+
+    def report(self, elapsed):
+        """
+        Prints the statistics of the ticks since the last report, and starts counting again.
+
+        Args:
+            elapsed (float): The time since the last report, in seconds.
+        """
+        clients = len(self.clients)
+        # the bandwidth per client is only printed when there are clients to share it
+        per_client = f" ({self.sent / elapsed / clients:,.0f} B/s per client)" if clients else ""
+        print(f"server: {clients} clients, {self.ticks} ticks, {self.overruns} overruns, {self.skipped} skipped, "
+              f"tick {self.total_work / max(self.ticks, 1) * 1000:.2f} ms mean, {self.max_work * 1000:.2f} ms max, "
+              f"{self.sent / elapsed / 1024:,.1f} KiB/s out{per_client}")
+        self.ticks = self.overruns = self.skipped = self.sent = 0
+        self.total_work = self.max_work = 0.0
+
+
+async def serve(server, host=HOST, port=PORT):
+    """
+    Accepts the clients and runs the server's ticks until the task is cancelled.
+
+    Args:
+        server (Server): The server.
+        host (str, optional): The address to listen on.
+        port (int, optional): The TCP port to listen on.
+    """
+    listener = await asyncio.start_server(server.handle, host, port)
+    print(f"server: listening on {host}:{port}, {len(server.arena.snakes)} snakes, tick {server.interval * 1000:.0f} ms")
+    async with listener:
+        await server.run()
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    board_columns, board_rows = option(arguments, "--board", f"{COLUMNS}x{ROWS}").lower().split("x")
+    snake_server = Server(int(option(arguments, "--snakes", SNAKES)), int(option(arguments, "--foods", FOODS)),
+                          int(board_columns), int(board_rows), float(option(arguments, "--interval", INTERVAL)))
+    try:
+        asyncio.run(serve(snake_server, option(arguments, "--host", HOST), int(option(arguments, "--port", PORT))))
+    except KeyboardInterrupt:
+        pass
@@ -1,83 +1,271 @@
 """
 Snake for Snake Game
 
-This script defines the `Snake` class, which manages the snake's body in the Snake game.
-It handles the creation, movement, extension, and reset of the snake, as well as the control of its direction.
-The snake is represented as a series of turtle objects.
+This script defines the `Snake` class, which draws the snake's body in the Snake game.
+The position and direction of the snake are kept by a `SnakeEngine`, and this class keeps a turtle segment on every cell of the engine's body.
+The snake is represented as a series of turtle objects, which are taken from and returned to a `SegmentPool`,
+so extending and resetting the snake reuses hidden turtles instead of leaving new canvas items behind on every game.
+By default the snake is drawn in "stamp" mode: a single hidden turtle stamps a square on the new head cell and clears the stamp of the tail cell,
+so a segment is a canvas item and an integer stamp id in a packed `CellRing` instead of a whole turtle with its own state and undo buffer.
+In "recycle" mode every segment is a turtle, and only the tail segment is moved to the new head cell on every tick.
+Either way drawing a move takes the same few canvas operations no matter how long the snake is.
+In "smooth" mode the cells behind the head are stamped on every tick, and a head and a tail turtle slide between the cells on every frame
+(`draw_frame`), so the snake moves in small steps at the display's rate while the game still ticks at the difficulty's rate.
+The key presses are kept in an `InputQueue` and applied one per tick, so quick presses within one tick are not lost.
 
 Classes:
-    - Snake: A class to manage the snake's body, movement, and direction.
+    - SegmentPool: A class that hands out and reclaims the snake's turtle segments.
+    - Snake: A class to draw the snake's body and control its direction.
 
 Features:
     - Creates an initial snake of three segments.
-    - Moves the snake forward while following its head.
-    - Extends the snake by adding a new segment at the tail.
-    - Resets the snake's position and state.
-    - Allows direction changes while preventing the snake from reversing onto itself.
+    - Moves the snake forward by stepping the engine and stamping the new head, moving the tail segment to it in "recycle" mode
+      (or every segment in "follow" mode).
+    - Extends the snake by adding a new segment at the tail when the engine grows it.
+    - Interpolates the head and the tail between the last two ticks in "smooth" mode, with two turtle moves per frame.
+    - Resets the snake's position and state, returning its segments to the pool.
+    - Reports how many segments are live, pooled and created in total.
+    - Queues direction changes and applies one per tick, while preventing the snake from reversing onto itself.
 
 """
 
 
+from collections import deque
 from turtle import Turtle
+from engine import UP, DOWN, RIGHT, LEFT, CellRing, to_position
+from inputs import InputQueue
+
+# Constants for the rendering modes
+STAMP = "stamp" # stamps the new head cell and clears the tail's stamp, one turtle for the whole snake
+SMOOTH = "smooth" # stamps the cell behind the head, and slides a head and a tail turtle between the cells on every frame
+RECYCLE = "recycle" # moves the tail segment to the new head cell, a constant number of canvas operations per tick
+FOLLOW = "follow" # moves every segment to the cell of the segment ahead of it
+
+
+class SegmentPool:
+    """
+    A class to reuse the turtle segments of the snake.
+
+    A turtle's canvas item stays on the screen even after it is hidden, so segments that are not needed anymore are hidden
+    and kept here, and the next segment is taken from the pool before a new turtle is created.
+    """
+
+    def __init__(self):
+        """
+        Initializes the SegmentPool object with no segments.
+        """
+        self.segments = [] # hidden segments that are ready to be reused
+        self.live = 0 # the number of segments that are handed out
+        self.created = 0 # the number of turtles created by the pool
+
+    @property
+    def pooled(self):
+        """
+        int: The number of hidden segments in the pool.
+        """
+        return len(self.segments)
+
+    def acquire(self, position):
+        """
+        Hands out a segment at the given position, reusing a pooled segment if there is one.
+
+        Args:
+            position (tuple[float, float]): The (x, y) coordinates where the segment will be placed.
+
+        Returns:
+            Turtle: The segment.
+        """
+        if self.segments:
+            segment = self.segments.pop()
+            segment.setheading(RIGHT)
+            segment.goto(position)
+            segment.showturtle()
+        else:
+            segment = Turtle(shape="square")
+            segment.penup()
+            segment.color("White")
+            segment.goto(position)
+            self.created += 1
+        self.live += 1
+        return segment
+
+    def release(self, segment):
+        """
+        Hides a segment and keeps it in the pool.
+
+        Args:
+            segment (Turtle): The segment that is no longer part of the snake.
+        """
+        segment.hideturtle()
+        self.segments.append(segment)
+        self.live -= 1
+
+    def counters(self):
+        """
+        Returns the counters of the pool.
+
+        Returns:
+            dict[str, int]: The number of live, pooled and created segments.
+        """
+        return {"live": self.live, "pooled": self.pooled, "created": self.created}
 
-# Constants for snake movement and segment positioning
-NEXT_PART_POSITION = 20
-MOVE_DISTANCE = 20
-UP = 90
-DOWN = 270
-RIGHT = 0
-LEFT = 180
 
 class Snake:
     """
     A class to manage the Snake in the Snake game.
 
-    The `Snake` class creates a snake composed of turtle segments that can move, extend, and change direction.
+    The `Snake` class draws the body of a `SnakeEngine` as turtle segments, moves it and changes its direction.
     The snake cannot reverse onto itself and can be reset to its initial state.
     """
 
-    def __init__(self):
+    def __init__(self, engine, pool=None, render_mode=STAMP, inputs=None):
         """
         Initializes the Snake object, creating the initial snake segments and setting the head reference.
+
+        Args:
+            engine (SnakeEngine): The engine that holds the snake's cells and applies the game rules.
+            pool (SegmentPool, optional): The pool to take the segments from. A new pool is used if None.
+            render_mode (str, optional): STAMP, SMOOTH, RECYCLE or FOLLOW, the way the segments are drawn on every tick.
+            inputs (InputQueue, optional): The queue that holds the key presses. A new queue is used if None.
         """
-        self.snake_body = [] # list to store the segments of the snake
+        self.engine = engine
+        self.pool = pool if pool is not None else SegmentPool()
+        self.render_mode = render_mode
+        self.inputs = inputs if inputs is not None else InputQueue()
+        self.next_direction = None # the direction to turn to on the next move (None keeps the current one)
+        self.snake_body = deque() # the segments of the snake, from head to tail (not used in STAMP mode)
+        self.stamps = CellRing() # the stamp ids of the segments in STAMP and SMOOTH modes, from head to tail
+        self.pen = None # the turtle that stamps the segments in STAMP and SMOOTH modes
+        self.runners = () # the head and the tail turtles in SMOOTH mode
+        self.paths = () # the (start, end) positions of the runners between the last two ticks in SMOOTH mode
+        if render_mode in (STAMP, SMOOTH):
+            self.pen = self.pool.acquire(to_position(self.engine.head))
+            self.pen.hideturtle()
+            self.pen.setundobuffer(1) # every stamp pushes an undo entry, and clearing a stamp searches the whole buffer for it
+        if render_mode == SMOOTH:
+            self.runners = (self.pool.acquire(to_position(self.engine.head)), self.pool.acquire(to_position(self.engine.tail)))
         self.create_snake()  # creates the initial snake body
-        self.snake_head = self.snake_body[0] # references to the head of the snake
 
     def create_snake(self):
         """
-        Creates the initial snake consisting of three segments placed horizontally.
+        Creates the initial snake, one segment for each cell of the engine's body.
         """
-        x_cor = 0
-        for i in range(3):
-            self.add_part((x_cor, 0))
-            x_cor -= NEXT_PART_POSITION
+        if self.render_mode == STAMP:
+            # the stamps are made from the tail to the head, so the pen is left on the head
+            for cell in reversed(list(self.engine.body)):
+                self.pen.goto(to_position(cell))
+                self.stamps.appendleft(self.pen.stamp())
+            self.snake_head = self.pen # references to the head of the snake
+            return
+        if self.render_mode == SMOOTH:
+            # the head's cell is not stamped, the head turtle covers it until the next tick
+            for cell in reversed(list(self.engine.body)[1:]):
+                self.pen.goto(to_position(cell))
+                self.stamps.appendleft(self.pen.stamp())
+            ends = (to_position(self.engine.head), to_position(self.engine.tail))
+            self.paths = tuple((end, end) for end in ends)
+            self.draw_frame(1.0)
+            self.snake_head = self.runners[0]
+            return
+        for cell in self.engine.body:
+            self.add_part(to_position(cell))
+        self.snake_head = self.snake_body[0]
 
 
+    def take_input(self):
+        """
+        Takes the next queued key press as the direction of the next move. Called once on every tick, before `move_forward`.
+        """
+        self.next_direction = self.inputs.pop(self.engine.direction)
+
     def move_forward(self):
         """
-        Moves the snake forward by updating the position of each segment to follow the segment ahead of it.
+        Moves the snake forward by stepping the engine and moving the segments to the new cells of its body.
+
+        Returns:
+            tuple[bool, bool]: (ate, died), the events of the engine's step.
+        """
+        ate, died = self.engine.step(self.next_direction)
+        self.next_direction = None
+        if died:
+            return ate, died
+
+        if self.render_mode == STAMP:
+            self.stamp_head()
+        elif self.render_mode == SMOOTH:
+            self.stamp_behind_head()
+        elif self.render_mode == RECYCLE:
+            self.recycle_tail()
+        else:
+            self.follow_head()
+        self.snake_head.setheading(self.engine.direction)
+        return ate, died
+
+    def stamp_head(self):
+        """
+        Stamps the new head cell and clears the stamp of the tail cell, unless the engine kept the tail in place.
+        """
+        self.pen.goto(to_position(self.engine.head))
+        self.stamps.appendleft(self.pen.stamp())
+        if len(self.stamps) > len(self.engine.body):
+            self.pen.clearstamp(self.stamps.pop())
+
+    def stamp_behind_head(self):
+        """
+        Stamps the cell the head just left and clears the stamp of the cell the tail left, then starts the head and the tail turtles
+        on their way to the new head and tail cells. The turtles only move when `draw_frame` is called.
         """
-        for rev_part in range(len(self.snake_body) - 1, 0, -1): # starts from the last segment
-            new_x = self.snake_body[rev_part - 1].xcor()
-            new_y = self.snake_body[rev_part - 1].ycor()
-            self.snake_body[rev_part].goto(new_x, new_y) # moves the current segment to the next segment position
+        body = self.engine.body
+        self.pen.goto(to_position(body[1]))
+        self.stamps.appendleft(self.pen.stamp())
+        if len(self.stamps) >= len(body):
+            self.pen.clearstamp(self.stamps.pop())
+        ends = (to_position(body[0]), to_position(body[-1]))
+        self.paths = tuple((path[1], end) for path, end in zip(self.paths, ends))
 
-        self.snake_head.forward(MOVE_DISTANCE) # moves the head forward
+    def draw_frame(self, progress):
+        """
+        Moves the head and the tail turtles part of the way between their cells of the last two ticks. Does nothing outside SMOOTH mode.
+
+        Args:
+            progress (float): The part of the tick interval that has passed since the last tick, from 0 to 1.
+        """
+        for runner, ((start_x, start_y), (end_x, end_y)) in zip(self.runners, self.paths):
+            runner.goto(start_x + (end_x - start_x) * progress, start_y + (end_y - start_y) * progress)
+
+    def recycle_tail(self):
+        """
+        Moves the tail segment to the new head cell, or adds a new head segment if the engine kept the tail in place.
+        """
+        head_position = to_position(self.engine.head)
+        if len(self.snake_body) < len(self.engine.body):
+            part = self.pool.acquire(head_position)
+        else:
+            part = self.snake_body.pop()
+            part.goto(head_position)
+        self.snake_body.appendleft(part)
+        self.snake_head = part
+
+    def follow_head(self):
+        """
+        Moves every segment to its cell in the engine's body, adding a segment at the tail if the engine grew the snake.
+        """
+        # the engine grows the snake by keeping the tail in place, a new segment covers the extra cell
+        while len(self.snake_body) < len(self.engine.body):
+            self.extend()
+
+        for part, cell in zip(self.snake_body, self.engine.body):
+            part.goto(to_position(cell))
 
 
     def add_part(self, position):
         """
-        Adds a new segment to the snake at the specified position.
+        Adds a segment from the pool to the snake at the specified position.
 
         Args:
             position (tuple[float, float]): The (x, y) coordinates where the new segment will be placed.
         """
-        snake_part = Turtle(shape="square")
-        snake_part.penup()
-        snake_part.color("White")
-        snake_part.goto(position)
-        self.snake_body.append(snake_part)
+        self.snake_body.append(self.pool.acquire(position))
 
 
     def extend(self):
@@ -87,40 +275,44 @@ class Snake:
         self.add_part(self.snake_body[-1].position())
 
 
-    def reset(self):
+    def reset(self, seed=None):
         """
-        Resets the snake to its initial state by hiding all segments and recreating the snake.
+        Resets the snake to its initial state by returning all segments to the pool, resetting the engine and recreating the snake.
+
+        Args:
+            seed (int, optional): A new seed for the engine's random generator. The generator goes on if None.
         """
         for part in self.snake_body:
-            part.hideturtle()
+            self.pool.release(part)
         self.snake_body.clear()
-        self.__init__()
+        if self.pen is not None:
+            self.pen.clearstamps()
+            self.stamps.clear()
+        self.engine.reset(seed)
+        self.next_direction = None
+        self.inputs.clear()
+        self.create_snake()
 
     def right(self):
         """
-        Changes the direction of the snake head to the right if it is not already facing left.
+        Queues a turn to the right, it is ignored if the snake will be facing left when the turn is applied.
         """
-        if self.snake_head.heading() != LEFT:
-            self.snake_head.setheading(RIGHT)
+        self.inputs.push(RIGHT)
 
     def up(self):
         """
-        Changes the direction of the snake head to up if it is not already facing down.
+        Queues a turn up, it is ignored if the snake will be facing down when the turn is applied.
         """
-        if self.snake_head.heading() != DOWN:
-            self.snake_head.setheading(UP)
+        self.inputs.push(UP)
 
     def left(self):
         """
-        Changes the direction of the snake head to the left if it is not already facing right.
+        Queues a turn to the left, it is ignored if the snake will be facing right when the turn is applied.
         """
-        if self.snake_head.heading() != RIGHT:
-            self.snake_head.setheading(LEFT)
+        self.inputs.push(LEFT)
 
     def down(self):
         """
-        Changes the direction of the snake head to down if it is not already facing up.
+        Queues a turn down, it is ignored if the snake will be facing up when the turn is applied.
         """
-        if self.snake_head.heading() != UP:
-            self.snake_head.setheading(DOWN)
-
+        self.inputs.push(DOWN)
@@ -0,0 +1,449 @@
+"""
+Snake Game viewport
+
+This script draws Snake games on boards that are larger than the screen, such as arena boards of 500x500 cells.
+A `Camera` shows a window of the board the size of the classic play field (29x27 cells) and scrolls to keep the snake's head inside it.
+Only the snake cells and the food inside the window are drawn: every drawn cell has a turtle from a `SegmentPool`,
+and the other cells of the board have none, so the number of turtles never grows beyond the size of the window.
+While the camera stays still, a move only draws the new head cell and erases the old tail cell, like the classic snake.
+When the camera scrolls, the rows of the window are scanned in the engine's occupancy grid and the visible segments are moved to their new places.
+Either way the time of a frame depends on the size of the window, not on the size of the board or the length of the snake.
+
+Classes:
+    - Camera: A class that keeps the window of the board that is shown on the screen.
+    - ViewportSnake: A class to draw the snake and the food of a large board through a camera.
+    - ArenaView: A class to draw the snakes and the food of an arena through a camera that follows the player's snake.
+
+Features:
+    - Follows the snake's head, scrolling only when the head comes close to an edge of the window.
+    - Stops scrolling at the edges of the board, so the edges of the screen are the walls there, as on the classic board.
+    - Draws only the snake segments and the food that are inside the window.
+    - Reuses the turtles of the segments that leave the window for the segments that enter it.
+    - Draws the many snakes and food items of an arena, the player's snake in white and every bot in its own color.
+"""
+
+from engine import UP, DOWN, RIGHT, LEFT, COLUMNS, ROWS, CELL_SIZE, MIN_X, MIN_Y, SNAKE, FOOD
+from food import Food
+from inputs import InputQueue
+from snake import SegmentPool
+
+# Constants for the camera
+VIEW_COLUMNS = COLUMNS # the window is the size of the classic play field
+VIEW_ROWS = ROWS
+MARGIN = 8 # the camera scrolls when the head comes closer than this many cells to an edge of the window
+
+# Constants for drawing an arena
+PLAYER_COLOR = "white"
+BOT_COLORS = ("red", "orange", "yellow", "green", "cyan", "blue", "purple", "pink")
+FOOD_STYLE = "food" # the style of the turtles that draw food, the snake segments are styled by their color
+
+
+class Camera:
+    """
+    A class to keep the window of the board that is shown on the screen.
+
+    `column` and `row` are the board cell shown in the bottom left corner of the play field, at (MIN_X, MIN_Y) on the screen.
+    """
+
+    def __init__(self, columns, rows, view_columns=VIEW_COLUMNS, view_rows=VIEW_ROWS, margin=MARGIN):
+        """
+        Initializes the Camera object in the bottom left corner of the board.
+
+        Args:
+            columns (int): The number of columns of the board.
+            rows (int): The number of rows of the board.
+            view_columns (int, optional): The number of columns the window shows.
+            view_rows (int, optional): The number of rows the window shows.
+            margin (int, optional): The number of cells the head is kept away from the edges of the window.
+        """
+        self.columns = columns
+        self.rows = rows
+        self.view_columns = view_columns
+        self.view_rows = view_rows
+        self.margin = margin
+        self.column = 0
+        self.row = 0
+
+    def move_to(self, column, row):
+        """
+        Moves the window so its bottom left corner is the given cell, stopping at the edges of the board.
+
+        Args:
+            column (int): The column of the bottom left cell.
+            row (int): The row of the bottom left cell.
+
+        Returns:
+            bool: True if the window moved.
+        """
+        # a board smaller than the window is shown from its bottom left corner
+        column = max(0, min(column, self.columns - self.view_columns))
+        row = max(0, min(row, self.rows - self.view_rows))
+        if (column, row) == (self.column, self.row):
+            return False
+        self.column, self.row = column, row
+        return True
+
+    def center(self, column, row):
+        """
+        Moves the window so it is centered on a cell.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            bool: True if the window moved.
+        """
+        return self.move_to(column - self.view_columns // 2, row - self.view_rows // 2)
+
+    def follow(self, column, row):
+        """
+        Scrolls the window just enough to keep a cell at least `margin` cells away from its edges.
+
+        Args:
+            column (int): The column of the cell, usually the snake's head.
+            row (int): The row of the cell.
+
+        Returns:
+            bool: True if the window moved.
+        """
+        new_column = min(max(self.column, column - self.view_columns + self.margin + 1), column - self.margin)
+        new_row = min(max(self.row, row - self.view_rows + self.margin + 1), row - self.margin)
+        return self.move_to(new_column, new_row)
+
+    def contains(self, column, row):
+        """
+        Checks if a cell is inside the window.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            bool: True if the cell is shown on the screen.
+        """
+        return (self.column <= column < self.column + self.view_columns
+                and self.row <= row < self.row + self.view_rows)
+
+    def to_position(self, column, row):
+        """
+        Converts a cell of the board to the screen coordinates of its center in the window.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            tuple[int, int]: The (x, y) screen coordinates.
+        """
+        return MIN_X + (column - self.column) * CELL_SIZE, MIN_Y + (row - self.row) * CELL_SIZE
+
+
+class ViewportSnake:
+    """
+    A class to draw the snake and the food of a `SnakeEngine` on a board of any size through a `Camera`.
+
+    It has the same interface as the `Snake` class (`move_forward`, `take_input`, `reset` and the direction methods),
+    and also draws the food, since the food's place on the screen changes whenever the camera scrolls.
+    `segments` maps every drawn board cell to the turtle on it.
+    """
+
+    def __init__(self, engine, pool=None, inputs=None, camera=None):
+        """
+        Initializes the ViewportSnake object and draws the window around the snake's head.
+
+        Args:
+            engine (SnakeEngine): The engine that holds the snake's cells and applies the game rules.
+            pool (SegmentPool, optional): The pool to take the segments from. A new pool is used if None.
+            inputs (InputQueue, optional): The queue that holds the key presses. A new queue is used if None.
+            camera (Camera, optional): The camera that chooses the window. A camera with the classic window size is used if None.
+        """
+        self.engine = engine
+        self.pool = pool if pool is not None else SegmentPool()
+        self.inputs = inputs if inputs is not None else InputQueue()
+        self.camera = camera if camera is not None else Camera(engine.columns, engine.rows)
+        self.next_direction = None # the direction to turn to on the next move (None keeps the current one)
+        self.segments = {} # board cell -> the turtle drawn on it
+        self.food = Food(self.camera.to_position(*engine.coordinates(engine.food)))
+        self.food_cell = engine.food # the food cell that is drawn
+        self.center()
+
+    def take_input(self):
+        """
+        Takes the next queued key press as the direction of the next move. Called once on every tick, before `move_forward`.
+        """
+        self.next_direction = self.inputs.pop(self.engine.direction)
+
+    def move_forward(self):
+        """
+        Moves the snake forward by stepping the engine, then draws the cells that changed, or the whole window if the camera scrolled.
+
+        Returns:
+            tuple[bool, bool]: (ate, died), the events of the engine's step.
+        """
+        engine = self.engine
+        tail = engine.tail
+        ate, died = engine.step(self.next_direction)
+        self.next_direction = None
+        if died:
+            return ate, died
+
+        if self.camera.follow(*engine.coordinates(engine.head)):
+            self.draw_window()
+        else:
+            # the old tail cell is empty unless the snake grew or the head moved into it
+            if engine.grid[tail] != SNAKE and tail in self.segments:
+                self.pool.release(self.segments.pop(tail))
+            self.draw_cell(engine.head)
+        self.draw_food()
+        return ate, died
+
+    def draw_cell(self, cell):
+        """
+        Draws a segment on a snake cell if it is inside the window.
+
+        Args:
+            cell (int): The board cell of the segment.
+        """
+        if cell in self.segments:
+            return
+        column, row = self.engine.coordinates(cell)
+        if self.camera.contains(column, row):
+            self.segments[cell] = self.pool.acquire(self.camera.to_position(column, row))
+
+    def visible_cells(self):
+        """
+        Finds the snake cells inside the window by scanning its rows of the occupancy grid.
+
+        Returns:
+            list[int]: The board cells of the visible segments.
+        """
+        engine = self.engine
+        camera = self.camera
+        grid = engine.grid
+        columns = min(camera.view_columns, engine.columns - camera.column)
+        cells = []
+        for row in range(camera.row, min(camera.row + camera.view_rows, engine.rows)):
+            start = engine.cell(camera.column, row)
+            end = start + columns
+            cell = grid.find(SNAKE, start, end)
+            while cell != -1:
+                cells.append(cell)
+                cell = grid.find(SNAKE, cell + 1, end)
+        return cells
+
+    def draw_window(self):
+        """
+        Redraws the segments of the whole window after the camera moved.
+        The turtles that are already drawn are moved to the visible cells, so a scroll only creates or hides the turtles of the difference.
+        """
+        # every segment moves on the screen when the camera scrolls, so the turtles are handed out again in any order
+        parts = list(self.segments.values())
+        self.segments = {}
+        for cell in self.visible_cells():
+            position = self.camera.to_position(*self.engine.coordinates(cell))
+            if parts:
+                part = parts.pop()
+                part.goto(position)
+            else:
+                part = self.pool.acquire(position)
+            self.segments[cell] = part
+        for part in parts:
+            self.pool.release(part)
+
+    def draw_food(self):
+        """
+        Draws the food on its cell if it is inside the window and hides it otherwise. New food gets a new random look.
+        """
+        engine = self.engine
+        if engine.food == -1:
+            self.food.hideturtle()
+            return
+        column, row = engine.coordinates(engine.food)
+        if not self.camera.contains(column, row):
+            self.food.hideturtle()
+        else:
+            position = self.camera.to_position(column, row)
+            if engine.food != self.food_cell:
+                self.food.respawn(position)
+            elif self.food.position() != position:
+                self.food.goto(position)
+            self.food.showturtle()
+        self.food_cell = engine.food
+
+    def center(self):
+        """
+        Centers the camera on the snake's head and draws the window.
+        """
+        self.camera.center(*self.engine.coordinates(self.engine.head))
+        self.draw_window()
+        self.draw_food()
+
+    def clear(self):
+        """
+        Returns all the segments to the pool and hides the food.
+        """
+        for part in self.segments.values():
+            self.pool.release(part)
+        self.segments = {}
+        self.food.hideturtle()
+
+    def reset(self, seed=None):
+        """
+        Resets the snake to its initial state by resetting the engine and drawing the window around the new snake.
+
+        Args:
+            seed (int, optional): A new seed for the engine's random generator. The generator goes on if None.
+        """
+        self.engine.reset(seed)
+        self.next_direction = None
+        self.inputs.clear()
+        self.center()
+
+    def right(self):
+        """
+        Queues a turn to the right, it is ignored if the snake will be facing left when the turn is applied.
+        """
+        self.inputs.push(RIGHT)
+
+    def up(self):
+        """
+        Queues a turn up, it is ignored if the snake will be facing down when the turn is applied.
+        """
+        self.inputs.push(UP)
+
+    def left(self):
+        """
+        Queues a turn to the left, it is ignored if the snake will be facing right when the turn is applied.
+        """
+        self.inputs.push(LEFT)
+
+    def down(self):
+        """
+        Queues a turn down, it is ignored if the snake will be facing up when the turn is applied.
+        """
+        self.inputs.push(DOWN)
+
+
+class ArenaView:
+    """
+    A class to draw an `Arena` through a `Camera` that follows the player's snake.
+
+    Every tick the rows of the window are scanned for snake and food cells, so the work of a frame depends on the size of the window,
+    not on the number of snakes. `items` maps every drawn cell to its turtle and the style it is drawn with (a color or FOOD_STYLE),
+    and a cell that is drawn the same way on the next frame keeps its turtle untouched while the camera does not move.
+    """
+
+    def __init__(self, arena, player, pool=None, camera=None):
+        """
+        Initializes the ArenaView object.
+
+        Args:
+            arena (Arena): The arena to draw.
+            player (ArenaSnake): The snake the camera follows.
+            pool (SegmentPool, optional): The pool to take the turtles from. A new pool is used if None.
+            camera (Camera, optional): The camera that chooses the window. A camera with the classic window size is used if None.
+        """
+        self.arena = arena
+        self.player = player
+        self.pool = pool if pool is not None else SegmentPool()
+        self.camera = camera if camera is not None else Camera(arena.columns, arena.rows)
+        self.items = {} # board cell -> (turtle, style)
+        self.drawn_at = None # the (column, row) of the camera when the window was last drawn
+
+    def style(self, cell, content):
+        """
+        Returns the style a cell is drawn with.
+
+        Args:
+            cell (int): The board cell.
+            content (int): The content of the cell, SNAKE or FOOD.
+
+        Returns:
+            str: FOOD_STYLE, or the color of the snake on the cell.
+        """
+        if content == FOOD:
+            return FOOD_STYLE
+        owner = self.arena.owners[cell]
+        return PLAYER_COLOR if owner == self.player.number else BOT_COLORS[owner % len(BOT_COLORS)]
+
+    def visible_cells(self):
+        """
+        Finds the snake and food cells inside the window by scanning its rows of the occupancy grid.
+
+        Returns:
+            list[tuple[int, int]]: (cell, content) pairs of the cells to draw.
+        """
+        arena = self.arena
+        camera = self.camera
+        grid = arena.grid
+        columns = min(camera.view_columns, arena.columns - camera.column)
+        cells = []
+        for row in range(camera.row, min(camera.row + camera.view_rows, arena.rows)):
+            start = arena.cell(camera.column, row)
+            end = start + columns
+            # most cells of a row are empty, so the row is skipped with one count when nothing is on it
+            if grid.count(0, start, end) == columns:
+                continue
+            for content in (SNAKE, FOOD):
+                cell = grid.find(content, start, end)
+                while cell != -1:
+                    cells.append((cell, content))
+                    cell = grid.find(content, cell + 1, end)
+        return cells
+
+    def draw(self):
+        """
+        Moves the camera to follow the player's snake and draws the window.
+        """
+        camera = self.camera
+        if self.player.alive:
+            camera.follow(*self.arena.coordinates(self.player.head))
+        moved = (camera.column, camera.row) != self.drawn_at
+        self.drawn_at = (camera.column, camera.row)
+
+        # a cell that is drawn with the same style keeps its turtle, which only moves if the camera did
+        old = self.items
+        self.items = {}
+        changed = [] # the cells that need another turtle or style
+        for cell, content in self.visible_cells():
+            style = self.style(cell, content)
+            item = old.pop(cell, None)
+            if item is not None and item[1] == style:
+                if moved:
+                    item[0].goto(camera.to_position(*self.arena.coordinates(cell)))
+                self.items[cell] = item
+            else:
+                if item is not None:
+                    old[cell] = item # the turtle is handed to another cell below
+                changed.append((cell, style))
+
+        # the turtles of the cells that are not drawn anymore are moved to the cells that changed
+        spare = list(old.values())
+        for cell, style in changed:
+            position = camera.to_position(*self.arena.coordinates(cell))
+            if spare:
+                part, part_style = spare.pop()
+                part.goto(position)
+            else:
+                part, part_style = self.pool.acquire(position), None
+            if part_style != style:
+                if style == FOOD_STYLE:
+                    part.shape("circle")
+                    part.shapesize(stretch_len=0.5, stretch_wid=0.5)
+                    part.color("yellow")
+                else:
+                    part.shape("square")
+                    part.shapesize(stretch_len=1, stretch_wid=1)
+                    part.color(style)
+            self.items[cell] = (part, style)
+        for part, part_style in spare:
+            self.pool.release(part)
+
+    def clear(self):
+        """
+        Returns all the turtles to the pool.
+        """
+        for part, style in self.items.values():
+            self.pool.release(part)
+        self.items = {}
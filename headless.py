@@ -0,0 +1,579 @@
+"""
+Headless runner
+
+This script runs the Turtle games of this repository (or any script that uses them) without a display.
+It installs a "null" backend in place of the `turtle` module: its `Screen` and `Turtle` classes support the calls the games make
+(`goto`, `distance`, `write`, `onkey`, `ontimer`, `update` and so on), keep the positions and headings the game logic reads back,
+and draw nothing. The game classes run unmodified and at full CPU speed.
+Methods that only change the look of the window or of a turtle (`color`, `shapesize`, `tracer`, ...) do nothing,
+and any other method the backend does not know raises AttributeError, so a call the real module would fail on is not silently skipped.
+The turtles also keep an undo buffer that `stamp` and `clearstamp` use the way the real module does.
+
+Timers run on a virtual clock: `mainloop` runs the timer callbacks in order of their due time without sleeping, and moves the clock to each one.
+Input comes from a script of clicks and key presses, indexed by frame (the number of `update` calls so far),
+and optionally from random key presses every few frames, which makes soak tests easy.
+While the game waits for input with no timer set, idle frames are counted so the script can go on (and click a menu, for example).
+
+Classes:
+    - NullScreen: A screen that keeps the event handlers and timers of the game and draws nothing.
+    - NullTurtle: A turtle that keeps its position, heading and canvas items and draws nothing.
+    - ScriptedInput: A class that sends the scripted clicks and key presses to the screen on their frames.
+
+Features:
+    - Runs Snake Game/main.py, Pong Game/main.py or a benchmark script on a display-less machine.
+    - Runs timers on a virtual clock, so timed games run as fast as the CPU allows.
+    - Counts canvas items like Tk does, so item leaks can be measured headless.
+    - Keeps the list of turtles on the screen, so the turtles a frame would redraw can be counted.
+    - Stops after a number of frames and prints the frames per second.
+
+Usage:
+    python headless.py [--input SCRIPT] [--random-keys KEYS] [--key-every N] [--frames N] [--seed N] GAME_SCRIPT [ARGS...]
+
+    Every line of an input script is `<frame> <action> [args]` or `every <n> <action> [args]`, where the action is
+    `click <x> <y>`, `key <name>` or `stop`. Lines starting with "#" are comments.
+"""
+
+from collections import deque
+import heapq
+import math
+import os
+import random
+import runpy
+import sys
+import time
+import types
+
+# Constants for the null backend
+DEFAULT_FONT = ("Arial", 8, "normal")
+CHAR_WIDTH = 0.6 # the width of a character of text, as a fraction of the font size
+UNDO_SIZE = 1000 # the size of a new turtle's undo buffer, the same as the real module's default
+SCREEN_NO_OPS = {"setup", "bgcolor", "bgpic", "title", "tracer", "listen", "delay", "colormode", "mode", "register_shape", "addshape", "screensize"}
+TURTLE_NO_OPS = {"shape", "color", "pencolor", "fillcolor", "speed", "pensize", "width", "shapesize", "turtlesize", "resizemode", "tilt", "settiltangle"}
+
+
+class Terminator(Exception):
+    """
+    Raised to stop the game, the same way the turtle module stops when its window is closed.
+    """
+
+
+class NullScreen:
+    """
+    A class to stand in for the turtle screen.
+
+    The screen keeps the click and key handlers, the timers and the canvas items of the game, and counts the frames drawn by `update`.
+    """
+
+    def __init__(self):
+        """
+        Initializes the NullScreen object with no handlers, no timers and a virtual clock at 0.
+        """
+        self.now = 0.0 # the virtual clock, in seconds
+        self.frames = 0 # the number of update calls
+        self.timers = [] # a heap of (due time, order, function)
+        self.closed = False # whether `bye` closed the screen
+        self.quitting = False # whether `quit` was called since `mainloop` started
+        self.timer_count = 0 # the order of the timers, so timers that are due together run in the order they were set
+        self.click_handler = None
+        self.key_handlers = {}
+        self.items = set() # the ids of the canvas items that would be on a Tk canvas
+        self.turtle_list = [] # the turtles on the screen, in the order they were created
+        self.next_item = 1
+        self.input = None # the ScriptedInput that is told about every frame
+        self.max_frames = None # the frame to stop on
+
+    def clock(self):
+        """
+        Returns the time of the virtual clock, used by schedulers instead of time.perf_counter.
+
+        Returns:
+            float: The virtual time, in seconds.
+        """
+        return self.now
+
+    def new_item(self):
+        """
+        Adds a canvas item and returns its id.
+
+        Returns:
+            int: The id of the new item.
+        """
+        item = self.next_item
+        self.next_item += 1
+        self.items.add(item)
+        return item
+
+    def update(self):
+        """
+        Counts a frame, feeds the scripted input for it and stops the game if the last frame was reached.
+        """
+        self.frames += 1
+        if self.input is not None:
+            self.input.feed(self, self.frames)
+        if self.max_frames is not None and self.frames >= self.max_frames:
+            raise Terminator
+
+    def ontimer(self, fun, t=0):
+        """
+        Sets a timer on the virtual clock.
+
+        Args:
+            fun (Callable[[], None]): The function to call.
+            t (int, optional): The delay, in milliseconds.
+        """
+        self.timer_count += 1
+        heapq.heappush(self.timers, (self.now + t / 1000, self.timer_count, fun))
+
+    def mainloop(self):
+        """
+        Runs the timers in order of their due time, moving the virtual clock to each one.
+        When no timer is set (the game is waiting for a click or a key) and the input script has more to send,
+        idle frames are counted so the script goes on.
+        Returns when the screen is closed, when `quit` is called, or when there are no timers and no input left.
+        """
+        self.quitting = False
+        while not self.closed and not self.quitting:
+            if self.timers:
+                due, order, fun = heapq.heappop(self.timers)
+                self.now = max(self.now, due)
+                fun()
+            elif self.input is not None and self.input.pending(self.frames):
+                self.update()
+            else:
+                return
+
+    def onscreenclick(self, fun, btn=1, add=None):
+        """
+        Sets the click handler.
+
+        Args:
+            fun (Callable[[float, float], None]): The function to call with the coordinates of a click, or None.
+        """
+        self.click_handler = fun
+
+    def onkey(self, fun, key):
+        """
+        Sets the handler of a key.
+
+        Args:
+            fun (Callable[[], None]): The function to call when the key is pressed, or None.
+            key (str): The name of the key.
+        """
+        self.key_handlers[key] = fun
+
+    def onkeypress(self, fun, key=None):
+        """
+        Sets the handler of a key, like `onkey`.
+
+        Args:
+            fun (Callable[[], None]): The function to call when the key is pressed, or None.
+            key (str, optional): The name of the key.
+        """
+        self.key_handlers[key] = fun
+
+    onkeyrelease = onkey
+
+    def click(self, x, y):
+        """
+        Sends a click to the click handler.
+
+        Args:
+            x (float): The x-coordinate of the click.
+            y (float): The y-coordinate of the click.
+        """
+        if self.click_handler is not None:
+            self.click_handler(x, y)
+
+    def press(self, key):
+        """
+        Sends a key press to the key's handler.
+
+        Args:
+            key (str): The name of the key.
+        """
+        handler = self.key_handlers.get(key)
+        if handler is not None:
+            handler()
+
+    def bye(self):
+        """
+        Closes the screen: the timers are dropped and `mainloop` returns, like closing the window.
+        """
+        self.closed = True
+        self.timers.clear()
+
+    def quit(self):
+        """
+        Makes `mainloop` return and keeps the timers, like `quit` on the Tk canvas.
+        """
+        self.quitting = True
+
+    def getcanvas(self):
+        """
+        Returns the screen itself, which answers the canvas queries the benchmarks make.
+
+        Returns:
+            NullScreen: The screen.
+        """
+        return self
+
+    def find_all(self):
+        """
+        Returns the ids of the canvas items, like `Canvas.find_all`.
+
+        Returns:
+            tuple[int]: The ids of the items.
+        """
+        return tuple(self.items)
+
+    def turtles(self):
+        """
+        Returns the turtles on the screen, like `TurtleScreen.turtles`.
+
+        Returns:
+            list[NullTurtle]: The turtles, in the order they were created.
+        """
+        return self.turtle_list
+
+    def clearscreen(self):
+        """
+        Removes all the turtles and canvas items from the screen, like `TurtleScreen.clearscreen`.
+        """
+        self.turtle_list = []
+        self.items.clear()
+
+    def exitonclick(self):
+        """
+        Returns immediately, there is nobody to click.
+        """
+
+    def __getattr__(self, name):
+        """
+        Returns a function that does nothing for the screen methods that only change the look of the window (setup, bgcolor, title, tracer, listen, ...).
+
+        Raises:
+            AttributeError: If the method is not one of them.
+        """
+        if name in SCREEN_NO_OPS:
+            return lambda *args, **kwargs: None
+        raise AttributeError(f"the null screen has no {name!r} method")
+
+
+class NullTurtle:
+    """
+    A class to stand in for turtle.Turtle.
+
+    The turtle keeps its position, heading and visibility, which the game logic reads back,
+    and the ids of the canvas items it would have drawn, which `clear` removes.
+    Like a real turtle, it pushes every stamp onto its undo buffer, which `setundobuffer(None)` removes.
+    """
+
+    screen = None # the NullScreen that every turtle belongs to
+
+    def __init__(self, shape="classic", visible=True, **kwargs):
+        """
+        Initializes the NullTurtle object at the center of the screen, facing right.
+        """
+        self._x = 0.0
+        self._y = 0.0
+        self._angle = 0.0
+        self._pen_down = True
+        self._visible = visible
+        self._item = self.screen.new_item() # the item of the turtle's shape
+        self._drawings = [] # the items of the lines and text drawn by the turtle
+        self._stamps = []
+        self.undobuffer = deque(maxlen=UNDO_SIZE)
+        self.screen.turtle_list.append(self)
+
+    def goto(self, x, y=None):
+        """
+        Moves the turtle to a position, drawing a line if the pen is down.
+        """
+        if y is None:
+            x, y = x
+        if self._pen_down:
+            self._drawings.append(self.screen.new_item())
+        self._x, self._y = float(x), float(y)
+
+    setpos = setposition = goto
+
+    def setx(self, x):
+        """Moves the turtle to a new x-coordinate."""
+        self.goto(x, self._y)
+
+    def sety(self, y):
+        """Moves the turtle to a new y-coordinate."""
+        self.goto(self._x, y)
+
+    def forward(self, distance):
+        """Moves the turtle forward in the direction of its heading."""
+        self.goto(self._x + distance * math.cos(math.radians(self._angle)), self._y + distance * math.sin(math.radians(self._angle)))
+
+    fd = forward
+
+    def backward(self, distance):
+        """Moves the turtle backward, away from its heading."""
+        self.forward(-distance)
+
+    def left(self, angle):
+        """Turns the turtle left by an angle in degrees."""
+        self._angle = (self._angle + angle) % 360
+
+    def right(self, angle):
+        """Turns the turtle right by an angle in degrees."""
+        self._angle = (self._angle - angle) % 360
+
+    def setheading(self, angle):
+        """Sets the heading of the turtle in degrees."""
+        self._angle = angle % 360
+
+    seth = setheading
+
+    def heading(self):
+        """Returns the heading of the turtle in degrees."""
+        return self._angle
+
+    def position(self):
+        """Returns the (x, y) position of the turtle."""
+        return self._x, self._y
+
+    pos = position
+
+    def xcor(self):
+        """Returns the x-coordinate of the turtle."""
+        return self._x
+
+    def ycor(self):
+        """Returns the y-coordinate of the turtle."""
+        return self._y
+
+    def distance(self, x, y=None):
+        """
+        Returns the distance to a point or to another turtle.
+        """
+        if y is None:
+            x, y = x.position() if isinstance(x, NullTurtle) else x
+        return math.hypot(x - self._x, y - self._y)
+
+    def penup(self):
+        """Lifts the pen, so moves draw no lines."""
+        self._pen_down = False
+
+    pu = up = penup
+
+    def pendown(self):
+        """Puts the pen down, so moves draw lines."""
+        self._pen_down = True
+
+    pd = down = pendown
+
+    def hideturtle(self):
+        """Hides the turtle's shape."""
+        self._visible = False
+
+    ht = hideturtle
+
+    def showturtle(self):
+        """Shows the turtle's shape."""
+        self._visible = True
+
+    st = showturtle
+
+    def isvisible(self):
+        """Returns True if the turtle's shape is shown."""
+        return self._visible
+
+    def write(self, arg, move=False, align="left", font=DEFAULT_FONT):
+        """
+        Adds a text item, and moves the turtle to the end of the text if move is True.
+        """
+        self._drawings.append(self.screen.new_item())
+        if move:
+            self._x += len(str(arg)) * font[1] * CHAR_WIDTH
+
+    def clear(self):
+        """
+        Removes the lines and text drawn by the turtle.
+        """
+        for item in self._drawings:
+            self.screen.items.discard(item)
+        self._drawings.clear()
+
+    def setundobuffer(self, size):
+        """
+        Installs an empty undo buffer of a number of entries, or removes the undo buffer if size is None or not positive.
+        """
+        self.undobuffer = deque(maxlen=size) if size is not None and size > 0 else None
+
+    def stamp(self):
+        """
+        Adds a stamp of the turtle's shape and returns its id.
+        Like the real module, the stamp is pushed onto the undo buffer, which fails if there is none.
+        """
+        item = self.screen.new_item()
+        self._stamps.append(item)
+        self.undobuffer.append(("stamp", item))
+        return item
+
+    def clearstamp(self, stampid):
+        """Removes a stamp, and its entry in the undo buffer like the real module."""
+        self.screen.items.discard(stampid)
+        if stampid in self._stamps:
+            self._stamps.remove(stampid)
+        if self.undobuffer.count(("stamp", stampid)):
+            self.undobuffer.remove(("stamp", stampid))
+
+    def clearstamps(self, n=None):
+        """Removes all the stamps of the turtle."""
+        for item in list(self._stamps):
+            self.clearstamp(item)
+
+    def getscreen(self):
+        """Returns the screen of the turtle."""
+        return self.screen
+
+    def __getattr__(self, name):
+        """
+        Returns a function that does nothing for the turtle methods that only change the look of the turtle (shape, color, speed, shapesize, ...).
+
+        Raises:
+            AttributeError: If the method is not one of them.
+        """
+        if name in TURTLE_NO_OPS:
+            return lambda *args, **kwargs: None
+        raise AttributeError(f"the null turtle has no {name!r} method")
+
+
+class ScriptedInput:
+    """
+    A class to send scripted clicks and key presses to the screen.
+
+    Attributes:
+        events (dict[int, list[tuple]]): The actions to take on each frame.
+        repeating (list[tuple]): (every, action) pairs of actions taken every few frames.
+    """
+
+    def __init__(self, lines=(), random_keys=(), key_every=0, seed=None):
+        """
+        Initializes the ScriptedInput object from the lines of an input script.
+
+        Args:
+            lines (Iterable[str], optional): The lines of the input script.
+            random_keys (Sequence[str], optional): Keys to press at random.
+            key_every (int, optional): The number of frames between random key presses (0 for none).
+            seed (int, optional): The seed of the random key presses.
+        """
+        self.events = {}
+        self.repeating = []
+        for line in lines:
+            words = line.split()
+            if not words or words[0].startswith("#"):
+                continue
+            if words[0] == "every":
+                self.repeating.append((int(words[1]), tuple(words[2:])))
+            else:
+                self.events.setdefault(int(words[0]), []).append(tuple(words[1:]))
+        if random_keys and key_every:
+            self.repeating.append((key_every, ("random",)))
+        self.random_keys = list(random_keys)
+        self.random = random.Random(seed)
+
+    def pending(self, frame):
+        """
+        Checks if the script has actions after a frame.
+
+        Args:
+            frame (int): The number of the frame.
+
+        Returns:
+            bool: True if there are repeating actions or actions on a later frame.
+        """
+        return bool(self.repeating) or any(event_frame > frame for event_frame in self.events)
+
+    def feed(self, screen, frame):
+        """
+        Takes the actions of a frame.
+
+        Args:
+            screen (NullScreen): The screen to send the input to.
+            frame (int): The number of the frame.
+        """
+        actions = list(self.events.get(frame, ()))
+        actions.extend(action for every, action in self.repeating if frame % every == 0)
+        for action in actions:
+            if action[0] == "click":
+                screen.click(float(action[1]), float(action[2]))
+            elif action[0] == "key":
+                screen.press(action[1])
+            elif action[0] == "random":
+                screen.press(self.random.choice(self.random_keys))
+            elif action[0] == "stop":
+                raise Terminator
+
+
+def install():
+    """
+    Installs the null backend as the `turtle` module, so `from turtle import Screen, Turtle` imports it.
+
+    Returns:
+        NullScreen: The screen every turtle and `Screen()` call share.
+    """
+    screen = NullScreen()
+    NullTurtle.screen = screen
+    module = types.ModuleType("turtle")
+    module.Screen = lambda: screen
+    module.Turtle = NullTurtle
+    module.RawTurtle = NullTurtle
+    module.Terminator = Terminator
+    module.update = screen.update
+    module.ontimer = screen.ontimer
+    module.mainloop = screen.mainloop
+    module.done = screen.mainloop
+    module.bye = screen.bye
+    sys.modules["turtle"] = module
+    return screen
+
+
+def main(args):
+    """
+    Runs a game script with the null backend and prints how many frames it drew and how fast.
+
+    Args:
+        args (list[str]): The command line arguments.
+    """
+    options = {"--input": None, "--random-keys": "", "--key-every": "0", "--frames": None, "--seed": None}
+    while args and args[0] in options:
+        options[args[0]] = args[1]
+        args = args[2:]
+    if not args:
+        print(__doc__)
+        return
+
+    screen = install()
+    lines = []
+    if options["--input"]:
+        with open(options["--input"], mode="r") as script:
+            lines = script.readlines()
+    random_keys = [key for key in options["--random-keys"].split(",") if key]
+    seed = int(options["--seed"]) if options["--seed"] is not None else None
+    screen.input = ScriptedInput(lines, random_keys, int(options["--key-every"]), seed)
+    if options["--frames"] is not None:
+        screen.max_frames = int(options["--frames"])
+
+    # runs the script from its own directory, the way the games are started
+    path = os.path.abspath(args[0])
+    os.chdir(os.path.dirname(path))
+    sys.path.insert(0, os.path.dirname(path))
+    sys.argv = [path] + args[1:]
+    start = time.perf_counter()
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except Terminator:
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"headless: {screen.frames:,} frames, {screen.now:.1f} s of game time in {elapsed:.2f} s "
+          f"({screen.frames / max(elapsed, 1e-9):,.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])